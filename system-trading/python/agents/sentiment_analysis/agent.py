@@ -10,27 +10,190 @@ Performs sophisticated sentiment analysis using multiple techniques:
 - Advanced AI framework integration with LangGraph and A2A communication
 """
 
+import array
 import asyncio
+import hashlib
 import json
 import math
-import statistics
-from dataclasses import dataclass, asdict
+import re
+import time
+from dataclasses import dataclass
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
+from typing import AbstractSet, Dict, List, Optional, Tuple, Any
+from collections import Counter, OrderedDict, defaultdict, deque
 from enum import Enum
 
+import numpy as np
+
 from shared.base_agent import BaseAgent, AgentConfig
 
+# Fast JSON codec (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Fast non-cryptographic hashing (optional)
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# C-backed multi-pattern matcher (optional)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# JIT compilation for numeric kernels (optional)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # AI Framework Integration
 try:
     from .ai_framework import LangGraphSentimentAnalyzer
-    from shared.a2a_communication import A2ACommunicationManager
+    from shared.a2a_communication import (
+        A2ACommunicationManager, AgentProfile, AgentCapability, CollaborationPattern
+    )
     AI_FRAMEWORK_AVAILABLE = True
 except ImportError:
     AI_FRAMEWORK_AVAILABLE = False
 
 
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON payload, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode an object to JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@lru_cache(maxsize=1024)
+def _symbol_occurrence_pattern(symbol: str) -> "re.Pattern[str]":
+    """Compiled pattern finding a lowercased symbol anywhere in text"""
+    return re.compile(re.escape(symbol))
+
+
+@lru_cache(maxsize=1024)
+def _source_credibility(source: str) -> float:
+    """Credibility of a source name; sources repeat heavily, so results are cached"""
+    source_lower = source.lower()
+    
+    # Exact source names hit the dict directly
+    credibility = _SOURCE_CREDIBILITY.get(source_lower)
+    if credibility is not None:
+        return credibility
+    
+    for known_source, credibility in _SOURCE_CREDIBILITY.items():
+        if known_source in source_lower:
+            return credibility
+    
+    return 0.50  # Default
+
+
+def _score_window_loop(
+    token_rows: np.ndarray,
+    start: int,
+    end: int,
+    token_hits: np.ndarray,
+    sentiment_terms: np.ndarray,
+    sentiment_scores: np.ndarray,
+    market_terms: np.ndarray,
+    market_modifiers: np.ndarray,
+) -> Tuple[int, int, float]:
+    """Sum lexicon matches over the token window [start, end) (numba kernel)"""
+    score_sum = 0
+    match_count = 0
+    for j in range(sentiment_terms.shape[0]):
+        term = sentiment_terms[j]
+        for k in range(start, end):
+            if token_hits[token_rows[k], term]:
+                score_sum += sentiment_scores[j]
+                match_count += 1
+                break
+    
+    market_modifier = 0.0
+    for j in range(market_terms.shape[0]):
+        term = market_terms[j]
+        for k in range(start, end):
+            if token_hits[token_rows[k], term]:
+                market_modifier += market_modifiers[j]
+                break
+    
+    return score_sum, match_count, market_modifier
+
+
+def _score_window_vectorized(
+    token_rows: np.ndarray,
+    start: int,
+    end: int,
+    token_hits: np.ndarray,
+    sentiment_terms: np.ndarray,
+    sentiment_scores: np.ndarray,
+    market_terms: np.ndarray,
+    market_modifiers: np.ndarray,
+) -> Tuple[int, int, float]:
+    """Sum lexicon matches over the token window [start, end) with NumPy"""
+    hits = token_hits[token_rows[start:end]].any(axis=0)
+    sentiment_hits = hits[sentiment_terms]
+    
+    # Accumulate in lexicon order so results match the scalar scorer exactly
+    market_modifier = 0.0
+    for modifier in market_modifiers[hits[market_terms]].tolist():
+        market_modifier += modifier
+    
+    return int(sentiment_scores[sentiment_hits].sum()), int(np.count_nonzero(sentiment_hits)), market_modifier
+
+
+if NUMBA_AVAILABLE:
+    _score_window = njit(cache=True, nogil=True)(_score_window_loop)
+else:
+    _score_window = _score_window_vectorized
+
+
+def _envelope_prefix(message_type: str, agent_name: str) -> bytes:
+    """Pre-encode the constant head of a published message envelope"""
+    return (
+        b'{"type":' + _json_dumps(message_type)
+        + b',"agent_name":' + _json_dumps(agent_name)
+        + b',"timestamp":'
+    )
+
+
+def _encode_envelope(prefix: bytes, timestamp: bytes, data: Dict[str, Any]) -> bytes:
+    """Complete a pre-encoded envelope with its JSON timestamp and data payload"""
+    return b"".join((prefix, timestamp, b',"data":', _json_dumps(data), b"}"))
+
+
+# [epoch second, JSON-encoded local ISO timestamp for that second]
+_timestamp_cache: List[Any] = [None, b""]
+
+
+def _iso_now_json() -> bytes:
+    """Current local time as a JSON ISO-8601 string, formatted at most once per second"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = _json_dumps(datetime.fromtimestamp(now).isoformat())
+    return _timestamp_cache[1]
+
+
 class SentimentLabel(Enum):
     """Sentiment classification labels"""
     VERY_NEGATIVE = "very_negative"
@@ -51,7 +214,77 @@ class EmotionLabel(Enum):
     NEUTRAL = "neutral"
 
 
-@dataclass
+# Read-only templates; callers get their own dict via .copy()
+_ZERO_EMOTIONS = MappingProxyType({emotion.value: 0.0 for emotion in EmotionLabel})
+_NEUTRAL_EMOTIONS = MappingProxyType({**_ZERO_EMOTIONS, EmotionLabel.NEUTRAL.value: 1.0})
+
+# Lower bounds (inclusive) of the labels above VERY_NEGATIVE
+_SCORE_CUTOFFS = (-0.6, -0.2, 0.2, 0.6)
+
+_SCORE_LABELS = (
+    SentimentLabel.VERY_NEGATIVE,
+    SentimentLabel.NEGATIVE,
+    SentimentLabel.NEUTRAL,
+    SentimentLabel.POSITIVE,
+    SentimentLabel.VERY_POSITIVE,
+)
+
+# Lexicon scores are stored as int8 in [-127, 127] at this scale
+_LEXICON_SCALE = 100
+
+# Pattern for stock symbols (3-5 capital letters)
+_SYMBOL_PATTERN = re.compile(r'\b[A-Z]{3,5}\b')
+
+# Whitespace-delimited tokens, matching str.split()
+_TOKEN_PATTERN = re.compile(r'\S+')
+
+# Common words that match the symbol pattern
+_COMMON_WORDS = frozenset({
+    "THE", "AND", "FOR", "ARE", "BUT", "NOT", "YOU", "ALL", "CAN", "HER",
+    "WAS", "ONE", "OUR", "HAD", "HAS"
+})
+
+_MARKET_TERMS = (
+    "stock", "market", "trading", "investment", "portfolio",
+    "earnings", "revenue", "profit", "loss", "price", "shares",
+    "financial", "economic", "analyst", "rating", "target"
+)
+
+_URGENCY_TERMS = ("urgent", "breaking", "alert", "immediate", "emergency", "critical")
+
+_VOLATILITY_TERMS = ("volatile", "swing", "fluctuate", "unstable", "erratic", "unpredictable")
+
+_SOURCE_CREDIBILITY = MappingProxyType({
+    "reuters": 0.95, "bloomberg": 0.95, "wsj": 0.95,
+    "cnbc": 0.85, "marketwatch": 0.85, "yahoo": 0.75,
+    "twitter": 0.30, "reddit": 0.40, "facebook": 0.35
+})
+
+# Fixed-shape A2A consensus payloads; per-call fields are filled into a .copy()
+_CONSENSUS_TEMPLATE = MappingProxyType({
+    "sentiment_direction": None,
+    "sentiment_strength": 0.0,
+    "confidence_level": 0.0,
+    "analysis_window": "5_minutes",
+    "agent_assessment": None
+})
+
+_CONSENSUS_RESPONSE_TEMPLATE = MappingProxyType({
+    "consensus_participation": "active",
+    "emotional_profile": None,
+    "market_mood_assessment": None,
+    "confidence_in_assessment": 0.0,
+    "recommended_action": None
+})
+
+_URGENCY_SCORES = MappingProxyType({
+    "immediate": 1.0,
+    "high": 0.8,
+    "medium": 0.5,
+    "low": 0.2
+})
+
+
 class SentimentConfig(AgentConfig):
     """Configuration for Sentiment Analysis Agent"""
     
@@ -76,6 +309,14 @@ class SentimentConfig(AgentConfig):
     min_content_length: int = 10
     max_content_age_hours: int = 48
     
+    # Payloads at least this large are decoded off the event loop
+    json_offload_bytes: int = 64 * 1024
+    
+    # Inbound content is drained from a queue in batches of up to this size;
+    # subscription callbacks wait once the queue holds content_queue_size items
+    content_batch_size: int = 32
+    content_queue_size: int = 1024
+    
     # Market sentiment specific
     track_market_emotions: bool = True
     weight_source_credibility: bool = True
@@ -85,17 +326,19 @@ class SentimentConfig(AgentConfig):
     detect_sentiment_shifts: bool = True
     shift_threshold: float = 0.3
     min_samples_for_trend: int = 10
+    trend_scan_chunk_size: int = 256  # Windows scanned between event loop yields
     
     # AI Framework Configuration
     enable_langgraph: bool = True
     enable_a2a_communication: bool = True
     langgraph_reasoning_depth: int = 8
     a2a_peer_validation: bool = True
+    ai_result_cache_size: int = 256
     emotional_consensus_threshold: float = 0.75
     sentiment_cross_validation: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentAnalysis:
     """Represents sentiment analysis results"""
     content_id: str
@@ -126,14 +369,28 @@ class SentimentAnalysis:
     analysis_method: str  # "lexicon", "ml", "hybrid"
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.isoformat()
-        data['sentiment_label'] = self.sentiment_label.value
-        data['primary_emotion'] = self.primary_emotion.value
-        return data
+        # Built by hand: asdict() deep-copies every field on each publish
+        return {
+            "content_id": self.content_id,
+            "content_type": self.content_type,
+            "source": self.source,
+            "timestamp": self.timestamp.isoformat(),
+            "sentiment_score": self.sentiment_score,
+            "sentiment_label": self.sentiment_label.value,
+            "confidence": self.confidence,
+            "primary_emotion": self.primary_emotion.value,
+            "emotion_scores": dict(self.emotion_scores),
+            "market_relevance": self.market_relevance,
+            "urgency_score": self.urgency_score,
+            "volatility_indicator": self.volatility_indicator,
+            "mentioned_symbols": list(self.mentioned_symbols),
+            "symbol_sentiments": dict(self.symbol_sentiments),
+            "source_credibility": self.source_credibility,
+            "analysis_method": self.analysis_method
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class SentimentTrend:
     """Represents sentiment trend over time"""
     symbol: Optional[str]
@@ -154,10 +411,85 @@ class SentimentTrend:
     confidence: float
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['start_time'] = self.start_time.isoformat()
-        data['end_time'] = self.end_time.isoformat()
-        return data
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat(),
+            "initial_sentiment": self.initial_sentiment,
+            "final_sentiment": self.final_sentiment,
+            "sentiment_change": self.sentiment_change,
+            "trend_direction": self.trend_direction,
+            "mean_sentiment": self.mean_sentiment,
+            "sentiment_volatility": self.sentiment_volatility,
+            "sample_count": self.sample_count,
+            "confidence": self.confidence
+        }
+
+
+class SentimentWindow:
+    """Fixed-size ring buffer of sentiment samples stored as parallel arrays"""
+    
+    __slots__ = (
+        "maxlen", "timestamps", "sentiments", "confidences", "head", "size",
+        "sentiment_sum", "sentiment_sq_sum", "confidence_sum"
+    )
+    
+    def __init__(self, maxlen: int = 100):
+        self.maxlen = maxlen
+        self.timestamps = np.empty(maxlen, dtype="datetime64[us]")
+        self.sentiments = np.empty(maxlen, dtype=np.float64)
+        self.confidences = np.empty(maxlen, dtype=np.float64)
+        self.head = 0
+        self.size = 0
+        
+        # Running sums over the samples currently held
+        self.sentiment_sum = 0.0
+        self.sentiment_sq_sum = 0.0
+        self.confidence_sum = 0.0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def slot(self, index: int) -> int:
+        """Array position of the index-th oldest sample (negative indexes count from the newest)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("sentiment window index out of range")
+        return (self.head - self.size + index) % self.maxlen
+    
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        slot = self.slot(index)
+        return {
+            "timestamp": self.timestamps[slot].item(),
+            "sentiment": float(self.sentiments[slot]),
+            "confidence": float(self.confidences[slot])
+        }
+    
+    def __iter__(self):
+        for index in range(self.size):
+            yield self[index]
+    
+    def append(self, timestamp: datetime, sentiment: float, confidence: float):
+        """Add a sample, overwriting the oldest one when full"""
+        head = self.head
+        if self.size == self.maxlen:
+            evicted = float(self.sentiments[head])
+            self.sentiment_sum -= evicted
+            self.sentiment_sq_sum -= evicted * evicted
+            self.confidence_sum -= float(self.confidences[head])
+        else:
+            self.size += 1
+        
+        self.timestamps[head] = timestamp
+        self.sentiments[head] = sentiment
+        self.confidences[head] = confidence
+        self.head = (head + 1) % self.maxlen
+        
+        self.sentiment_sum += sentiment
+        self.sentiment_sq_sum += sentiment * sentiment
+        self.confidence_sum += confidence
 
 
 class SentimentAnalysisAgent(BaseAgent):
@@ -178,23 +510,43 @@ class SentimentAnalysisAgent(BaseAgent):
         # Analysis state
         self.sentiment_history: deque = deque(maxlen=config.max_history_items)
         self.processed_content: set = set()
+        self._analyses_by_id: Dict[str, SentimentAnalysis] = {}
+        
+        # Rolling aggregates over the most recent analyses
+        self._recent_analyses: deque = deque(maxlen=min(10, config.max_history_items))
+        self._recent_volatility_window = min(5, self._recent_analyses.maxlen)
+        self._recent_volatility_sum = 0.0
+        self._recent_confidence_sum = 0.0
+        self._recent_emotion_sums: Dict[str, float] = {}
+        self._recent_emotion_counts: Counter = Counter()
+        
+        # Inbound content queue, drained in micro-batches
+        self._content_inbox: asyncio.Queue = asyncio.Queue(maxsize=config.content_queue_size)
         
         # Trend analysis
-        self.sentiment_windows: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.sentiment_windows: Dict[str, SentimentWindow] = defaultdict(SentimentWindow)
         
         # Lexicon components
         self.sentiment_lexicon = self._load_sentiment_lexicon()
+        self._lex_keys, self._lex_scores = self._pack_sentiment_lexicon(self.sentiment_lexicon)
         self.emotion_lexicon = self._load_emotion_lexicon()
         self.market_lexicon = self._load_market_lexicon()
+        self._lexicon_terms, self._term_matcher = self._build_term_matcher()
+        self._window_tables = self._build_window_tables()
         
         # Statistics
         self.content_processed = 0
         self.insights_published = 0
         self.trends_detected = 0
         
+        # Pre-encoded message envelopes
+        self._insight_envelope = _envelope_prefix("sentiment_insight", config.agent_name)
+        self._trend_batch_envelope = _envelope_prefix("sentiment_trend_batch", config.agent_name)
+        
         # AI Framework Integration
         self.ai_analyzer = None
         self.a2a_manager = None
+        self._ai_result_cache: "OrderedDict[str, asyncio.Future]" = OrderedDict()
         self._initialize_ai_framework()
         
         self.logger.info("Sentiment Analysis Agent initialized", extra={
@@ -221,7 +573,8 @@ class SentimentAnalysisAgent(BaseAgent):
                     config={
                         "reasoning_depth": self.config.langgraph_reasoning_depth,
                         "emotional_consensus_threshold": self.config.emotional_consensus_threshold,
-                        "cross_validation": self.config.sentiment_cross_validation
+                        "cross_validation": self.config.sentiment_cross_validation,
+                        "max_history_items": self.config.max_history_items
                     }
                 )
                 self.logger.info("LangGraph sentiment analyzer initialized")
@@ -230,8 +583,6 @@ class SentimentAnalysisAgent(BaseAgent):
             if self.config.enable_a2a_communication:
                 self.a2a_manager = A2ACommunicationManager()
                 # Register this agent in the A2A system
-                from shared.a2a_communication import AgentProfile, AgentCapability, CollaborationPattern
-                
                 profile = AgentProfile(
                     agent_id=self.config.agent_name,
                     agent_type="sentiment_analysis",
@@ -290,6 +641,48 @@ class SentimentAnalysisAgent(BaseAgent):
         }
         return lexicon
     
+    @staticmethod
+    def _pack_sentiment_lexicon(lexicon: Dict[str, float]) -> Tuple[Tuple[str, ...], array.array]:
+        """Pack lexicon scores as int8 (scaled by 100) parallel to a key tuple"""
+        keys = tuple(lexicon)
+        scores = array.array('b', (round(lexicon[key] * _LEXICON_SCALE) for key in keys))
+        return keys, scores
+    
+    def _build_term_matcher(self) -> Tuple[Tuple[str, ...], Any]:
+        """Collect every lexicon term and build a one-pass matcher over them"""
+        terms = set(self._lex_keys)
+        terms.update(self.market_lexicon)
+        terms.update(_MARKET_TERMS)
+        terms.update(_URGENCY_TERMS)
+        terms.update(_VOLATILITY_TERMS)
+        for words in self.emotion_lexicon.values():
+            terms.update(words)
+        terms = tuple(sorted(terms))
+        
+        if not AHOCORASICK_AVAILABLE:
+            return terms, None
+        
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return terms, automaton
+    
+    def _build_window_tables(self) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Index the sentiment and market lexicons into the matcher's term table"""
+        term_index = {term: i for i, term in enumerate(self._lexicon_terms)}
+        sentiment_terms = np.array([term_index[word] for word in self._lex_keys], dtype=np.int64)
+        sentiment_scores = np.array(self._lex_scores, dtype=np.int64)
+        market_terms = np.array([term_index[term] for term in self.market_lexicon], dtype=np.int64)
+        market_modifiers = np.array(list(self.market_lexicon.values()), dtype=np.float64)
+        return term_index, sentiment_terms, sentiment_scores, market_terms, market_modifiers
+    
+    def _match_lexicon_terms(self, text: str) -> AbstractSet[str]:
+        """Return the set of lexicon terms occurring in text, in a single scan"""
+        if self._term_matcher is not None:
+            return {term for _, term in self._term_matcher.iter(text)}
+        return {term for term in self._lexicon_terms if term in text}
+    
     def _load_emotion_lexicon(self) -> Dict[str, Dict[str, float]]:
         """Load emotion lexicon for financial markets"""
         return {
@@ -356,6 +749,9 @@ class SentimentAnalysisAgent(BaseAgent):
                 self._handle_social_content
             )
             
+            # Start content batch processing task
+            asyncio.create_task(self._content_batch_loop())
+            
             # Start trend analysis task
             if self.config.detect_sentiment_shifts:
                 asyncio.create_task(self._trend_analysis_loop())
@@ -370,19 +766,69 @@ class SentimentAnalysisAgent(BaseAgent):
             self.logger.error(f"Failed to start Sentiment Analysis Agent: {e}")
             raise
     
+    async def _setup_subscriptions(self) -> None:
+        """Content subscriptions are made in start(), once the A2A system is up"""
+        pass
+    
+    async def _initialize(self) -> None:
+        """Initialize the sentiment analysis agent"""
+        self.logger.info(
+            "Sentiment Analysis Agent initialized",
+            extra={
+                "window_minutes": self.config.sentiment_window_minutes,
+                "content_batch_size": self.config.content_batch_size
+            }
+        )
+    
+    async def _cleanup(self) -> None:
+        """Cleanup agent resources"""
+        if self.a2a_manager:
+            await self.a2a_manager.stop()
+        self.sentiment_windows.clear()
+        self.logger.info("Sentiment Analysis Agent cleaned up")
+    
     async def _handle_news_content(self, subject: str, data: bytes):
-        """Handle news content for sentiment analysis"""
-        await self._handle_content(data, "news")
+        """Queue news content for sentiment analysis"""
+        await self._content_inbox.put((data, "news"))
     
     async def _handle_social_content(self, subject: str, data: bytes):
-        """Handle social media content for sentiment analysis"""
-        await self._handle_content(data, "social")
+        """Queue social media content for sentiment analysis"""
+        await self._content_inbox.put((data, "social"))
     
-    async def _handle_content(self, data: bytes, content_type: str):
-        """Handle content for sentiment analysis"""
+    async def _content_batch_loop(self):
+        """Background task draining queued content in micro-batches"""
+        while True:
+            try:
+                batch = [await self._content_inbox.get()]
+                while len(batch) < self.config.content_batch_size and not self._content_inbox.empty():
+                    batch.append(self._content_inbox.get_nowait())
+                
+                # Decode the whole batch at once, off the event loop when it is large
+                if sum(len(data) for data, _ in batch) >= self.config.json_offload_bytes:
+                    loop = asyncio.get_running_loop()
+                    messages = await loop.run_in_executor(None, self._decode_content_batch, batch)
+                else:
+                    messages = self._decode_content_batch(batch)
+                
+                for message, content_type in messages:
+                    await self._process_content(message, content_type)
+                    
+            except Exception as e:
+                self.logger.error(f"Error in content batch processing: {e}")
+    
+    def _decode_content_batch(self, batch: List[Tuple[bytes, str]]) -> List[Tuple[Dict[str, Any], str]]:
+        """Decode a batch of raw payloads, dropping the ones that fail to parse"""
+        messages = []
+        for data, content_type in batch:
+            try:
+                messages.append((_json_loads(data), content_type))
+            except Exception as e:
+                self.logger.error(f"Error decoding {content_type} content: {e}")
+        return messages
+    
+    async def _process_content(self, message: Dict[str, Any], content_type: str):
+        """Analyze a decoded content message"""
         try:
-            # Parse message
-            message = json.loads(data.decode())
             self.logger.debug(f"Received {content_type} content for sentiment analysis")
             
             # Extract text content
@@ -402,7 +848,7 @@ class SentimentAnalysisAgent(BaseAgent):
             
             if analysis:
                 # Store in history
-                self.sentiment_history.append(analysis)
+                self._record_analysis(analysis)
                 self.processed_content.add(content_id)
                 
                 # Update sentiment windows for trend analysis
@@ -444,14 +890,15 @@ class SentimentAnalysisAgent(BaseAgent):
     
     def _generate_content_id(self, message: Dict[str, Any], content_type: str) -> str:
         """Generate unique content ID"""
-        import hashlib
-        
         if content_type == "news":
             content = f"{message.get('title', '')}_{message.get('source', '')}_{message.get('published_at', '')}"
         else:
             content = f"{message.get('text', '')}_{message.get('source', '')}_{message.get('timestamp', '')}"
         
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        # 64-bit digest, 16 hex chars; only used as an in-process dedup key
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_hexdigest(content)
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
     
     async def _analyze_sentiment_enhanced(
         self, 
@@ -492,8 +939,8 @@ class SentimentAnalysisAgent(BaseAgent):
                 "content_id": content_id
             }
             
-            # Process through LangGraph reasoning pipeline
-            ai_result = await self.ai_analyzer.process_content_sentiment(text, metadata)
+            # Process through LangGraph reasoning pipeline (memoized per content)
+            ai_result = await self._cached_ai_result(text, metadata, content_id)
             
             # Convert AI framework result to SentimentAnalysis object
             if ai_result and "sentiment_analysis" in ai_result:
@@ -553,15 +1000,31 @@ class SentimentAnalysisAgent(BaseAgent):
             # Fallback to traditional analysis
             return await self._analyze_sentiment(text, message, content_type, content_id)
     
+    async def _cached_ai_result(
+        self, text: str, metadata: Dict[str, Any], content_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Run the LangGraph pipeline once per content ID, sharing in-flight results"""
+        future = self._ai_result_cache.get(content_id)
+        if future is not None:
+            self._ai_result_cache.move_to_end(content_id)
+            return await asyncio.shield(future)
+        
+        future = asyncio.ensure_future(self.ai_analyzer.process_content_sentiment(text, metadata))
+        self._ai_result_cache[content_id] = future
+        while len(self._ai_result_cache) > self.config.ai_result_cache_size:
+            self._ai_result_cache.popitem(last=False)
+        
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            # Do not cache failures so a retried message runs the pipeline again
+            if self._ai_result_cache.get(content_id) is future:
+                del self._ai_result_cache[content_id]
+            raise
+    
     def _map_urgency_to_score(self, urgency: str) -> float:
         """Map urgency level to numeric score"""
-        urgency_map = {
-            "immediate": 1.0,
-            "high": 0.8,
-            "medium": 0.5,
-            "low": 0.2
-        }
-        return urgency_map.get(urgency, 0.5)
+        return _URGENCY_SCORES.get(urgency, 0.5)
     
     async def _initiate_peer_review(self, analysis: SentimentAnalysis, ai_result: Dict[str, Any]):
         """Initiate peer review process through A2A communication"""
@@ -626,23 +1089,26 @@ class SentimentAnalysisAgent(BaseAgent):
             
             text_lower = text.lower()
             
+            # Scan the text once for every lexicon term
+            matched_terms = self._match_lexicon_terms(text_lower)
+            
             # Lexicon-based analysis
-            sentiment_score, confidence = self._lexicon_sentiment_analysis(text_lower)
+            sentiment_score, confidence = self._lexicon_sentiment_analysis(text_lower, matched_terms)
             
             # Emotion analysis
-            emotion_scores = self._analyze_emotions(text_lower)
-            primary_emotion = max(emotion_scores.items(), key=lambda x: x[1])
+            emotion_scores = self._analyze_emotions(text_lower, matched_terms)
+            primary_emotion = max(emotion_scores, key=emotion_scores.get)
             
             # Market relevance
-            market_relevance = self._calculate_market_relevance(text_lower)
+            market_relevance = self._calculate_market_relevance(text_lower, matched_terms)
             
             # Symbol extraction and sentiment
             mentioned_symbols = self._extract_symbols(text)
             symbol_sentiments = self._analyze_symbol_sentiments(text_lower, mentioned_symbols)
             
             # Calculate additional metrics
-            urgency_score = self._calculate_urgency(text_lower)
-            volatility_indicator = self._calculate_volatility_indicator(text_lower)
+            urgency_score = self._calculate_urgency(text_lower, matched_terms)
+            volatility_indicator = self._calculate_volatility_indicator(text_lower, matched_terms)
             
             # Source credibility
             source_credibility = self._get_source_credibility(message.get('source', ''))
@@ -661,7 +1127,7 @@ class SentimentAnalysisAgent(BaseAgent):
                 sentiment_score=sentiment_score,
                 sentiment_label=sentiment_label,
                 confidence=adjusted_confidence,
-                primary_emotion=EmotionLabel(primary_emotion[0]),
+                primary_emotion=EmotionLabel(primary_emotion),
                 emotion_scores=emotion_scores,
                 market_relevance=market_relevance,
                 urgency_score=urgency_score,
@@ -676,188 +1142,205 @@ class SentimentAnalysisAgent(BaseAgent):
             self.logger.error(f"Error in sentiment analysis: {e}")
             return None
     
-    def _lexicon_sentiment_analysis(self, text: str) -> Tuple[float, float]:
+    def _lexicon_sentiment_analysis(
+        self, text: str, matched_terms: Optional[AbstractSet[str]] = None
+    ) -> Tuple[float, float]:
         """Perform lexicon-based sentiment analysis"""
-        sentiment_scores = []
-        total_words = len(text.split())
+        # Membership in the pre-matched term set is equivalent to a substring test
+        haystack = text if matched_terms is None else matched_terms
+        return self._score_lexicon_matches(haystack, len(text.split()))
+    
+    def _score_lexicon_matches(self, haystack: Any, total_words: int) -> Tuple[float, float]:
+        """Score sentiment from a text or a set of matched lexicon terms"""
+        score_sum = 0
+        match_count = 0
         
-        # Score individual words
-        for word, score in self.sentiment_lexicon.items():
-            if word in text:
-                sentiment_scores.append(score)
+        # Score individual words (integer scores, rescaled once below)
+        for word, score in zip(self._lex_keys, self._lex_scores):
+            if word in haystack:
+                score_sum += score
+                match_count += 1
         
         # Apply market-specific modifiers
         market_modifier = 0.0
         for term, modifier in self.market_lexicon.items():
-            if term in text:
+            if term in haystack:
                 market_modifier += modifier
         
+        return self._finalize_lexicon_score(score_sum, match_count, market_modifier, total_words)
+    
+    def _finalize_lexicon_score(
+        self, score_sum: int, match_count: int, market_modifier: float, total_words: int
+    ) -> Tuple[float, float]:
+        """Turn summed lexicon matches into a clamped sentiment and a confidence"""
         # Calculate overall sentiment
-        if sentiment_scores:
-            base_sentiment = statistics.mean(sentiment_scores)
+        if match_count:
+            base_sentiment = score_sum / (match_count * _LEXICON_SCALE)
             final_sentiment = base_sentiment + (market_modifier * 0.1)
             
             # Clamp to [-1, 1]
             final_sentiment = max(-1.0, min(1.0, final_sentiment))
             
             # Calculate confidence based on coverage
-            coverage = len(sentiment_scores) / max(total_words, 1)
+            coverage = match_count / max(total_words, 1)
             confidence = min(0.9, 0.3 + coverage * 0.6)
             
             return final_sentiment, confidence
         
         return 0.0, 0.1  # Neutral with low confidence
     
-    def _analyze_emotions(self, text: str) -> Dict[str, float]:
+    def _analyze_emotions(
+        self, text: str, matched_terms: Optional[AbstractSet[str]] = None
+    ) -> Dict[str, float]:
         """Analyze emotional content"""
-        emotion_scores = {emotion.value: 0.0 for emotion in EmotionLabel}
+        haystack = text if matched_terms is None else matched_terms
+        emotion_scores = _ZERO_EMOTIONS.copy()
+        any_detected = False
         
         for emotion, words in self.emotion_lexicon.items():
             score = 0.0
             for word, weight in words.items():
-                if word in text:
+                if word in haystack:
                     score += weight
             
-            # Normalize score
-            emotion_scores[emotion] = min(1.0, score / 3.0)
+            if score:
+                # Normalize score
+                emotion_scores[emotion] = min(1.0, score / 3.0)
+                any_detected = True
         
-        # Set neutral if no emotions detected
-        if all(score == 0.0 for score in emotion_scores.values()):
-            emotion_scores["neutral"] = 1.0
+        # Neutral if no emotions detected
+        if not any_detected:
+            return _NEUTRAL_EMOTIONS.copy()
         
         return emotion_scores
     
-    def _calculate_market_relevance(self, text: str) -> float:
+    def _calculate_market_relevance(
+        self, text: str, matched_terms: Optional[AbstractSet[str]] = None
+    ) -> float:
         """Calculate market relevance score"""
-        market_terms = [
-            "stock", "market", "trading", "investment", "portfolio",
-            "earnings", "revenue", "profit", "loss", "price", "shares",
-            "financial", "economic", "analyst", "rating", "target"
-        ]
+        haystack = text if matched_terms is None else matched_terms
         
         relevance_score = 0.0
-        for term in market_terms:
-            if term in text:
+        for term in _MARKET_TERMS:
+            if term in haystack:
                 relevance_score += 0.1
         
         return min(1.0, relevance_score)
     
     def _extract_symbols(self, text: str) -> List[str]:
         """Extract stock symbols from text"""
-        import re
-        
-        # Pattern for stock symbols (3-5 capital letters)
-        symbol_pattern = r'\b[A-Z]{3,5}\b'
-        potential_symbols = re.findall(symbol_pattern, text)
-        
-        # Filter out common words that match the pattern
-        common_words = {"THE", "AND", "FOR", "ARE", "BUT", "NOT", "YOU", "ALL", "CAN", "HER", "WAS", "ONE", "OUR", "HAD", "HAS"}
-        symbols = [s for s in potential_symbols if s not in common_words]
-        
-        return list(set(symbols))  # Remove duplicates
+        # Filter out common words and duplicates in a single pass, keeping first-seen order
+        return list(dict.fromkeys(
+            symbol for symbol in _SYMBOL_PATTERN.findall(text) if symbol not in _COMMON_WORDS
+        ))
     
     def _analyze_symbol_sentiments(self, text: str, symbols: List[str]) -> Dict[str, float]:
         """Analyze sentiment for specific symbols"""
         symbol_sentiments = {}
+        if not symbols:
+            return symbol_sentiments
+        
+        # Tokenize once; lexicon terms never contain spaces, so the terms matched
+        # in a context window are the matches of the tokens it spans
+        words = text.split()
+        word_count = len(words)
+        word_starts = [match.start() for match in _TOKEN_PATTERN.finditer(text)]
         
+        # Context windows (5 words before and after) of each symbol mention
+        symbol_windows: Dict[str, List[Tuple[int, int]]] = {}
         for symbol in symbols:
-            # Find context around symbol mentions
-            symbol_contexts = self._extract_symbol_context(text, symbol.lower())
-            
-            if symbol_contexts:
-                context_sentiments = []
-                for context in symbol_contexts:
-                    sentiment, _ = self._lexicon_sentiment_analysis(context)
-                    context_sentiments.append(sentiment)
-                
-                # Average sentiment for this symbol
-                if context_sentiments:
-                    symbol_sentiments[symbol] = statistics.mean(context_sentiments)
+            windows = []
+            
+            # Map each symbol occurrence to the word containing it, once per word
+            last_index = -1
+            for match in _symbol_occurrence_pattern(symbol.lower()).finditer(text):
+                i = bisect_right(word_starts, match.start()) - 1
+                if i != last_index:
+                    windows.append((max(0, i - 5), min(word_count, i + 6)))
+                    last_index = i
+            
+            if windows:
+                symbol_windows[symbol] = windows
         
-        return symbol_sentiments
-    
-    def _extract_symbol_context(self, text: str, symbol: str) -> List[str]:
-        """Extract context around symbol mentions"""
-        words = text.split()
-        contexts = []
+        if not symbol_windows:
+            return symbol_sentiments
+        
+        # Match each distinct token inside a window against the lexicon once
+        term_index, sentiment_terms, sentiment_scores, market_terms, market_modifiers = self._window_tables
+        vocabulary: Dict[str, int] = {}
+        token_rows = np.zeros(word_count, dtype=np.int64)
+        for windows in symbol_windows.values():
+            for start, end in windows:
+                for k in range(start, end):
+                    token_rows[k] = vocabulary.setdefault(words[k], len(vocabulary))
         
-        for i, word in enumerate(words):
-            if symbol in word:
-                # Extract context window (5 words before and after)
-                start = max(0, i - 5)
-                end = min(len(words), i + 6)
-                context = ' '.join(words[start:end])
-                contexts.append(context)
+        token_hits = np.zeros((len(vocabulary), len(term_index)), dtype=np.bool_)
+        for token, row in vocabulary.items():
+            for term in self._match_lexicon_terms(token):
+                token_hits[row, term_index[term]] = True
         
-        return contexts
+        for symbol, windows in symbol_windows.items():
+            context_sentiments = []
+            for start, end in windows:
+                score_sum, match_count, market_modifier = _score_window(
+                    token_rows, start, end, token_hits,
+                    sentiment_terms, sentiment_scores, market_terms, market_modifiers
+                )
+                sentiment, _ = self._finalize_lexicon_score(score_sum, match_count, market_modifier, end - start)
+                context_sentiments.append(sentiment)
+            
+            # Average sentiment for this symbol
+            symbol_sentiments[symbol] = sum(context_sentiments) / len(context_sentiments)
+        
+        return symbol_sentiments
     
-    def _calculate_urgency(self, text: str) -> float:
+    def _calculate_urgency(
+        self, text: str, matched_terms: Optional[AbstractSet[str]] = None
+    ) -> float:
         """Calculate urgency score"""
-        urgency_terms = ["urgent", "breaking", "alert", "immediate", "emergency", "critical"]
+        haystack = text if matched_terms is None else matched_terms
         
         urgency_score = 0.0
-        for term in urgency_terms:
-            if term in text:
+        for term in _URGENCY_TERMS:
+            if term in haystack:
                 urgency_score += 0.2
         
         return min(1.0, urgency_score)
     
-    def _calculate_volatility_indicator(self, text: str) -> float:
+    def _calculate_volatility_indicator(
+        self, text: str, matched_terms: Optional[AbstractSet[str]] = None
+    ) -> float:
         """Calculate volatility indicator"""
-        volatility_terms = ["volatile", "swing", "fluctuate", "unstable", "erratic", "unpredictable"]
+        haystack = text if matched_terms is None else matched_terms
         
         volatility_score = 0.0
-        for term in volatility_terms:
-            if term in text:
+        for term in _VOLATILITY_TERMS:
+            if term in haystack:
                 volatility_score += 0.15
         
         return min(1.0, volatility_score)
     
     def _get_source_credibility(self, source: str) -> float:
         """Get source credibility score"""
-        credibility_map = {
-            "reuters": 0.95, "bloomberg": 0.95, "wsj": 0.95,
-            "cnbc": 0.85, "marketwatch": 0.85, "yahoo": 0.75,
-            "twitter": 0.30, "reddit": 0.40, "facebook": 0.35
-        }
-        
-        source_lower = source.lower()
-        for known_source, credibility in credibility_map.items():
-            if known_source in source_lower:
-                return credibility
-        
-        return 0.50  # Default
+        return _source_credibility(source)
     
     def _score_to_label(self, score: float) -> SentimentLabel:
         """Convert sentiment score to label"""
-        if score >= 0.6:
-            return SentimentLabel.VERY_POSITIVE
-        elif score >= 0.2:
-            return SentimentLabel.POSITIVE
-        elif score >= -0.2:
-            return SentimentLabel.NEUTRAL
-        elif score >= -0.6:
-            return SentimentLabel.NEGATIVE
-        else:
-            return SentimentLabel.VERY_NEGATIVE
+        return _SCORE_LABELS[bisect_right(_SCORE_CUTOFFS, score)]
     
     def _update_sentiment_windows(self, analysis: SentimentAnalysis):
         """Update sentiment windows for trend analysis"""
         # Overall market sentiment
-        self.sentiment_windows["market"].append({
-            "timestamp": analysis.timestamp,
-            "sentiment": analysis.sentiment_score,
-            "confidence": analysis.confidence
-        })
+        self.sentiment_windows["market"].append(
+            analysis.timestamp, analysis.sentiment_score, analysis.confidence
+        )
         
         # Symbol-specific sentiment
         for symbol in analysis.mentioned_symbols:
             if symbol in analysis.symbol_sentiments:
-                self.sentiment_windows[symbol].append({
-                    "timestamp": analysis.timestamp,
-                    "sentiment": analysis.symbol_sentiments[symbol],
-                    "confidence": analysis.confidence
-                })
+                self.sentiment_windows[symbol].append(
+                    analysis.timestamp, analysis.symbol_sentiments[symbol], analysis.confidence
+                )
     
     async def _trend_analysis_loop(self):
         """Background task for trend analysis"""
@@ -871,30 +1354,51 @@ class SentimentAnalysisAgent(BaseAgent):
     async def _analyze_sentiment_trends(self):
         """Analyze sentiment trends and detect shifts"""
         try:
-            for symbol, window in self.sentiment_windows.items():
-                if len(window) >= self.config.min_samples_for_trend:
-                    trend = self._calculate_trend(symbol, window)
-                    if trend and abs(trend.sentiment_change) >= self.config.shift_threshold:
-                        await self._publish_trend_insight(trend)
-                        self.trends_detected += 1
+            trends = []
+            windows = list(self.sentiment_windows.items())
+            chunk_size = self.config.trend_scan_chunk_size
+            
+            for offset in range(0, len(windows), chunk_size):
+                # Let queued content be processed between chunks
+                if offset:
+                    await asyncio.sleep(0)
+                
+                for symbol, window in windows[offset:offset + chunk_size]:
+                    if len(window) >= self.config.min_samples_for_trend:
+                        trend = self._calculate_trend(symbol, window)
+                        if trend and abs(trend.sentiment_change) >= self.config.shift_threshold:
+                            trends.append(trend)
+            
+            # Publish every detected shift of this tick in a single message
+            if trends:
+                await self._publish_trend_insights(trends)
+                self.trends_detected += len(trends)
         
         except Exception as e:
             self.logger.error(f"Error analyzing trends: {e}")
     
-    def _calculate_trend(self, symbol: str, window: deque) -> Optional[SentimentTrend]:
+    def _calculate_trend(self, symbol: str, window: SentimentWindow) -> Optional[SentimentTrend]:
         """Calculate sentiment trend for a window"""
         try:
             if len(window) < 2:
                 return None
             
-            # Convert to lists for analysis
-            timestamps = [item["timestamp"] for item in window]
-            sentiments = [item["sentiment"] for item in window]
-            confidences = [item["confidence"] for item in window]
+            sample_count = len(window)
+            
+            # Endpoints and statistics, read in place using the window's running sums
+            first_slot = window.slot(0)
+            last_slot = window.slot(-1)
+            start_time = window.timestamps[first_slot].item()
+            end_time = window.timestamps[last_slot].item()
+            initial_sentiment = float(window.sentiments[first_slot])
+            final_sentiment = float(window.sentiments[last_slot])
+            
+            mean_sentiment = window.sentiment_sum / sample_count
+            variance = (window.sentiment_sq_sum - sample_count * mean_sentiment * mean_sentiment) / (sample_count - 1)
+            sentiment_volatility = math.sqrt(max(0.0, variance))
+            mean_confidence = window.confidence_sum / sample_count
             
             # Calculate trend metrics
-            initial_sentiment = sentiments[0]
-            final_sentiment = sentiments[-1]
             sentiment_change = final_sentiment - initial_sentiment
             
             # Determine trend direction
@@ -905,23 +1409,18 @@ class SentimentAnalysisAgent(BaseAgent):
             else:
                 direction = "sideways"
             
-            # Calculate statistics
-            mean_sentiment = statistics.mean(sentiments)
-            sentiment_volatility = statistics.stdev(sentiments) if len(sentiments) > 1 else 0.0
-            mean_confidence = statistics.mean(confidences)
-            
             return SentimentTrend(
                 symbol=symbol if symbol != "market" else None,
                 timeframe=f"{self.config.sentiment_window_minutes}m",
-                start_time=timestamps[0],
-                end_time=timestamps[-1],
+                start_time=start_time,
+                end_time=end_time,
                 initial_sentiment=initial_sentiment,
                 final_sentiment=final_sentiment,
                 sentiment_change=sentiment_change,
                 trend_direction=direction,
                 mean_sentiment=mean_sentiment,
                 sentiment_volatility=sentiment_volatility,
-                sample_count=len(sentiments),
+                sample_count=sample_count,
                 confidence=mean_confidence
             )
             
@@ -932,16 +1431,9 @@ class SentimentAnalysisAgent(BaseAgent):
     async def _publish_sentiment_insight(self, analysis: SentimentAnalysis):
         """Publish sentiment insight to message bus"""
         try:
-            message = {
-                "type": "sentiment_insight",
-                "timestamp": datetime.now().isoformat(),
-                "agent_name": self.config.agent_name,
-                "data": analysis.to_dict()
-            }
-            
             await self.publish_to_topic(
                 self.config.sentiment_insights_topic,
-                json.dumps(message).encode()
+                _encode_envelope(self._insight_envelope, _iso_now_json(), analysis.to_dict())
             )
             
             self.logger.debug(f"Published sentiment insight: {analysis.content_id}")
@@ -949,25 +1441,21 @@ class SentimentAnalysisAgent(BaseAgent):
         except Exception as e:
             self.logger.error(f"Error publishing sentiment insight: {e}")
     
-    async def _publish_trend_insight(self, trend: SentimentTrend):
-        """Publish sentiment trend insight"""
+    async def _publish_trend_insights(self, trends: List[SentimentTrend]):
+        """Publish a batch of sentiment trend insights as one message"""
         try:
-            message = {
-                "type": "sentiment_trend",
-                "timestamp": datetime.now().isoformat(),
-                "agent_name": self.config.agent_name,
-                "data": trend.to_dict()
-            }
-            
             await self.publish_to_topic(
                 self.config.sentiment_insights_topic,
-                json.dumps(message).encode()
+                _encode_envelope(
+                    self._trend_batch_envelope,
+                    _iso_now_json(),
+                    {"trends": [trend.to_dict() for trend in trends]}
+                )
             )
             
-            self.logger.info("Published sentiment trend", extra={
-                "symbol": trend.symbol or "market",
-                "direction": trend.direction,
-                "change": trend.sentiment_change
+            self.logger.info("Published sentiment trends", extra={
+                "trend_count": len(trends),
+                "symbols": [trend.symbol or "market" for trend in trends]
             })
             
         except Exception as e:
@@ -981,11 +1469,11 @@ class SentimentAnalysisAgent(BaseAgent):
                 
                 if self.a2a_manager and len(self.sentiment_history) > 0:
                     # Get recent sentiment trends for collaboration
-                    recent_sentiments = list(self.sentiment_history)[-10:]  # Last 10 analyses
+                    recent_sentiments = self._tail(10)  # Last 10 analyses
                     
                     # Calculate aggregate sentiment metrics
-                    avg_sentiment = statistics.mean([s.sentiment_score for s in recent_sentiments])
-                    avg_confidence = statistics.mean([s.confidence for s in recent_sentiments])
+                    avg_sentiment = sum(s.sentiment_score for s in recent_sentiments) / len(recent_sentiments)
+                    avg_confidence = sum(s.confidence for s in recent_sentiments) / len(recent_sentiments)
                     
                     # Initiate consensus building for significant sentiment shifts
                     if abs(avg_sentiment) > 0.5 and avg_confidence > 0.7:
@@ -997,16 +1485,14 @@ class SentimentAnalysisAgent(BaseAgent):
     async def _initiate_sentiment_consensus(self, sentiment_score: float, confidence: float):
         """Initiate sentiment consensus building with peer agents"""
         try:
-            consensus_data = {
-                "sentiment_direction": "positive" if sentiment_score > 0 else "negative",
-                "sentiment_strength": abs(sentiment_score),
-                "confidence_level": confidence,
-                "analysis_window": "5_minutes",
-                "agent_assessment": {
-                    "dominant_emotion": self._get_recent_dominant_emotion(),
-                    "volatility_indication": self._get_recent_volatility(),
-                    "market_mood": sentiment_score
-                }
+            consensus_data = _CONSENSUS_TEMPLATE.copy()
+            consensus_data["sentiment_direction"] = "positive" if sentiment_score > 0 else "negative"
+            consensus_data["sentiment_strength"] = abs(sentiment_score)
+            consensus_data["confidence_level"] = confidence
+            consensus_data["agent_assessment"] = {
+                "dominant_emotion": self._get_recent_dominant_emotion(),
+                "volatility_indication": self._get_recent_volatility(),
+                "market_mood": sentiment_score
             }
             
             participants = ["news_analysis_agent", "technical_analysis_agent"]
@@ -1033,25 +1519,61 @@ class SentimentAnalysisAgent(BaseAgent):
         except Exception as e:
             self.logger.error(f"Error in sentiment consensus initiation: {e}")
     
+    def _tail(self, count: int) -> List[SentimentAnalysis]:
+        """Return the last count analyses in chronological order, without copying the history"""
+        tail = list(islice(reversed(self.sentiment_history), count))
+        tail.reverse()
+        return tail
+    
+    def _record_analysis(self, analysis: SentimentAnalysis):
+        """Append an analysis to history and roll the recent-window aggregates"""
+        history = self.sentiment_history
+        
+        # Keep the content ID index in step with what the bounded history evicts
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            if self._analyses_by_id.get(evicted.content_id) is evicted:
+                del self._analyses_by_id[evicted.content_id]
+        history.append(analysis)
+        self._analyses_by_id.setdefault(analysis.content_id, analysis)
+        
+        recent = self._recent_analyses
+        
+        # Retire the analyses leaving the volatility and recent windows
+        if len(recent) >= self._recent_volatility_window:
+            self._recent_volatility_sum -= recent[-self._recent_volatility_window].volatility_indicator
+        if len(recent) == recent.maxlen:
+            evicted = recent[0]
+            self._recent_confidence_sum -= evicted.confidence
+            for emotion, score in evicted.emotion_scores.items():
+                self._recent_emotion_counts[emotion] -= 1
+                if self._recent_emotion_counts[emotion]:
+                    self._recent_emotion_sums[emotion] -= score
+                else:
+                    del self._recent_emotion_counts[emotion]
+                    del self._recent_emotion_sums[emotion]
+        
+        recent.append(analysis)
+        self._recent_volatility_sum += analysis.volatility_indicator
+        self._recent_confidence_sum += analysis.confidence
+        for emotion, score in analysis.emotion_scores.items():
+            self._recent_emotion_counts[emotion] += 1
+            self._recent_emotion_sums[emotion] = self._recent_emotion_sums.get(emotion, 0) + score
+    
     def _get_recent_dominant_emotion(self) -> str:
         """Get dominant emotion from recent analyses"""
         if not self.sentiment_history:
             return "neutral"
         
-        recent_emotions = [s.primary_emotion.value for s in list(self.sentiment_history)[-5:]]
-        emotion_counts = {}
-        for emotion in recent_emotions:
-            emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
-        
-        return max(emotion_counts.items(), key=lambda x: x[1])[0] if emotion_counts else "neutral"
+        top = Counter(s.primary_emotion.value for s in self._tail(5)).most_common(1)
+        return top[0][0] if top else "neutral"
     
     def _get_recent_volatility(self) -> float:
         """Get recent volatility indicator"""
         if not self.sentiment_history:
             return 0.5
         
-        recent_volatilities = [s.volatility_indicator for s in list(self.sentiment_history)[-5:]]
-        return statistics.mean(recent_volatilities) if recent_volatilities else 0.5
+        return self._recent_volatility_sum / min(len(self._recent_analyses), self._recent_volatility_window)
     
     async def _handle_a2a_message(self, message) -> Optional[Dict[str, Any]]:
         """Handle incoming A2A messages"""
@@ -1059,7 +1581,7 @@ class SentimentAnalysisAgent(BaseAgent):
             if hasattr(self.ai_analyzer, 'handle_agent_message'):
                 response = await self.ai_analyzer.handle_agent_message(message)
                 if response:
-                    return response.__dict__
+                    return response.to_dict()
             
             # Handle direct sentiment-related messages
             if message.content.get("type") == "sentiment_validation_request":
@@ -1079,11 +1601,7 @@ class SentimentAnalysisAgent(BaseAgent):
             content_id = request_data.get("content_id", "unknown")
             
             # Find our analysis for this content
-            our_analysis = None
-            for analysis in self.sentiment_history:
-                if analysis.content_id == content_id:
-                    our_analysis = analysis
-                    break
+            our_analysis = self._analyses_by_id.get(content_id)
             
             if our_analysis:
                 # Compare with requesting agent's analysis
@@ -1120,13 +1638,11 @@ class SentimentAnalysisAgent(BaseAgent):
             recent_emotions = self._get_recent_emotional_profile()
             market_mood = self._calculate_current_market_mood()
             
-            response = {
-                "consensus_participation": "active",
-                "emotional_profile": recent_emotions,
-                "market_mood_assessment": market_mood,
-                "confidence_in_assessment": self._calculate_emotional_confidence(),
-                "recommended_action": self._generate_emotional_recommendation(recent_emotions, market_mood)
-            }
+            response = _CONSENSUS_RESPONSE_TEMPLATE.copy()
+            response["emotional_profile"] = recent_emotions
+            response["market_mood_assessment"] = market_mood
+            response["confidence_in_assessment"] = self._calculate_emotional_confidence()
+            response["recommended_action"] = self._generate_emotional_recommendation(recent_emotions, market_mood)
             
             return response
             
@@ -1139,12 +1655,7 @@ class SentimentAnalysisAgent(BaseAgent):
         if not self.sentiment_history:
             return {"neutral": 1.0}
         
-        recent_analyses = list(self.sentiment_history)[-10:]
-        emotion_aggregation = {}
-        
-        for analysis in recent_analyses:
-            for emotion, score in analysis.emotion_scores.items():
-                emotion_aggregation[emotion] = emotion_aggregation.get(emotion, 0) + score
+        emotion_aggregation = dict(self._recent_emotion_sums)
         
         # Normalize scores
         total_score = sum(emotion_aggregation.values())
@@ -1158,9 +1669,11 @@ class SentimentAnalysisAgent(BaseAgent):
         if not self.sentiment_history:
             return {"mood": "neutral", "strength": 0.5, "trend": "stable"}
         
-        recent_sentiments = [s.sentiment_score for s in list(self.sentiment_history)[-10:]]
+        recent_sentiments = np.fromiter(
+            (s.sentiment_score for s in self._tail(10)), dtype=np.float64
+        )
         
-        avg_sentiment = statistics.mean(recent_sentiments)
+        avg_sentiment = float(recent_sentiments.mean())
         sentiment_trend = "rising" if len(recent_sentiments) > 1 and recent_sentiments[-1] > recent_sentiments[-2] else "falling"
         
         mood = "positive" if avg_sentiment > 0.2 else "negative" if avg_sentiment < -0.2 else "neutral"
@@ -1170,7 +1683,7 @@ class SentimentAnalysisAgent(BaseAgent):
             "mood": mood,
             "strength": strength,
             "trend": sentiment_trend,
-            "volatility": statistics.stdev(recent_sentiments) if len(recent_sentiments) > 1 else 0.0
+            "volatility": float(recent_sentiments.std(ddof=1)) if len(recent_sentiments) > 1 else 0.0
         }
     
     def _calculate_emotional_confidence(self) -> float:
@@ -1178,12 +1691,11 @@ class SentimentAnalysisAgent(BaseAgent):
         if not self.sentiment_history:
             return 0.5
         
-        recent_confidences = [s.confidence for s in list(self.sentiment_history)[-10:]]
-        return statistics.mean(recent_confidences)
+        return self._recent_confidence_sum / len(self._recent_analyses)
     
     def _generate_emotional_recommendation(self, emotions: Dict[str, float], mood: Dict[str, Any]) -> str:
         """Generate recommendation based on emotional state"""
-        dominant_emotion = max(emotions.items(), key=lambda x: x[1])[0] if emotions else "neutral"
+        dominant_emotion = max(emotions, key=emotions.get) if emotions else "neutral"
         
         if dominant_emotion == "fear" and mood["mood"] == "negative":
             return "monitor_for_panic_selling"
@@ -10,31 +10,179 @@ Leverages advanced AI agent concepts including:
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
-from typing import Dict, List, Optional, Any, TypedDict, Annotated
+import math
+import time
+from typing import Dict, List, Optional, Any, Tuple, TypedDict
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
 from dataclasses import dataclass
-import operator
-import statistics
+import re
 
-# Advanced AI frameworks
+import numpy as np
+
+# Lightweight message types; LangGraph itself is imported lazily by the analyzer
+class BaseMessage:
+    def __init__(self, content: str): self.content = content
+class HumanMessage(BaseMessage): pass
+class AIMessage(BaseMessage): pass
+class SystemMessage(BaseMessage): pass
+
+# Optional single-pass keyword matcher
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# JIT compilation for numeric kernels (optional)
 try:
-    from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
-    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-    from langchain_core.output_parsers import JsonOutputParser
-    from langgraph.graph import StateGraph, END
-    from langgraph.prebuilt import ToolExecutor, ToolInvocation
-    from langgraph.checkpoint.sqlite import SqliteSaver
-    LANGRAPH_AVAILABLE = True
+    from numba import njit
+    NUMBA_AVAILABLE = True
 except ImportError:
-    LANGRAPH_AVAILABLE = False
-    # Fallback implementations
-    class BaseMessage:
-        def __init__(self, content: str): self.content = content
-    class HumanMessage(BaseMessage): pass
-    class AIMessage(BaseMessage): pass
-    class SystemMessage(BaseMessage): pass
+    NUMBA_AVAILABLE = False
+
+
+# Sector vocabularies, scanned as part of the keyword pass below
+_SECTOR_KEYWORDS = {"tech": ("technology", "software", "ai"), "finance": ("bank", "financial", "lending")}
+
+# Keyword lists scanned by the lexical, emotional, context and volatility steps
+_KEYWORDS = {
+    "sentiment": ("good", "bad", "excellent", "terrible", "bullish", "bearish"),
+    "intensity": ("very", "extremely", "highly", "significantly", "moderately", "slightly"),
+    "negation": ("not", "no", "never", "none", "neither"),
+    "comparative": ("better", "worse", "higher", "lower", "more", "less"),
+    "temporal": ("now", "today", "tomorrow", "soon", "later", "recently"),
+    "uncertainty": ("might", "could", "possibly", "perhaps", "maybe", "uncertain"),
+    "fear": ("afraid", "scared", "worried", "panic", "crisis"),
+    "greed": ("greedy", "aggressive", "opportunity", "profit", "gain"),
+    "confidence": ("confident", "optimistic", "bullish", "strong", "solid"),
+    "anxiety": ("anxious", "nervous", "uncertain", "volatile", "unstable"),
+    "euphoria": ("euphoric", "ecstatic", "thrilled", "excited", "boom"),
+    "emotional_intensity": ("very", "extremely", "highly", "significantly"),
+    "stability": ("stable", "steady", "consistent", "reliable", "predictable"),
+    "instability": ("volatile", "erratic", "unpredictable", "chaotic", "turbulent"),
+    "region": ("global", "us", "europe", "asia", "china", "japan"),
+    "regulatory": ("regulation", "policy", "fed", "sec", "compliance"),
+    "competitive": ("competitor", "market share", "rivalry", "competition"),
+    "temporal_urgency": ("now", "immediate", "urgent", "breaking"),
+    "volatility_trigger": ("breaking", "sudden", "unexpected", "shock", "surprise", "crisis"),
+    **{f"sector_{sector}": keywords for sector, keywords in _SECTOR_KEYWORDS.items()},
+}
+_KEYWORD_SETS = {category: frozenset(words) for category, words in _KEYWORDS.items()}
+
+_CREDIBILITY_MAP = {"reuters": 0.95, "bloomberg": 0.95, "twitter": 0.3}
+
+
+def _build_keyword_matcher() -> Any:
+    """Compile every keyword into one matcher (Aho-Corasick automaton or regex alternation)"""
+    keywords = sorted({word for words in _KEYWORDS.values() for word in words}, key=len, reverse=True)
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for word in keywords:
+            # Payload carries the length so a hit's start offset needs no len() call
+            automaton.add_word(word, (len(word) - 1, word))
+        automaton.make_automaton()
+        return automaton
+    return re.compile(r"\b(?:" + "|".join(re.escape(word) for word in keywords) + r")\b")
+
+
+_KEYWORD_MATCHER = _build_keyword_matcher()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _count_keywords(text: str) -> Dict[str, int]:
+    """Count whole-word keyword occurrences in a single scan of text"""
+    counts: Dict[str, int] = {}
+    if AHOCORASICK_AVAILABLE:
+        last = len(text) - 1
+        for end, (span, word) in _KEYWORD_MATCHER.iter(text):
+            start = end - span
+            # Reject hits inside longer words, e.g. "not" in "notable"
+            if (start > 0 and _is_word_char(text[start - 1])) or (end < last and _is_word_char(text[end + 1])):
+                continue
+            counts[word] = counts.get(word, 0) + 1
+    else:
+        for match in _KEYWORD_MATCHER.finditer(text):
+            word = match.group()
+            counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+def _clip01(value: float) -> float:
+    """Clamp a score to [0, 1]"""
+    return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+
+
+# Sub-scores combined into the composite sentiment, in weight order
+_SCORE_KEYS = (
+    "lexical_sentiment",
+    "emotional_sentiment",
+    "contextual_sentiment",
+    "temporal_sentiment",
+    "intensity_adjusted_sentiment",
+    "confidence_weighted_sentiment",
+)
+_SCORE_WEIGHTS = np.array([0.3, 0.25, 0.2, 0.1, 0.1, 0.05], dtype=np.float64)
+_SCORE_WEIGHTS.setflags(write=False)
+# Every numeric entry of a sentiment_scores dict: the sub-scores plus the composite
+_VARIANCE_KEYS = _SCORE_KEYS + ("composite_sentiment",)
+_EMOTIONS = ("fear", "greed", "confidence", "anxiety", "euphoria")
+
+# Emotional profile entry per emotion, and the keyword categories counted for a batch (emotions first)
+_EMOTION_PROFILE_KEYS = ("fear_indicators", "greed_indicators", "confidence_markers", "anxiety_signals", "euphoria_patterns")
+_BATCH_CATEGORIES = _EMOTIONS + ("emotional_intensity", "stability", "instability")
+
+# Flat per-emotion score vector read by the scoring helpers, indexed in _EMOTIONS order
+_FEAR, _GREED, _CONFIDENCE, _ANXIETY, _EUPHORIA = range(len(_EMOTIONS))
+_EMOTION_SCORE_FIELDS = tuple((key, f"{emotion}_score") for emotion, key in zip(_EMOTIONS, _EMOTION_PROFILE_KEYS))
+
+
+def _emotion_scores(emotional_profile: Dict[str, Any]) -> List[float]:
+    """Read every emotion's score out of the nested profile once (0 when absent)"""
+    return [emotional_profile.get(entry, {}).get(field, 0) for entry, field in _EMOTION_SCORE_FIELDS]
+
+
+def _composite_kernel_loop(scores: np.ndarray, weights: np.ndarray) -> float:
+    """Weighted sum of sub-scores clamped to [-1, 1] (scalar loop, JIT-compiled when numba is present)"""
+    total = 0.0
+    for i in range(scores.shape[0]):
+        total += scores[i] * weights[i]
+    if total < -1.0:
+        return -1.0
+    if total > 1.0:
+        return 1.0
+    return total
+
+
+def _composite_kernel_vectorized(scores: np.ndarray, weights: np.ndarray) -> float:
+    """Weighted sum of sub-scores clamped to [-1, 1] with NumPy"""
+    return max(-1.0, min(1.0, float(np.dot(scores, weights))))
+
+
+def _sample_stdev(values: List[float]) -> float:
+    """Sample standard deviation of a short score list, 0.0 below two values, in pure Python"""
+    # For 5-7 scores two fsum passes beat building an array for ndarray.std or an
+    # njit kernel several times over, so numba is not used here even when installed
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean = math.fsum(values) / n
+    return math.sqrt(math.fsum([(value - mean) * (value - mean) for value in values]) / (n - 1))
+
+
+if NUMBA_AVAILABLE:
+    _composite_kernel = njit(cache=True, nogil=True)(_composite_kernel_loop)
+else:
+    _composite_kernel = _composite_kernel_vectorized
 
 
 class SentimentReasoningStep(Enum):
@@ -59,7 +207,37 @@ class SentimentA2AProtocol(Enum):
     CROSS_REFERENCE_REQUEST = "cross_reference_request"
 
 
-@dataclass
+# Trace slot per reasoning step and message slot per A2A message, in pipeline order
+_TRACE_SLOTS = len(SentimentReasoningStep)
+(
+    _PREPROCESS_SLOT,
+    _LEXICAL_SLOT,
+    _EMOTIONAL_SLOT,
+    _CONTEXT_SLOT,
+    _SCORING_SLOT,
+    _VOLATILITY_SLOT,
+    _CROSS_VALIDATION_SLOT,
+    _SYNTHESIS_SLOT,
+) = range(_TRACE_SLOTS)
+
+# Field names of each step's trace payload tuple, indexed by trace slot
+_TRACE_STEPS = tuple(step.value for step in SentimentReasoningStep)
+_TRACE_SCHEMA = (
+    ("input_length", "processed_length", "features_extracted"),
+    ("sentiment_words_count", "negation_patterns", "uncertainty_level"),
+    ("emotional_dimensions", "dominant_emotion", "emotional_intensity"),
+    ("context_dimensions", "market_timing_score"),
+    ("sentiment_dimensions", "composite_score", "dominant_factor"),
+    ("volatility_score", "stress_level", "alert_triggered"),
+    ("consensus_score", "peer_agents_consulted", "validation_confidence"),
+    ("final_confidence", "overall_sentiment", "dominant_emotion", "market_impact"),
+)
+
+_MESSAGE_SLOTS = 4
+_EMOTIONAL_MESSAGE_SLOT, _MOOD_MESSAGE_SLOT, _VOLATILITY_MESSAGE_SLOT, _CROSS_VALIDATION_MESSAGE_SLOT = range(_MESSAGE_SLOTS)
+
+
+@dataclass(slots=True)
 class SentimentAgentMessage:
     """Standardized A2A message format for sentiment analysis"""
     sender_id: str
@@ -71,6 +249,59 @@ class SentimentAgentMessage:
     priority: int = 1  # 1=high, 2=medium, 3=low
     requires_response: bool = False
     correlation_id: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        # Shallow field map, as __dict__ gave before slots
+        return {
+            "sender_id": self.sender_id,
+            "receiver_id": self.receiver_id,
+            "protocol": self.protocol,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "message_id": self.message_id,
+            "priority": self.priority,
+            "requires_response": self.requires_response,
+            "correlation_id": self.correlation_id
+        }
+
+
+# Fixed routing of the pipeline's outgoing messages: (receiver, requires_response, priority, message id prefix)
+_MESSAGE_ROUTES = {
+    SentimentA2AProtocol.EMOTIONAL_CONSENSUS: ("news_analysis_agent", False, 1, "emotional_sharing"),
+    SentimentA2AProtocol.MARKET_MOOD_SHARING: ("technical_analysis_agent", True, 1, "mood_sync"),
+    SentimentA2AProtocol.VOLATILITY_ALERT: ("risk_management_agent", False, 1, "volatility_alert"),
+    SentimentA2AProtocol.CROSS_REFERENCE_REQUEST: ("news_analysis_agent", True, 1, "cross_validation"),
+}
+
+# Constant A2A reply payloads; handlers send a shallow .copy()
+_VALIDATION_RESPONSE_CONTENT = MappingProxyType({
+    "validation_result": "confirmed",
+    "confidence_adjustment": 0.1,
+    "sentiment_agreement": 0.85,
+    "additional_insights": ("Cross-agent sentiment validation confirms analysis direction",)
+})
+
+_CONSENSUS_RESPONSE_CONTENT = MappingProxyType({
+    "consensus_result": "agreement",
+    "emotional_alignment": 0.8,
+    "shared_emotional_factors": ("confidence", "market_optimism"),
+    "divergent_factors": ()
+})
+
+# Degraded result returned when LangGraph is missing; only the trace timestamp varies per call.
+# Nested values are shared between calls and, like cached results, treated as read-only.
+_FALLBACK_RESULT = MappingProxyType({
+    "sentiment_analysis": {
+        "overall_sentiment": 0.0,
+        "confidence_level": 0.6,
+        "emotional_summary": {"dominant_emotion": "neutral"},
+        "recommended_actions": ("Review with advanced sentiment tools",)
+    },
+    "confidence": 0.6,
+    "agent_communications": (),
+    "processing_errors": ("LangGraph not available - using fallback",),
+    "metadata": {"processing_time": 1, "emotional_complexity": 1}
+})
 
 
 class SentimentAnalysisState(TypedDict):
@@ -85,11 +316,14 @@ class SentimentAnalysisState(TypedDict):
     volatility_indicators: Dict[str, Any]
     cross_references: List[Dict[str, Any]]
     final_sentiment: Dict[str, Any]
-    reasoning_trace: List[Dict[str, Any]]
-    agent_communications: Annotated[List[SentimentAgentMessage], operator.add]
+    trace_payloads: List[Optional[Tuple[Any, ...]]]
+    agent_communications: List[Optional[SentimentAgentMessage]]
     confidence_score: float
     uncertainty_factors: List[str]
     processing_errors: List[str]
+    dominant_emotion: str
+    invocation_ts: Optional[datetime]
+    invocation_ts_iso: str
 
 
 class LangGraphSentimentAnalyzer:
@@ -105,6 +339,9 @@ class LangGraphSentimentAnalyzer:
     - Sentiment synthesis and confidence scoring
     """
     
+    # LangGraph symbols once imported; () when the import failed
+    _langgraph: Optional[Tuple[Any, ...]] = None
+    
     def __init__(self, agent_id: str, config: Dict[str, Any]):
         self.agent_id = agent_id
         self.config = config
@@ -114,19 +351,53 @@ class LangGraphSentimentAnalyzer:
         
         # A2A communication setup
         self.peer_agents = {}
-        self.communication_history = []
+        self.communication_history: deque = deque(maxlen=config.get("max_history_items", 2000))
+        self._msg_counter = itertools.count()
+        self._message_handlers = {
+            SentimentA2AProtocol.SENTIMENT_VALIDATION: self._handle_sentiment_validation_request,
+            SentimentA2AProtocol.EMOTIONAL_CONSENSUS: self._handle_emotional_consensus_request,
+            SentimentA2AProtocol.MARKET_MOOD_SHARING: self._handle_market_mood_sharing,
+            SentimentA2AProtocol.VOLATILITY_ALERT: self._handle_volatility_alert
+        }
+        
+        # Whole-analysis results keyed by content digest, in LRU order, with their monotonic expiry
+        self._result_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._result_cache_size = config.get("cache_size", 4096)
+        self._result_cache_ttl = config.get("cache_ttl_seconds", 300.0)
         
         # Sentiment model state
         self.emotional_state_memory = {}
         self.market_mood_context = {}
         
+    @classmethod
+    def _import_langgraph(cls) -> Optional[Tuple[Any, ...]]:
+        """Import the LangGraph pieces on first use, cached on the class; None when unavailable"""
+        if cls._langgraph is None:
+            try:
+                from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
+                from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+                from langchain_core.output_parsers import JsonOutputParser
+                from langgraph.graph import StateGraph, END
+                from langgraph.prebuilt import ToolExecutor, ToolInvocation
+                from langgraph.checkpoint.memory import MemorySaver
+                from langgraph.checkpoint.sqlite import SqliteSaver
+                cls._langgraph = (StateGraph, END, MemorySaver, SqliteSaver)
+            except ImportError:
+                cls._langgraph = ()
+        return cls._langgraph or None
+    
     def setup_reasoning_graph(self):
         """Setup the LangGraph sentiment reasoning workflow"""
-        if not LANGRAPH_AVAILABLE:
+        langgraph = self._import_langgraph()
+        if langgraph is None:
             return
-            
-        # Initialize checkpointer for workflow persistence
-        self.checkpointer = SqliteSaver.from_conn_string(":memory:")
+        StateGraph, END, MemorySaver, SqliteSaver = langgraph
+        
+        # Initialize checkpointer; in-process dict storage unless persistence is requested
+        if self.config.get("persistent_checkpoints"):
+            self.checkpointer = SqliteSaver.from_conn_string(":memory:")
+        else:
+            self.checkpointer = MemorySaver()
         
         # Create the reasoning workflow
         workflow = StateGraph(SentimentAnalysisState)
@@ -141,39 +412,58 @@ class LangGraphSentimentAnalyzer:
         workflow.add_node("cross_validate", self._cross_validate_node)
         workflow.add_node("sentiment_synthesis", self._sentiment_synthesis_node)
         
-        # Define workflow edges (reasoning flow)
-        workflow.set_entry_point("preprocess_content")
-        workflow.add_edge("preprocess_content", "lexical_analysis")
-        workflow.add_edge("lexical_analysis", "emotional_profiling")
-        workflow.add_edge("emotional_profiling", "context_awareness")
-        workflow.add_edge("context_awareness", "sentiment_scoring")
-        workflow.add_edge("sentiment_scoring", "volatility_assessment")
-        workflow.add_edge("volatility_assessment", "cross_validate")
-        workflow.add_edge("cross_validate", "sentiment_synthesis")
-        workflow.add_edge("sentiment_synthesis", END)
+        # Define workflow edges (reasoning flow), ending early once a step records an error
+        steps = [
+            "preprocess_content",
+            "lexical_analysis",
+            "emotional_profiling",
+            "context_awareness",
+            "sentiment_scoring",
+            "volatility_assessment",
+            "cross_validate",
+            "sentiment_synthesis",
+        ]
+        workflow.set_entry_point(steps[0])
+        for step, next_step in zip(steps, steps[1:]):
+            workflow.add_conditional_edges(step, self._continue_unless_failed(next_step, END), {END: END, next_step: next_step})
+        workflow.add_edge(steps[-1], END)
         
         # Compile the graph
         self.graph = workflow.compile(checkpointer=self.checkpointer)
     
-    async def _preprocess_content_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    @staticmethod
+    def _continue_unless_failed(next_step: str, end: str):
+        """Edge router: go on to next_step, or stop at end if any step has failed"""
+        def route(state: SentimentAnalysisState) -> str:
+            return end if state["processing_errors"] else next_step
+        return route
+    
+    def _preprocess_content_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Preprocess and normalize content for sentiment analysis"""
+        # One timestamp for the whole invocation
+        state["invocation_ts"] = datetime.now()
+        state["invocation_ts_iso"] = state["invocation_ts"].isoformat()
+        
+        # Fixed-size trace and message slots, filled in place by each step
+        state["trace_payloads"] = [None] * _TRACE_SLOTS
+        state["agent_communications"] = [None] * _MESSAGE_SLOTS
+        
         try:
             content = state["raw_content"]
             metadata = state["content_metadata"]
+            metadata["_source_lc"] = metadata.get("source", "unknown").lower()
             
             # Advanced text preprocessing
-            preprocessed = await self._advanced_text_preprocessing(content, metadata)
+            preprocessed = self._advanced_text_preprocessing(content, metadata)
             
             state["preprocessed_text"] = preprocessed["text"]
             state["lexical_features"] = preprocessed["features"]
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.CONTENT_PREPROCESSING.value,
-                "timestamp": datetime.now().isoformat(),
-                "input_length": len(content),
-                "processed_length": len(preprocessed["text"]),
-                "features_extracted": len(preprocessed["features"])
-            })
+            state["trace_payloads"][_PREPROCESS_SLOT] = (
+                len(content),
+                len(preprocessed["text"]),
+                len(preprocessed["features"])
+            )
             
             return state
             
@@ -181,32 +471,23 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Content preprocessing error: {str(e)}")
             return state
     
-    async def _lexical_analysis_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    def _lexical_analysis_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Perform comprehensive lexical analysis"""
         try:
             text = state["preprocessed_text"]
             features = state["lexical_features"]
             
             # Multi-dimensional lexical analysis
-            lexical_analysis = {
-                "sentiment_words": self._extract_sentiment_words(text),
-                "intensity_markers": self._extract_intensity_markers(text),
-                "negation_patterns": self._detect_negation_patterns(text),
-                "comparative_expressions": self._extract_comparative_expressions(text),
-                "temporal_indicators": self._extract_temporal_indicators(text),
-                "uncertainty_phrases": self._extract_uncertainty_phrases(text)
-            }
+            lexical_analysis = self._lexical_analysis(text, features.get("keyword_counts"))
             
             # Update state with lexical analysis
             state["lexical_features"].update(lexical_analysis)
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.LEXICAL_ANALYSIS.value,
-                "timestamp": datetime.now().isoformat(),
-                "sentiment_words_count": len(lexical_analysis["sentiment_words"]),
-                "negation_patterns": len(lexical_analysis["negation_patterns"]),
-                "uncertainty_level": len(lexical_analysis["uncertainty_phrases"])
-            })
+            state["trace_payloads"][_LEXICAL_SLOT] = (
+                len(lexical_analysis["sentiment_words"]),
+                len(lexical_analysis["negation_patterns"]),
+                len(lexical_analysis["uncertainty_phrases"])
+            )
             
             return state
             
@@ -214,48 +495,35 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Lexical analysis error: {str(e)}")
             return state
     
-    async def _emotional_profiling_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    def _emotional_profiling_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Create comprehensive emotional profile"""
         try:
             text = state["preprocessed_text"]
             lexical_features = state["lexical_features"]
             
             # Advanced emotional profiling
-            emotional_profile = {
-                "fear_indicators": self._analyze_fear_emotions(text, lexical_features),
-                "greed_indicators": self._analyze_greed_emotions(text, lexical_features),
-                "confidence_markers": self._analyze_confidence_emotions(text, lexical_features),
-                "anxiety_signals": self._analyze_anxiety_emotions(text, lexical_features),
-                "euphoria_patterns": self._analyze_euphoria_emotions(text, lexical_features),
-                "emotional_intensity": self._calculate_emotional_intensity(text),
-                "emotional_stability": self._assess_emotional_stability(text)
-            }
+            emotional_profile = self._emotional_profile(text, lexical_features)
             
             # A2A communication: Share emotional profile with news agent
-            emotional_sharing = SentimentAgentMessage(
-                sender_id=self.agent_id,
-                receiver_id="news_analysis_agent",
-                protocol=SentimentA2AProtocol.EMOTIONAL_CONSENSUS,
-                content={
+            emotional_sharing = self._emit(
+                SentimentA2AProtocol.EMOTIONAL_CONSENSUS,
+                {
                     "emotional_profile": emotional_profile,
                     "content_source": state["content_metadata"].get("source", "unknown"),
-                    "analysis_timestamp": datetime.now().isoformat()
+                    "analysis_timestamp": state["invocation_ts_iso"]
                 },
-                timestamp=datetime.now(),
-                message_id=f"emotional_sharing_{datetime.now().timestamp()}",
-                requires_response=False
+                state["invocation_ts"]
             )
             
-            state["agent_communications"].append(emotional_sharing)
+            state["agent_communications"][_EMOTIONAL_MESSAGE_SLOT] = emotional_sharing
             state["emotional_profile"] = emotional_profile
+            state["dominant_emotion"] = self._dominant_emotion(emotional_profile)
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.EMOTIONAL_PROFILING.value,
-                "timestamp": datetime.now().isoformat(),
-                "emotional_dimensions": len(emotional_profile),
-                "dominant_emotion": max(emotional_profile.items(), key=lambda x: sum(x[1].values()) if isinstance(x[1], dict) else x[1])[0],
-                "emotional_intensity": emotional_profile["emotional_intensity"]
-            })
+            state["trace_payloads"][_EMOTIONAL_SLOT] = (
+                len(emotional_profile),
+                state["dominant_emotion"],
+                emotional_profile["emotional_intensity"]
+            )
             
             return state
             
@@ -263,46 +531,35 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Emotional profiling error: {str(e)}")
             return state
     
-    async def _context_awareness_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    def _context_awareness_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Analyze market and temporal context"""
         try:
             metadata = state["content_metadata"]
             text = state["preprocessed_text"]
             
             # Context analysis
-            contextual_factors = {
-                "market_timing": self._analyze_market_timing_context(metadata),
-                "source_influence": self._analyze_source_influence(metadata),
-                "sector_context": self._analyze_sector_context(text),
-                "geographic_scope": self._analyze_geographic_context(text),
-                "regulatory_environment": self._analyze_regulatory_context(text),
-                "competitive_landscape": self._analyze_competitive_context(text)
-            }
+            contextual_factors = self._contextual_factors(
+                text, metadata, state["lexical_features"].get("keyword_counts")
+            )
             
             # Market mood synchronization with other agents
-            mood_sync_request = SentimentAgentMessage(
-                sender_id=self.agent_id,
-                receiver_id="technical_analysis_agent",
-                protocol=SentimentA2AProtocol.MARKET_MOOD_SHARING,
-                content={
+            mood_sync_request = self._emit(
+                SentimentA2AProtocol.MARKET_MOOD_SHARING,
+                {
                     "current_analysis": contextual_factors,
                     "sentiment_context": state["emotional_profile"],
                     "sync_request": "market_mood_validation"
                 },
-                timestamp=datetime.now(),
-                message_id=f"mood_sync_{datetime.now().timestamp()}",
-                requires_response=True
+                state["invocation_ts"]
             )
             
-            state["agent_communications"].append(mood_sync_request)
+            state["agent_communications"][_MOOD_MESSAGE_SLOT] = mood_sync_request
             state["contextual_factors"] = contextual_factors
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.CONTEXT_AWARENESS.value,
-                "timestamp": datetime.now().isoformat(),
-                "context_dimensions": len(contextual_factors),
-                "market_timing_score": contextual_factors["market_timing"].get("relevance_score", 0)
-            })
+            state["trace_payloads"][_CONTEXT_SLOT] = (
+                len(contextual_factors),
+                contextual_factors["market_timing"].get("relevance_score", 0)
+            )
             
             return state
             
@@ -310,7 +567,7 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Context awareness error: {str(e)}")
             return state
     
-    async def _sentiment_scoring_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    def _sentiment_scoring_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Advanced multi-dimensional sentiment scoring"""
         try:
             text = state["preprocessed_text"]
@@ -318,29 +575,17 @@ class LangGraphSentimentAnalyzer:
             emotional = state["emotional_profile"]
             context = state["contextual_factors"]
             
-            # Multi-dimensional sentiment scoring
-            sentiment_scores = {
-                "lexical_sentiment": self._calculate_lexical_sentiment(lexical),
-                "emotional_sentiment": self._calculate_emotional_sentiment(emotional),
-                "contextual_sentiment": self._calculate_contextual_sentiment(context),
-                "temporal_sentiment": self._calculate_temporal_sentiment(text, context),
-                "intensity_adjusted_sentiment": self._calculate_intensity_adjusted_sentiment(lexical, emotional),
-                "confidence_weighted_sentiment": self._calculate_confidence_weighted_sentiment(emotional, context)
-            }
-            
-            # Composite sentiment calculation
-            composite_sentiment = self._calculate_composite_sentiment(sentiment_scores)
-            sentiment_scores["composite_sentiment"] = composite_sentiment
+            # Multi-dimensional sentiment scoring, including the composite score
+            sentiment_scores = self._sentiment_scores(text, lexical, emotional, context)
+            composite_sentiment = sentiment_scores["composite_sentiment"]
             
             state["sentiment_scores"] = sentiment_scores
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.SENTIMENT_SCORING.value,
-                "timestamp": datetime.now().isoformat(),
-                "sentiment_dimensions": len(sentiment_scores),
-                "composite_score": composite_sentiment,
-                "dominant_factor": max(sentiment_scores.items(), key=lambda x: abs(x[1]) if isinstance(x[1], (int, float)) else 0)[0]
-            })
+            state["trace_payloads"][_SCORING_SLOT] = (
+                len(sentiment_scores),
+                composite_sentiment,
+                max(sentiment_scores.items(), key=lambda x: abs(x[1]) if isinstance(x[1], (int, float)) else 0)[0]
+            )
             
             return state
             
@@ -348,7 +593,7 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Sentiment scoring error: {str(e)}")
             return state
     
-    async def _volatility_assessment_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    def _volatility_assessment_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Assess sentiment volatility and market impact"""
         try:
             sentiment_scores = state["sentiment_scores"]
@@ -356,45 +601,33 @@ class LangGraphSentimentAnalyzer:
             context = state["contextual_factors"]
             
             # Volatility assessment
-            volatility_indicators = {
-                "sentiment_variance": self._calculate_sentiment_variance(sentiment_scores),
-                "emotional_volatility": self._calculate_emotional_volatility(emotional_profile),
-                "market_stress_indicators": self._assess_market_stress(emotional_profile, context),
-                "uncertainty_levels": self._assess_uncertainty_levels(state["lexical_features"]),
-                "volatility_triggers": self._identify_volatility_triggers(state["preprocessed_text"]),
-                "stability_factors": self._identify_stability_factors(context)
-            }
+            volatility_indicators = self._volatility_indicators(
+                state["preprocessed_text"], state["lexical_features"], emotional_profile, context, sentiment_scores
+            )
             
             # Check for high volatility alert
             volatility_score = volatility_indicators["sentiment_variance"]
             if volatility_score > 0.7:  # High volatility threshold
-                volatility_alert = SentimentAgentMessage(
-                    sender_id=self.agent_id,
-                    receiver_id="risk_management_agent",
-                    protocol=SentimentA2AProtocol.VOLATILITY_ALERT,
-                    content={
+                volatility_alert = self._emit(
+                    SentimentA2AProtocol.VOLATILITY_ALERT,
+                    {
                         "alert_level": "high",
                         "volatility_score": volatility_score,
                         "triggers": volatility_indicators["volatility_triggers"],
                         "market_stress": volatility_indicators["market_stress_indicators"]
                     },
-                    timestamp=datetime.now(),
-                    message_id=f"volatility_alert_{datetime.now().timestamp()}",
-                    priority=1,  # High priority
-                    requires_response=False
+                    state["invocation_ts"]
                 )
                 
-                state["agent_communications"].append(volatility_alert)
+                state["agent_communications"][_VOLATILITY_MESSAGE_SLOT] = volatility_alert
             
             state["volatility_indicators"] = volatility_indicators
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.VOLATILITY_ASSESSMENT.value,
-                "timestamp": datetime.now().isoformat(),
-                "volatility_score": volatility_score,
-                "stress_level": volatility_indicators["market_stress_indicators"].get("stress_level", 0),
-                "alert_triggered": volatility_score > 0.7
-            })
+            state["trace_payloads"][_VOLATILITY_SLOT] = (
+                volatility_score,
+                volatility_indicators["market_stress_indicators"].get("stress_level", 0),
+                volatility_score > 0.7
+            )
             
             return state
             
@@ -402,31 +635,26 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Volatility assessment error: {str(e)}")
             return state
     
-    async def _cross_validate_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    def _cross_validate_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Cross-validate sentiment analysis with peer agents"""
         try:
             # A2A communication: Request cross-validation
-            cross_validation_request = SentimentAgentMessage(
-                sender_id=self.agent_id,
-                receiver_id="news_analysis_agent",
-                protocol=SentimentA2AProtocol.CROSS_REFERENCE_REQUEST,
-                content={
+            cross_validation_request = self._emit(
+                SentimentA2AProtocol.CROSS_REFERENCE_REQUEST,
+                {
                     "analysis_summary": {
                         "composite_sentiment": state["sentiment_scores"]["composite_sentiment"],
-                        "dominant_emotion": max(state["emotional_profile"].items(), 
-                                              key=lambda x: sum(x[1].values()) if isinstance(x[1], dict) else x[1])[0],
+                        "dominant_emotion": state["dominant_emotion"],
                         "volatility_score": state["volatility_indicators"]["sentiment_variance"],
                         "context_factors": list(state["contextual_factors"].keys())
                     },
                     "validation_request": "sentiment_cross_reference",
                     "confidence_level": state.get("confidence_score", 0.5)
                 },
-                timestamp=datetime.now(),
-                message_id=f"cross_validation_{datetime.now().timestamp()}",
-                requires_response=True
+                state["invocation_ts"]
             )
             
-            state["agent_communications"].append(cross_validation_request)
+            state["agent_communications"][_CROSS_VALIDATION_MESSAGE_SLOT] = cross_validation_request
             
             # Simulate consensus building
             consensus_score = self._calculate_sentiment_consensus(state)
@@ -438,13 +666,11 @@ class LangGraphSentimentAnalyzer:
                 "agreement_factors": self._identify_agreement_factors(state)
             }]
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.CROSS_VALIDATION.value,
-                "timestamp": datetime.now().isoformat(),
-                "consensus_score": consensus_score,
-                "peer_agents_consulted": 1,
-                "validation_confidence": consensus_score
-            })
+            state["trace_payloads"][_CROSS_VALIDATION_SLOT] = (
+                consensus_score,
+                1,
+                consensus_score
+            )
             
             return state
             
@@ -452,43 +678,22 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Cross validation error: {str(e)}")
             return state
     
-    async def _sentiment_synthesis_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
+    def _sentiment_synthesis_node(self, state: SentimentAnalysisState) -> SentimentAnalysisState:
         """Synthesize final sentiment analysis with confidence scoring"""
         try:
             # Aggregate all analysis components
-            final_sentiment = {
-                "overall_sentiment": self._aggregate_sentiment_score(state),
-                "confidence_level": self._calculate_final_confidence(state),
-                "emotional_summary": self._synthesize_emotional_summary(state),
-                "market_implications": self._synthesize_market_implications(state),
-                "volatility_forecast": self._synthesize_volatility_forecast(state),
-                "risk_indicators": self._extract_sentiment_risks(state),
-                "opportunity_signals": self._extract_sentiment_opportunities(state),
-                "temporal_urgency": self._assess_sentiment_urgency(state),
-                "recommended_actions": self._generate_sentiment_recommendations(state)
-            }
-            
-            # Final confidence adjustment based on cross-validation
-            cross_validation_adjustment = sum(
-                ref.get("confidence_adjustment", 0) 
-                for ref in state.get("cross_references", [])
-            )
-            
-            final_confidence = min(1.0, max(0.0, 
-                final_sentiment["confidence_level"] + cross_validation_adjustment
-            ))
+            final_sentiment = self._final_sentiment(state)
+            final_confidence = self._adjusted_final_confidence(state, final_sentiment)
             
             state["final_sentiment"] = final_sentiment
             state["confidence_score"] = final_confidence
             
-            state["reasoning_trace"].append({
-                "step": SentimentReasoningStep.SENTIMENT_SYNTHESIS.value,
-                "timestamp": datetime.now().isoformat(),
-                "final_confidence": final_confidence,
-                "overall_sentiment": final_sentiment["overall_sentiment"],
-                "dominant_emotion": final_sentiment["emotional_summary"]["dominant_emotion"],
-                "market_impact": final_sentiment["market_implications"]["impact_score"]
-            })
+            state["trace_payloads"][_SYNTHESIS_SLOT] = (
+                final_confidence,
+                final_sentiment["overall_sentiment"],
+                final_sentiment["emotional_summary"]["dominant_emotion"],
+                final_sentiment["market_implications"]["impact_score"]
+            )
             
             return state
             
@@ -496,103 +701,263 @@ class LangGraphSentimentAnalyzer:
             state["processing_errors"].append(f"Sentiment synthesis error: {str(e)}")
             return state
     
+    def _emit(self, protocol: SentimentA2AProtocol, content: Dict[str, Any], timestamp: datetime) -> SentimentAgentMessage:
+        """Build an outgoing pipeline message along its fixed route"""
+        receiver_id, requires_response, priority, id_prefix = _MESSAGE_ROUTES[protocol]
+        return SentimentAgentMessage(
+            sender_id=self.agent_id,
+            receiver_id=receiver_id,
+            protocol=protocol,
+            content=content,
+            timestamp=timestamp,
+            message_id=f"{id_prefix}_{self.agent_id}_{next(self._msg_counter)}",
+            priority=priority,
+            requires_response=requires_response
+        )
+    
+    # Stage computations shared by the graph nodes and the fused fast path
+    def _lexical_analysis(self, text: str, keyword_counts: Optional[Dict[str, int]]) -> Dict[str, Any]:
+        """Multi-dimensional lexical analysis of preprocessed text"""
+        return {
+            "sentiment_words": self._extract_sentiment_words(text, keyword_counts),
+            "intensity_markers": self._extract_intensity_markers(text, keyword_counts),
+            "negation_patterns": self._detect_negation_patterns(text, keyword_counts),
+            "comparative_expressions": self._extract_comparative_expressions(text, keyword_counts),
+            "temporal_indicators": self._extract_temporal_indicators(text, keyword_counts),
+            "uncertainty_phrases": self._extract_uncertainty_phrases(text, keyword_counts)
+        }
+    
+    def _emotional_profile(self, text: str, lexical_features: Dict[str, Any]) -> Dict[str, Any]:
+        """Emotional profile of preprocessed text"""
+        keyword_counts = lexical_features.get("keyword_counts")
+        return {
+            "fear_indicators": self._analyze_fear_emotions(text, lexical_features),
+            "greed_indicators": self._analyze_greed_emotions(text, lexical_features),
+            "confidence_markers": self._analyze_confidence_emotions(text, lexical_features),
+            "anxiety_signals": self._analyze_anxiety_emotions(text, lexical_features),
+            "euphoria_patterns": self._analyze_euphoria_emotions(text, lexical_features),
+            "emotional_intensity": self._calculate_emotional_intensity(text, keyword_counts),
+            "emotional_stability": self._assess_emotional_stability(text, keyword_counts)
+        }
+    
+    def _contextual_factors(
+        self, text: str, metadata: Dict[str, Any], keyword_counts: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        """Market, source and topical context of the content"""
+        if keyword_counts is None:
+            keyword_counts = _count_keywords(text)
+        return {
+            "market_timing": self._analyze_market_timing_context(metadata),
+            "source_influence": self._analyze_source_influence(metadata),
+            "sector_context": self._analyze_sector_context(text, keyword_counts),
+            "geographic_scope": self._analyze_geographic_context(text, keyword_counts),
+            "regulatory_environment": self._analyze_regulatory_context(text, keyword_counts),
+            "competitive_landscape": self._analyze_competitive_context(text, keyword_counts)
+        }
+    
+    def _sentiment_scores(
+        self, text: str, lexical: Dict[str, Any], emotional: Dict[str, Any], context: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """Sub-scores for every sentiment dimension plus their weighted composite"""
+        lexical_sentiment = self._calculate_lexical_sentiment(lexical)
+        sentiment_scores = {
+            "lexical_sentiment": lexical_sentiment,
+            "emotional_sentiment": self._calculate_emotional_sentiment(emotional),
+            "contextual_sentiment": self._calculate_contextual_sentiment(context),
+            "temporal_sentiment": self._calculate_temporal_sentiment(text, context, lexical.get("keyword_counts")),
+            "intensity_adjusted_sentiment": self._calculate_intensity_adjusted_sentiment(
+                lexical, emotional, lexical_sentiment
+            ),
+            "confidence_weighted_sentiment": self._calculate_confidence_weighted_sentiment(emotional, context)
+        }
+        
+        # Composite sentiment calculation on the packed sub-scores
+        scores = np.fromiter((sentiment_scores[key] for key in _SCORE_KEYS), dtype=np.float64, count=len(_SCORE_KEYS))
+        sentiment_scores["composite_sentiment"] = _composite_kernel(scores, _SCORE_WEIGHTS)
+        return sentiment_scores
+    
+    def _volatility_indicators(
+        self,
+        text: str,
+        lexical: Dict[str, Any],
+        emotional: Dict[str, Any],
+        context: Dict[str, Any],
+        sentiment_scores: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """Sentiment volatility and market stress indicators"""
+        emotion_scores = _emotion_scores(emotional)
+        return {
+            "sentiment_variance": self._calculate_sentiment_variance(sentiment_scores),
+            "emotional_volatility": self._calculate_emotional_volatility(emotional, emotion_scores),
+            "market_stress_indicators": self._assess_market_stress(emotional, context, emotion_scores),
+            "uncertainty_levels": self._assess_uncertainty_levels(lexical),
+            "volatility_triggers": self._identify_volatility_triggers(text, lexical.get("keyword_counts")),
+            "stability_factors": self._identify_stability_factors(context)
+        }
+    
+    def _final_sentiment(self, state: SentimentAnalysisState) -> Dict[str, Any]:
+        """Aggregate all analysis components into the final sentiment in one pass over the state"""
+        emotional_profile = state["emotional_profile"]
+        sentiment = state["sentiment_scores"]["composite_sentiment"]
+        volatility = state["volatility_indicators"]["sentiment_variance"]
+        emotional_intensity = emotional_profile["emotional_intensity"]
+        fear_score = emotional_profile["fear_indicators"]["fear_score"]
+        confidence_score = emotional_profile["confidence_markers"]["confidence_score"]
+        
+        risks = []
+        if volatility > 0.7:
+            risks.append("high_sentiment_volatility")
+        if fear_score > 0.6:
+            risks.append("fear_driven_sentiment")
+        
+        opportunities = []
+        if sentiment > 0.5:
+            opportunities.append("positive_sentiment_momentum")
+        if confidence_score > 0.7:
+            opportunities.append("high_confidence_environment")
+        
+        if volatility > 0.8 or emotional_intensity > 0.8:
+            urgency = "immediate"
+        elif volatility > 0.5 or emotional_intensity > 0.5:
+            urgency = "high"
+        else:
+            urgency = "medium"
+        
+        recommendations = []
+        if sentiment > 0.5 and volatility < 0.3:
+            recommendations.append("Monitor for sentiment sustainability")
+        elif sentiment < -0.5 and volatility > 0.7:
+            recommendations.append("Prepare for potential sentiment-driven volatility")
+        elif volatility > 0.8:
+            recommendations.append("Implement volatility management strategies")
+        
+        return {
+            "overall_sentiment": sentiment,
+            "confidence_level": self._calculate_final_confidence(state),
+            "emotional_summary": {
+                "dominant_emotion": state.get("dominant_emotion") or self._dominant_emotion(emotional_profile),
+                "emotional_intensity": emotional_intensity,
+                "emotional_stability": emotional_profile.get("emotional_stability", 0.5)
+            },
+            "market_implications": {
+                "impact_score": abs(sentiment) * (1 + volatility),
+                "direction": "positive" if sentiment > 0 else "negative",
+                "volatility_impact": volatility
+            },
+            "volatility_forecast": {
+                "forecast": "high" if volatility > 0.7 else "moderate",
+                "confidence": 0.8,
+                "time_horizon": "short_term"
+            },
+            "risk_indicators": risks,
+            "opportunity_signals": opportunities,
+            "temporal_urgency": urgency,
+            "recommended_actions": recommendations
+        }
+    
+    def _adjusted_final_confidence(self, state: SentimentAnalysisState, final_sentiment: Dict[str, Any]) -> float:
+        """Final confidence adjusted by the cross-validation results"""
+        cross_validation_adjustment = sum(
+            ref.get("confidence_adjustment", 0) 
+            for ref in state.get("cross_references", [])
+        )
+        
+        return _clip01(final_sentiment["confidence_level"] + cross_validation_adjustment)
+    
     # Helper methods for complex reasoning
-    async def _advanced_text_preprocessing(self, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _advanced_text_preprocessing(self, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Advanced text preprocessing with feature extraction"""
         # Simulate advanced preprocessing
+        text = content.lower().strip()
         return {
-            "text": content.lower().strip(),
+            "text": text,
             "features": {
                 "length": len(content),
                 "word_count": len(content.split()),
-                "source_type": metadata.get("source", "unknown")
+                "source_type": metadata.get("source", "unknown"),
+                "keyword_counts": _count_keywords(text)
             }
         }
     
-    def _extract_sentiment_words(self, text: str) -> List[Dict[str, Any]]:
+    def _keyword_hits(self, text: str, keyword_counts: Optional[Dict[str, int]], category: str) -> List[str]:
+        """Keywords of a category present in text, read from precomputed counts when given"""
+        if keyword_counts is None:
+            keyword_counts = _count_keywords(text)
+        return [word for word in _KEYWORDS[category] if word in keyword_counts]
+    
+    def _keyword_count(self, text: str, keyword_counts: Optional[Dict[str, int]], category: str) -> int:
+        """Number of distinct keywords of a category present in text"""
+        if keyword_counts is None:
+            keyword_counts = _count_keywords(text)
+        return len(keyword_counts.keys() & _KEYWORD_SETS[category])
+    
+    def _extract_sentiment_words(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
         """Extract sentiment-bearing words with context"""
-        # Simplified implementation
-        sentiment_words = ["good", "bad", "excellent", "terrible", "bullish", "bearish"]
-        found_words = []
-        for word in sentiment_words:
-            if word in text:
-                found_words.append({"word": word, "context": "sentence", "intensity": 0.7})
-        return found_words
-    
-    def _extract_intensity_markers(self, text: str) -> List[str]:
+        return [
+            {"word": word, "context": "sentence", "intensity": 0.7}
+            for word in self._keyword_hits(text, keyword_counts, "sentiment")
+        ]
+    
+    def _extract_intensity_markers(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> List[str]:
         """Extract intensity markers"""
-        markers = ["very", "extremely", "highly", "significantly", "moderately", "slightly"]
-        return [marker for marker in markers if marker in text]
+        return self._keyword_hits(text, keyword_counts, "intensity")
     
-    def _detect_negation_patterns(self, text: str) -> List[Dict[str, Any]]:
+    def _detect_negation_patterns(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
         """Detect negation patterns"""
-        negations = ["not", "no", "never", "none", "neither"]
-        patterns = []
-        for neg in negations:
-            if neg in text:
-                patterns.append({"negation": neg, "scope": "local"})
-        return patterns
-    
-    def _extract_comparative_expressions(self, text: str) -> List[str]:
+        return [
+            {"negation": neg, "scope": "local"}
+            for neg in self._keyword_hits(text, keyword_counts, "negation")
+        ]
+    
+    def _extract_comparative_expressions(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> List[str]:
         """Extract comparative expressions"""
-        comparatives = ["better", "worse", "higher", "lower", "more", "less"]
-        return [comp for comp in comparatives if comp in text]
+        return self._keyword_hits(text, keyword_counts, "comparative")
     
-    def _extract_temporal_indicators(self, text: str) -> List[str]:
+    def _extract_temporal_indicators(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> List[str]:
         """Extract temporal indicators"""
-        temporal = ["now", "today", "tomorrow", "soon", "later", "recently"]
-        return [temp for temp in temporal if temp in text]
+        return self._keyword_hits(text, keyword_counts, "temporal")
     
-    def _extract_uncertainty_phrases(self, text: str) -> List[str]:
+    def _extract_uncertainty_phrases(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> List[str]:
         """Extract uncertainty phrases"""
-        uncertainty = ["might", "could", "possibly", "perhaps", "maybe", "uncertain"]
-        return [unc for unc in uncertainty if unc in text]
+        return self._keyword_hits(text, keyword_counts, "uncertainty")
     
     def _analyze_fear_emotions(self, text: str, features: Dict[str, Any]) -> Dict[str, float]:
         """Analyze fear-related emotions"""
-        fear_words = ["afraid", "scared", "worried", "panic", "crisis"]
-        fear_score = sum(0.2 for word in fear_words if word in text)
-        return {"fear_score": min(1.0, fear_score), "fear_words": len([w for w in fear_words if w in text])}
+        hits = self._keyword_count(text, features.get("keyword_counts"), "fear")
+        return {"fear_score": min(1.0, 0.2 * hits), "fear_words": hits}
     
     def _analyze_greed_emotions(self, text: str, features: Dict[str, Any]) -> Dict[str, float]:
         """Analyze greed-related emotions"""
-        greed_words = ["greedy", "aggressive", "opportunity", "profit", "gain"]
-        greed_score = sum(0.2 for word in greed_words if word in text)
-        return {"greed_score": min(1.0, greed_score), "greed_words": len([w for w in greed_words if w in text])}
+        hits = self._keyword_count(text, features.get("keyword_counts"), "greed")
+        return {"greed_score": min(1.0, 0.2 * hits), "greed_words": hits}
     
     def _analyze_confidence_emotions(self, text: str, features: Dict[str, Any]) -> Dict[str, float]:
         """Analyze confidence-related emotions"""
-        confidence_words = ["confident", "optimistic", "bullish", "strong", "solid"]
-        confidence_score = sum(0.2 for word in confidence_words if word in text)
-        return {"confidence_score": min(1.0, confidence_score), "confidence_words": len([w for w in confidence_words if w in text])}
+        hits = self._keyword_count(text, features.get("keyword_counts"), "confidence")
+        return {"confidence_score": min(1.0, 0.2 * hits), "confidence_words": hits}
     
     def _analyze_anxiety_emotions(self, text: str, features: Dict[str, Any]) -> Dict[str, float]:
         """Analyze anxiety-related emotions"""
-        anxiety_words = ["anxious", "nervous", "uncertain", "volatile", "unstable"]
-        anxiety_score = sum(0.2 for word in anxiety_words if word in text)
-        return {"anxiety_score": min(1.0, anxiety_score), "anxiety_words": len([w for w in anxiety_words if w in text])}
+        hits = self._keyword_count(text, features.get("keyword_counts"), "anxiety")
+        return {"anxiety_score": min(1.0, 0.2 * hits), "anxiety_words": hits}
     
     def _analyze_euphoria_emotions(self, text: str, features: Dict[str, Any]) -> Dict[str, float]:
         """Analyze euphoria-related emotions"""
-        euphoria_words = ["euphoric", "ecstatic", "thrilled", "excited", "boom"]
-        euphoria_score = sum(0.2 for word in euphoria_words if word in text)
-        return {"euphoria_score": min(1.0, euphoria_score), "euphoria_words": len([w for w in euphoria_words if w in text])}
+        hits = self._keyword_count(text, features.get("keyword_counts"), "euphoria")
+        return {"euphoria_score": min(1.0, 0.2 * hits), "euphoria_words": hits}
     
-    def _calculate_emotional_intensity(self, text: str) -> float:
+    def _calculate_emotional_intensity(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> float:
         """Calculate overall emotional intensity"""
-        intensity_markers = ["very", "extremely", "highly", "significantly"]
-        intensity_score = sum(0.25 for marker in intensity_markers if marker in text)
-        return min(1.0, intensity_score)
+        return min(1.0, 0.25 * self._keyword_count(text, keyword_counts, "emotional_intensity"))
     
-    def _assess_emotional_stability(self, text: str) -> float:
+    def _assess_emotional_stability(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> float:
         """Assess emotional stability"""
-        stability_words = ["stable", "steady", "consistent", "reliable", "predictable"]
-        instability_words = ["volatile", "erratic", "unpredictable", "chaotic", "turbulent"]
-        
-        stability_score = sum(0.2 for word in stability_words if word in text)
-        instability_score = sum(0.2 for word in instability_words if word in text)
+        if keyword_counts is None:
+            keyword_counts = _count_keywords(text)
+        stability_score = 0.2 * self._keyword_count(text, keyword_counts, "stability")
+        instability_score = 0.2 * self._keyword_count(text, keyword_counts, "instability")
         
-        return max(0.0, min(1.0, stability_score - instability_score + 0.5))
+        return _clip01(stability_score - instability_score + 0.5)
     
     def _analyze_market_timing_context(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze market timing context"""
@@ -604,36 +969,35 @@ class LangGraphSentimentAnalyzer:
     
     def _analyze_source_influence(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze source influence"""
-        source = metadata.get("source", "unknown").lower()
-        credibility_map = {"reuters": 0.95, "bloomberg": 0.95, "twitter": 0.3}
-        credibility = credibility_map.get(source, 0.5)
+        source = metadata.get("_source_lc")
+        if source is None:
+            source = metadata.get("source", "unknown").lower()
+        credibility = _CREDIBILITY_MAP.get(source, 0.5)
         return {"credibility": credibility, "influence_factor": credibility}
     
-    def _analyze_sector_context(self, text: str) -> Dict[str, Any]:
+    def _analyze_sector_context(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Analyze sector context"""
-        sectors = {"tech": ["technology", "software", "ai"], "finance": ["bank", "financial", "lending"]}
-        identified_sectors = []
-        for sector, keywords in sectors.items():
-            if any(keyword in text for keyword in keywords):
-                identified_sectors.append(sector)
+        if keyword_counts is None:
+            keyword_counts = _count_keywords(text)
+        identified_sectors = [
+            sector for sector in _SECTOR_KEYWORDS
+            if self._keyword_count(text, keyword_counts, f"sector_{sector}")
+        ]
         return {"identified_sectors": identified_sectors, "sector_relevance": len(identified_sectors) * 0.3}
     
-    def _analyze_geographic_context(self, text: str) -> Dict[str, Any]:
+    def _analyze_geographic_context(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Analyze geographic context"""
-        regions = ["global", "us", "europe", "asia", "china", "japan"]
-        identified_regions = [region for region in regions if region in text]
+        identified_regions = self._keyword_hits(text, keyword_counts, "region")
         return {"regions": identified_regions, "geographic_scope": len(identified_regions) * 0.2}
     
-    def _analyze_regulatory_context(self, text: str) -> Dict[str, Any]:
+    def _analyze_regulatory_context(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Analyze regulatory context"""
-        regulatory_terms = ["regulation", "policy", "fed", "sec", "compliance"]
-        regulatory_score = sum(0.2 for term in regulatory_terms if term in text)
+        regulatory_score = 0.2 * self._keyword_count(text, keyword_counts, "regulatory")
         return {"regulatory_relevance": min(1.0, regulatory_score)}
     
-    def _analyze_competitive_context(self, text: str) -> Dict[str, Any]:
+    def _analyze_competitive_context(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Analyze competitive context"""
-        competitive_terms = ["competitor", "market share", "rivalry", "competition"]
-        competitive_score = sum(0.25 for term in competitive_terms if term in text)
+        competitive_score = 0.25 * self._keyword_count(text, keyword_counts, "competitive")
         return {"competitive_intensity": min(1.0, competitive_score)}
     
     def _calculate_lexical_sentiment(self, lexical: Dict[str, Any]) -> float:
@@ -648,14 +1012,9 @@ class LangGraphSentimentAnalyzer:
     
     def _calculate_emotional_sentiment(self, emotional: Dict[str, Any]) -> float:
         """Calculate sentiment from emotional profile"""
-        positive_emotions = ["confidence", "euphoria"]
-        negative_emotions = ["fear", "anxiety"]
-        
-        positive_score = sum(emotional.get(f"{emotion}_indicators", {}).get(f"{emotion}_score", 0) 
-                           for emotion in positive_emotions)
-        negative_score = sum(emotional.get(f"{emotion}_indicators", {}).get(f"{emotion}_score", 0) 
-                           for emotion in negative_emotions)
-        
+        scores = _emotion_scores(emotional)
+        positive_score = scores[_CONFIDENCE] + scores[_EUPHORIA]
+        negative_score = scores[_FEAR] + scores[_ANXIETY]
         return positive_score - negative_score
     
     def _calculate_contextual_sentiment(self, context: Dict[str, Any]) -> float:
@@ -664,63 +1023,55 @@ class LangGraphSentimentAnalyzer:
         source_influence = context.get("source_influence", {}).get("influence_factor", 0.5)
         return (market_timing + source_influence) / 2 - 0.5
     
-    def _calculate_temporal_sentiment(self, text: str, context: Dict[str, Any]) -> float:
+    def _calculate_temporal_sentiment(
+        self, text: str, context: Dict[str, Any], keyword_counts: Optional[Dict[str, int]] = None
+    ) -> float:
         """Calculate temporal sentiment"""
-        temporal_indicators = ["now", "immediate", "urgent", "breaking"]
-        temporal_score = sum(0.25 for indicator in temporal_indicators if indicator in text)
+        temporal_score = 0.25 * self._keyword_count(text, keyword_counts, "temporal_urgency")
         return min(1.0, temporal_score) - 0.5
     
-    def _calculate_intensity_adjusted_sentiment(self, lexical: Dict[str, Any], emotional: Dict[str, Any]) -> float:
-        """Calculate intensity-adjusted sentiment"""
-        base_sentiment = self._calculate_lexical_sentiment(lexical)
+    def _calculate_intensity_adjusted_sentiment(
+        self, lexical: Dict[str, Any], emotional: Dict[str, Any], base_sentiment: Optional[float] = None
+    ) -> float:
+        """Calculate intensity-adjusted sentiment, reusing the lexical sub-score when already computed"""
+        if base_sentiment is None:
+            base_sentiment = self._calculate_lexical_sentiment(lexical)
         intensity = emotional.get("emotional_intensity", 0.5)
         return base_sentiment * (1 + intensity)
     
     def _calculate_confidence_weighted_sentiment(self, emotional: Dict[str, Any], context: Dict[str, Any]) -> float:
         """Calculate confidence-weighted sentiment"""
-        confidence_score = emotional.get("confidence_indicators", {}).get("confidence_score", 0.5)
+        confidence_score = emotional.get("confidence_markers", {}).get("confidence_score", 0.5)
         source_credibility = context.get("source_influence", {}).get("credibility", 0.5)
         return confidence_score * source_credibility
     
     def _calculate_composite_sentiment(self, sentiment_scores: Dict[str, float]) -> float:
         """Calculate composite sentiment score"""
-        weights = {
-            "lexical_sentiment": 0.3,
-            "emotional_sentiment": 0.25,
-            "contextual_sentiment": 0.2,
-            "temporal_sentiment": 0.1,
-            "intensity_adjusted_sentiment": 0.1,
-            "confidence_weighted_sentiment": 0.05
-        }
-        
-        weighted_sum = sum(sentiment_scores.get(key, 0) * weight 
-                          for key, weight in weights.items())
-        return max(-1.0, min(1.0, weighted_sum))
+        scores = np.fromiter((sentiment_scores.get(key, 0) for key in _SCORE_KEYS), dtype=np.float64, count=len(_SCORE_KEYS))
+        return _composite_kernel(scores, _SCORE_WEIGHTS)
     
     def _calculate_sentiment_variance(self, sentiment_scores: Dict[str, float]) -> float:
         """Calculate sentiment variance for volatility assessment"""
-        scores = [score for score in sentiment_scores.values() if isinstance(score, (int, float))]
-        if len(scores) < 2:
-            return 0.0
-        return statistics.stdev(scores)
+        return _sample_stdev([sentiment_scores[key] for key in _VARIANCE_KEYS if key in sentiment_scores])
     
-    def _calculate_emotional_volatility(self, emotional_profile: Dict[str, Any]) -> float:
+    def _calculate_emotional_volatility(
+        self, emotional_profile: Dict[str, Any], emotion_scores: Optional[List[float]] = None
+    ) -> float:
         """Calculate emotional volatility"""
-        emotions = ["fear", "greed", "confidence", "anxiety", "euphoria"]
-        emotion_scores = []
-        for emotion in emotions:
-            score = emotional_profile.get(f"{emotion}_indicators", {}).get(f"{emotion}_score", 0)
-            emotion_scores.append(score)
-        
-        if len(emotion_scores) < 2:
-            return 0.0
-        return statistics.stdev(emotion_scores)
+        if emotion_scores is None:
+            emotion_scores = _emotion_scores(emotional_profile)
+        return _sample_stdev(emotion_scores)
     
-    def _assess_market_stress(self, emotional_profile: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _assess_market_stress(
+        self,
+        emotional_profile: Dict[str, Any],
+        context: Dict[str, Any],
+        emotion_scores: Optional[List[float]] = None
+    ) -> Dict[str, Any]:
         """Assess market stress indicators"""
-        fear_score = emotional_profile.get("fear_indicators", {}).get("fear_score", 0)
-        anxiety_score = emotional_profile.get("anxiety_indicators", {}).get("anxiety_score", 0)
-        stress_level = (fear_score + anxiety_score) / 2
+        if emotion_scores is None:
+            emotion_scores = _emotion_scores(emotional_profile)
+        stress_level = (emotion_scores[_FEAR] + emotion_scores[_ANXIETY]) / 2
         
         return {
             "stress_level": stress_level,
@@ -737,10 +1088,9 @@ class LangGraphSentimentAnalyzer:
             "uncertainty_phrases_count": len(uncertainty_phrases)
         }
     
-    def _identify_volatility_triggers(self, text: str) -> List[str]:
+    def _identify_volatility_triggers(self, text: str, keyword_counts: Optional[Dict[str, int]] = None) -> List[str]:
         """Identify volatility triggers"""
-        triggers = ["breaking", "sudden", "unexpected", "shock", "surprise", "crisis"]
-        return [trigger for trigger in triggers if trigger in text]
+        return self._keyword_hits(text, keyword_counts, "volatility_trigger")
     
     def _identify_stability_factors(self, context: Dict[str, Any]) -> List[str]:
         """Identify stability factors"""
@@ -760,10 +1110,6 @@ class LangGraphSentimentAnalyzer:
         """Identify factors contributing to agreement"""
         return ["sentiment_direction", "emotional_intensity", "market_context"]
     
-    def _aggregate_sentiment_score(self, state: SentimentAnalysisState) -> float:
-        """Aggregate final sentiment score"""
-        return state["sentiment_scores"].get("composite_sentiment", 0.0)
-    
     def _calculate_final_confidence(self, state: SentimentAnalysisState) -> float:
         """Calculate final confidence score"""
         base_confidence = 0.7
@@ -772,97 +1118,127 @@ class LangGraphSentimentAnalyzer:
         
         return max(0.1, min(1.0, base_confidence - error_penalty + cross_validation_bonus))
     
-    def _synthesize_emotional_summary(self, state: SentimentAnalysisState) -> Dict[str, Any]:
-        """Synthesize emotional summary"""
-        emotional_profile = state["emotional_profile"]
-        dominant_emotion = max(emotional_profile.items(), 
-                             key=lambda x: sum(x[1].values()) if isinstance(x[1], dict) else x[1])[0]
-        
-        return {
-            "dominant_emotion": dominant_emotion,
-            "emotional_intensity": emotional_profile.get("emotional_intensity", 0.5),
-            "emotional_stability": emotional_profile.get("emotional_stability", 0.5)
-        }
-    
-    def _synthesize_market_implications(self, state: SentimentAnalysisState) -> Dict[str, Any]:
-        """Synthesize market implications"""
-        sentiment_score = state["sentiment_scores"]["composite_sentiment"]
-        volatility_score = state["volatility_indicators"]["sentiment_variance"]
-        
-        return {
-            "impact_score": abs(sentiment_score) * (1 + volatility_score),
-            "direction": "positive" if sentiment_score > 0 else "negative",
-            "volatility_impact": volatility_score
-        }
-    
-    def _synthesize_volatility_forecast(self, state: SentimentAnalysisState) -> Dict[str, Any]:
-        """Synthesize volatility forecast"""
-        volatility_indicators = state["volatility_indicators"]
-        return {
-            "forecast": "high" if volatility_indicators["sentiment_variance"] > 0.7 else "moderate",
-            "confidence": 0.8,
-            "time_horizon": "short_term"
-        }
-    
-    def _extract_sentiment_risks(self, state: SentimentAnalysisState) -> List[str]:
-        """Extract sentiment-based risks"""
-        risks = []
-        if state["volatility_indicators"]["sentiment_variance"] > 0.7:
-            risks.append("high_sentiment_volatility")
-        if state["emotional_profile"]["fear_indicators"]["fear_score"] > 0.6:
-            risks.append("fear_driven_sentiment")
-        return risks
-    
-    def _extract_sentiment_opportunities(self, state: SentimentAnalysisState) -> List[str]:
-        """Extract sentiment-based opportunities"""
-        opportunities = []
-        if state["sentiment_scores"]["composite_sentiment"] > 0.5:
-            opportunities.append("positive_sentiment_momentum")
-        if state["emotional_profile"]["confidence_indicators"]["confidence_score"] > 0.7:
-            opportunities.append("high_confidence_environment")
-        return opportunities
-    
-    def _assess_sentiment_urgency(self, state: SentimentAnalysisState) -> str:
-        """Assess temporal urgency of sentiment"""
-        volatility = state["volatility_indicators"]["sentiment_variance"]
-        emotional_intensity = state["emotional_profile"]["emotional_intensity"]
-        
-        if volatility > 0.8 or emotional_intensity > 0.8:
-            return "immediate"
-        elif volatility > 0.5 or emotional_intensity > 0.5:
-            return "high"
-        else:
-            return "medium"
-    
-    def _generate_sentiment_recommendations(self, state: SentimentAnalysisState) -> List[str]:
-        """Generate actionable recommendations based on sentiment"""
-        recommendations = []
-        sentiment = state["sentiment_scores"]["composite_sentiment"]
-        volatility = state["volatility_indicators"]["sentiment_variance"]
-        
-        if sentiment > 0.5 and volatility < 0.3:
-            recommendations.append("Monitor for sentiment sustainability")
-        elif sentiment < -0.5 and volatility > 0.7:
-            recommendations.append("Prepare for potential sentiment-driven volatility")
-        elif volatility > 0.8:
-            recommendations.append("Implement volatility management strategies")
-        
-        return recommendations
+    def _dominant_emotion(self, emotional_profile: Dict[str, Any]) -> str:
+        """Profile dimension with the highest total score (first one on ties)"""
+        best_dimension, best_total = None, -math.inf
+        for dimension, value in emotional_profile.items():
+            total = sum(value.values()) if type(value) is dict else value
+            if total > best_total:
+                best_dimension, best_total = dimension, total
+        return best_dimension
     
     async def process_content_sentiment(self, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process content through the complete LangGraph sentiment reasoning pipeline
         
-        Returns comprehensive sentiment analysis with reasoning trace and A2A communications
+        Returns comprehensive sentiment analysis with reasoning trace and A2A communications.
+        Results for repeated content from the same source are served from an LRU cache
+        until they are older than the configured TTL, as copies with the trace and
+        message timestamps and the message ids reissued.
         """
+        cache_key = self._result_cache_key(content, metadata)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return self._copy_result(cached, datetime.now())
+        
+        if self.config.get("use_langgraph") is False:
+            # Single-shot analysis without graph scheduling or checkpoints
+            result = await self.fast_path(content, metadata)
+            self._cache_result(cache_key, result)
+            return result
+        
         if not self.graph:
             # Fallback to simple analysis if LangGraph not available
             return await self._fallback_sentiment_analysis(content, metadata)
         
         # Initialize state
-        initial_state: SentimentAnalysisState = {
+        initial_state = self._initial_state(content, metadata)
+        
+        # Execute the reasoning workflow
+        config = {"configurable": {"thread_id": f"sentiment_analysis_{self.agent_id}_{next(self._msg_counter)}"}}
+        
+        try:
+            final_state = await self.graph.ainvoke(initial_state, config)
+            result = self._result_from_state(final_state)
+            self._cache_result(cache_key, result)
+            return result
+            
+        except Exception as e:
+            return {
+                "sentiment_analysis": {},
+                "confidence": 0.1,
+                "reasoning_trace": [],
+                "agent_communications": [],
+                "processing_errors": [f"Workflow execution error: {str(e)}"],
+                "metadata": {"processing_time": 0, "emotional_complexity": 0}
+            }
+    
+    def _result_cache_key(self, content: str, metadata: Dict[str, Any]) -> bytes:
+        """Digest of the content and the source it came from (the only metadata the analysis reads)"""
+        source = str(metadata.get("source", "unknown"))
+        return hashlib.blake2b(f"{source}\x00{content}".encode(), digest_size=16).digest()
+    
+    def _cached_result(self, cache_key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a live cached analysis, dropping it if its TTL has passed"""
+        entry = self._result_cache.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._result_cache[cache_key]
+            return None
+        self._result_cache.move_to_end(cache_key)
+        return result
+    
+    def _cache_result(self, cache_key: bytes, result: Dict[str, Any]):
+        """Remember a finished analysis, evicting the least recently used one when full
+        
+        Analyses that recorded an error are not kept, so the content is retried next time.
+        """
+        if self._result_cache_size <= 0 or result["processing_errors"]:
+            return
+        # Stored as a private copy so the caller that got the original cannot alter it
+        self._result_cache[cache_key] = (time.monotonic() + self._result_cache_ttl, self._copy_result(result))
+        if len(self._result_cache) > self._result_cache_size:
+            self._result_cache.popitem(last=False)
+    
+    def _copy_result(self, result: Dict[str, Any], now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Copy an analysis result down to its per-step and per-message dicts
+        
+        With ``now``, the copy is restamped as a new delivery: trace and message
+        timestamps move to ``now`` and every message gets a fresh id.
+        """
+        now_iso = now.isoformat() if now is not None else None
+        trace = [dict(step) for step in result["reasoning_trace"]]
+        communications = [dict(message) for message in result["agent_communications"]]
+        if now is not None:
+            for step in trace:
+                step["timestamp"] = now_iso
+            for message in communications:
+                message["timestamp"] = now
+                message["message_id"] = (
+                    f"{_MESSAGE_ROUTES[message['protocol']][3]}_{self.agent_id}_{next(self._msg_counter)}"
+                )
+                if "analysis_timestamp" in message["content"]:
+                    message["content"] = {**message["content"], "analysis_timestamp": now_iso}
+        return {
+            **result,
+            "sentiment_analysis": dict(result["sentiment_analysis"]),
+            "reasoning_trace": trace,
+            "agent_communications": communications,
+            "processing_errors": list(result["processing_errors"]),
+            "metadata": dict(result["metadata"])
+        }
+    
+    def _initial_state(self, content: str, metadata: Dict[str, Any]) -> SentimentAnalysisState:
+        """Empty workflow state for one piece of content
+        
+        Only containers that a step mutates in place are allocated here; the slot
+        lists are allocated by preprocessing, and unused sequences share an empty tuple.
+        """
+        return {
             "raw_content": content,
-            "content_metadata": metadata,
+            "content_metadata": dict(metadata),
             "preprocessed_text": "",
             "lexical_features": {},
             "emotional_profile": {},
@@ -871,56 +1247,265 @@ class LangGraphSentimentAnalyzer:
             "volatility_indicators": {},
             "cross_references": [],
             "final_sentiment": {},
-            "reasoning_trace": [],
-            "agent_communications": [],
+            "trace_payloads": (),
+            "agent_communications": (),
             "confidence_score": 0.0,
-            "uncertainty_factors": [],
-            "processing_errors": []
+            "uncertainty_factors": (),
+            "processing_errors": [],
+            "dominant_emotion": "",
+            "invocation_ts": None,
+            "invocation_ts_iso": ""
+        }
+    
+    def _result_from_state(self, final_state: SentimentAnalysisState) -> Dict[str, Any]:
+        """Shape a finished workflow state into the analysis result"""
+        reasoning_trace = self.reasoning_trace_dicts(final_state)
+        return {
+            "sentiment_analysis": final_state["final_sentiment"],
+            "confidence": final_state["confidence_score"],
+            "reasoning_trace": reasoning_trace,
+            "agent_communications": [msg.to_dict() for msg in final_state["agent_communications"] if msg is not None],
+            "processing_errors": final_state["processing_errors"],
+            "metadata": {
+                "processing_time": len(reasoning_trace),
+                "emotional_complexity": len(final_state["emotional_profile"]),
+                "cross_validation_count": len(final_state["cross_references"])
+            }
         }
+    
+    def reasoning_trace_dicts(self, state: SentimentAnalysisState) -> List[Dict[str, Any]]:
+        """Materialize the trace payloads as one dict per completed step"""
+        timestamp = state["invocation_ts_iso"]
+        return [
+            {"step": _TRACE_STEPS[slot], "timestamp": timestamp, **dict(zip(_TRACE_SCHEMA[slot], payload))}
+            for slot, payload in enumerate(state["trace_payloads"])
+            if payload is not None
+        ]
+    
+    async def fast_path(self, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run all eight reasoning steps as one fused pass
         
-        # Execute the reasoning workflow
-        config = {"configurable": {"thread_id": f"sentiment_analysis_{datetime.now().timestamp()}"}}
+        Stages share local variables instead of round-tripping a state object
+        through the graph, and one timestamp is taken for the whole analysis.
+        """
+        state = self._initial_state(content, metadata)
+        metadata = state["content_metadata"]
+        now = state["invocation_ts"] = datetime.now()
+        now_iso = state["invocation_ts_iso"] = now.isoformat()
+        communications = state["agent_communications"] = []
+        payloads = state["trace_payloads"] = [None] * _TRACE_SLOTS
         
         try:
-            final_state = await self.graph.ainvoke(initial_state, config)
+            # Content preprocessing
+            metadata["_source_lc"] = metadata.get("source", "unknown").lower()
+            preprocessed = self._advanced_text_preprocessing(content, metadata)
+            text = preprocessed["text"]
+            lexical = preprocessed["features"]
+            payloads[_PREPROCESS_SLOT] = (
+                len(content),
+                len(text),
+                len(lexical)
+            )
             
-            return {
-                "sentiment_analysis": final_state["final_sentiment"],
-                "confidence": final_state["confidence_score"],
-                "reasoning_trace": final_state["reasoning_trace"],
-                "agent_communications": [msg.__dict__ for msg in final_state["agent_communications"]],
-                "processing_errors": final_state["processing_errors"],
-                "metadata": {
-                    "processing_time": len(final_state["reasoning_trace"]),
-                    "emotional_complexity": len(final_state["emotional_profile"]),
-                    "cross_validation_count": len(final_state["cross_references"])
-                }
-            }
+            # Lexical analysis
+            lexical.update(self._lexical_analysis(text, lexical.get("keyword_counts")))
+            payloads[_LEXICAL_SLOT] = (
+                len(lexical["sentiment_words"]),
+                len(lexical["negation_patterns"]),
+                len(lexical["uncertainty_phrases"])
+            )
+            
+            # Emotional profiling
+            emotional = self._emotional_profile(text, lexical)
+            dominant_emotion = state["dominant_emotion"] = self._dominant_emotion(emotional)
+            communications.append(self._emit(
+                SentimentA2AProtocol.EMOTIONAL_CONSENSUS,
+                {
+                    "emotional_profile": emotional,
+                    "content_source": metadata.get("source", "unknown"),
+                    "analysis_timestamp": now_iso
+                },
+                now
+            ))
+            payloads[_EMOTIONAL_SLOT] = (
+                len(emotional),
+                dominant_emotion,
+                emotional["emotional_intensity"]
+            )
+            
+            # Context awareness
+            context = self._contextual_factors(text, metadata, lexical.get("keyword_counts"))
+            communications.append(self._emit(
+                SentimentA2AProtocol.MARKET_MOOD_SHARING,
+                {
+                    "current_analysis": context,
+                    "sentiment_context": emotional,
+                    "sync_request": "market_mood_validation"
+                },
+                now
+            ))
+            payloads[_CONTEXT_SLOT] = (
+                len(context),
+                context["market_timing"].get("relevance_score", 0)
+            )
+            
+            # Sentiment scoring
+            sentiment = self._sentiment_scores(text, lexical, emotional, context)
+            composite_sentiment = sentiment["composite_sentiment"]
+            payloads[_SCORING_SLOT] = (
+                len(sentiment),
+                composite_sentiment,
+                max(sentiment.items(), key=lambda x: abs(x[1]) if isinstance(x[1], (int, float)) else 0)[0]
+            )
+            
+            # Volatility assessment
+            volatility = self._volatility_indicators(text, lexical, emotional, context, sentiment)
+            volatility_score = volatility["sentiment_variance"]
+            if volatility_score > 0.7:  # High volatility threshold
+                communications.append(self._emit(
+                    SentimentA2AProtocol.VOLATILITY_ALERT,
+                    {
+                        "alert_level": "high",
+                        "volatility_score": volatility_score,
+                        "triggers": volatility["volatility_triggers"],
+                        "market_stress": volatility["market_stress_indicators"]
+                    },
+                    now
+                ))
+            payloads[_VOLATILITY_SLOT] = (
+                volatility_score,
+                volatility["market_stress_indicators"].get("stress_level", 0),
+                volatility_score > 0.7
+            )
+            
+            # Cross validation
+            state["preprocessed_text"] = text
+            state["lexical_features"] = lexical
+            state["emotional_profile"] = emotional
+            state["contextual_factors"] = context
+            state["sentiment_scores"] = sentiment
+            state["volatility_indicators"] = volatility
+            communications.append(self._emit(
+                SentimentA2AProtocol.CROSS_REFERENCE_REQUEST,
+                {
+                    "analysis_summary": {
+                        "composite_sentiment": composite_sentiment,
+                        "dominant_emotion": dominant_emotion,
+                        "volatility_score": volatility_score,
+                        "context_factors": list(context.keys())
+                    },
+                    "validation_request": "sentiment_cross_reference",
+                    "confidence_level": state["confidence_score"]
+                },
+                now
+            ))
+            consensus_score = self._calculate_sentiment_consensus(state)
+            state["cross_references"] = [{
+                "validation_source": "news_analysis_agent",
+                "consensus_score": consensus_score,
+                "confidence_adjustment": 0.1 if consensus_score > 0.7 else -0.05,
+                "agreement_factors": self._identify_agreement_factors(state)
+            }]
+            payloads[_CROSS_VALIDATION_SLOT] = (
+                consensus_score,
+                1,
+                consensus_score
+            )
+            
+            # Sentiment synthesis
+            final = self._final_sentiment(state)
+            state["final_sentiment"] = final
+            state["confidence_score"] = self._adjusted_final_confidence(state, final)
+            payloads[_SYNTHESIS_SLOT] = (
+                state["confidence_score"],
+                final["overall_sentiment"],
+                final["emotional_summary"]["dominant_emotion"],
+                final["market_implications"]["impact_score"]
+            )
             
         except Exception as e:
-            return {
-                "sentiment_analysis": {},
-                "confidence": 0.1,
-                "reasoning_trace": [],
-                "agent_communications": [],
-                "processing_errors": [f"Workflow execution error: {str(e)}"],
-                "metadata": {"processing_time": 0, "emotional_complexity": 0}
+            state["processing_errors"].append(f"Fast path analysis error: {str(e)}")
+        
+        return self._result_from_state(state)
+    
+    def batch_analyze(self, texts: List[str], metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Score many documents in one go
+        
+        Each text gets a single keyword scan; emotion, intensity and stability
+        scores, the composite and the sentiment variance are then computed with
+        NumPy across the whole batch. metadata applies to every document.
+        """
+        metadata = metadata or {}
+        timestamp = datetime.now().isoformat()
+        count = len(texts)
+        if not count:
+            return []
+        
+        preprocessed = [text.lower().strip() for text in texts]
+        keyword_counts = [_count_keywords(text) for text in preprocessed]
+        hits = np.array(
+            [[len(counts.keys() & _KEYWORD_SETS[category]) for category in _BATCH_CATEGORIES] for counts in keyword_counts],
+            dtype=np.float64
+        )
+        
+        emotions = len(_EMOTIONS)
+        emotion_scores = np.minimum(1.0, 0.2 * hits[:, :emotions])
+        intensity = np.minimum(1.0, 0.25 * hits[:, emotions])
+        stability = 0.2 * hits[:, emotions + 1] - 0.2 * hits[:, emotions + 2] + 0.5
+        np.clip(stability, 0.0, 1.0, out=stability)
+        
+        # Source context is shared by the whole batch
+        context = {
+            "market_timing": self._analyze_market_timing_context(metadata),
+            "source_influence": self._analyze_source_influence(metadata)
+        }
+        
+        profiles = []
+        sub_scores = np.empty((count, len(_SCORE_KEYS)), dtype=np.float64)
+        for row, (text, counts) in enumerate(zip(preprocessed, keyword_counts)):
+            profile = {
+                key: {f"{emotion}_score": float(emotion_scores[row, column]), f"{emotion}_words": int(hits[row, column])}
+                for column, (emotion, key) in enumerate(zip(_EMOTIONS, _EMOTION_PROFILE_KEYS))
             }
+            profile["emotional_intensity"] = float(intensity[row])
+            profile["emotional_stability"] = float(stability[row])
+            profiles.append(profile)
+            
+            lexical = {"sentiment_words": self._extract_sentiment_words(text, counts)}
+            lexical_sentiment = self._calculate_lexical_sentiment(lexical)
+            sub_scores[row] = (
+                lexical_sentiment,
+                self._calculate_emotional_sentiment(profile),
+                self._calculate_contextual_sentiment(context),
+                self._calculate_temporal_sentiment(text, context, counts),
+                self._calculate_intensity_adjusted_sentiment(lexical, profile, lexical_sentiment),
+                self._calculate_confidence_weighted_sentiment(profile, context)
+            )
+        
+        composite = sub_scores @ _SCORE_WEIGHTS
+        np.clip(composite, -1.0, 1.0, out=composite)
+        variance = np.column_stack((sub_scores, composite)).std(axis=1, ddof=1)
+        
+        results = []
+        for row, profile in enumerate(profiles):
+            sentiment_scores = dict(zip(_SCORE_KEYS, sub_scores[row].tolist()))
+            sentiment_scores["composite_sentiment"] = float(composite[row])
+            results.append({
+                "overall_sentiment": sentiment_scores["composite_sentiment"],
+                "sentiment_scores": sentiment_scores,
+                "emotional_profile": profile,
+                "sentiment_variance": float(variance[row]),
+                "timestamp": timestamp
+            })
+        return results
     
     async def _fallback_sentiment_analysis(self, content: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback sentiment analysis when LangGraph is not available"""
         return {
-            "sentiment_analysis": {
-                "overall_sentiment": 0.0,
-                "confidence_level": 0.6,
-                "emotional_summary": {"dominant_emotion": "neutral"},
-                "recommended_actions": ["Review with advanced sentiment tools"]
-            },
-            "confidence": 0.6,
-            "reasoning_trace": [{"step": "fallback_analysis", "timestamp": datetime.now().isoformat()}],
-            "agent_communications": [],
-            "processing_errors": ["LangGraph not available - using fallback"],
-            "metadata": {"processing_time": 1, "emotional_complexity": 1}
+            **_FALLBACK_RESULT,
+            "reasoning_trace": [{"step": "fallback_analysis", "timestamp": datetime.now().isoformat()}]
         }
     
     def register_peer_agent(self, agent_id: str, communication_handler):
@@ -931,52 +1516,32 @@ class LangGraphSentimentAnalyzer:
         """Handle incoming A2A message"""
         self.communication_history.append(message)
         
-        if message.protocol == SentimentA2AProtocol.SENTIMENT_VALIDATION:
-            return await self._handle_sentiment_validation_request(message)
-        elif message.protocol == SentimentA2AProtocol.EMOTIONAL_CONSENSUS:
-            return await self._handle_emotional_consensus_request(message)
-        elif message.protocol == SentimentA2AProtocol.MARKET_MOOD_SHARING:
-            await self._handle_market_mood_sharing(message)
-        elif message.protocol == SentimentA2AProtocol.VOLATILITY_ALERT:
-            await self._handle_volatility_alert(message)
-        
-        return None
+        handler = self._message_handlers.get(message.protocol)
+        if handler is None:
+            return None
+        return await handler(message)
     
     async def _handle_sentiment_validation_request(self, message: SentimentAgentMessage) -> SentimentAgentMessage:
         """Handle sentiment validation request from another agent"""
-        response_content = {
-            "validation_result": "confirmed",
-            "confidence_adjustment": 0.1,
-            "sentiment_agreement": 0.85,
-            "additional_insights": ["Cross-agent sentiment validation confirms analysis direction"]
-        }
-        
         return SentimentAgentMessage(
             sender_id=self.agent_id,
             receiver_id=message.sender_id,
             protocol=SentimentA2AProtocol.SENTIMENT_VALIDATION,
-            content=response_content,
+            content=_VALIDATION_RESPONSE_CONTENT.copy(),
             timestamp=datetime.now(),
-            message_id=f"sentiment_validation_response_{datetime.now().timestamp()}",
+            message_id=f"sentiment_validation_response_{self.agent_id}_{next(self._msg_counter)}",
             correlation_id=message.message_id
         )
     
     async def _handle_emotional_consensus_request(self, message: SentimentAgentMessage) -> SentimentAgentMessage:
         """Handle emotional consensus request"""
-        response_content = {
-            "consensus_result": "agreement",
-            "emotional_alignment": 0.8,
-            "shared_emotional_factors": ["confidence", "market_optimism"],
-            "divergent_factors": []
-        }
-        
         return SentimentAgentMessage(
             sender_id=self.agent_id,
             receiver_id=message.sender_id,
             protocol=SentimentA2AProtocol.EMOTIONAL_CONSENSUS,
-            content=response_content,
+            content=_CONSENSUS_RESPONSE_CONTENT.copy(),
             timestamp=datetime.now(),
-            message_id=f"emotional_consensus_response_{datetime.now().timestamp()}",
+            message_id=f"emotional_consensus_response_{self.agent_id}_{next(self._msg_counter)}",
             correlation_id=message.message_id
         )
     
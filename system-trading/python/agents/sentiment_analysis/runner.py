@@ -6,18 +6,67 @@ multi-agent architecture.
 """
 
 import asyncio
+import json
 import os
 import signal
 import sys
 from pathlib import Path
 
-# Add project root to Python path
+# Add project root to Python path, only when run as a script (`python runner.py`);
+# imported as agents.sentiment_analysis.runner, the root is already importable
 PROJECT_ROOT = Path(__file__).parents[2]
-sys.path.insert(0, str(PROJECT_ROOT))
+if not __package__ and str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from agents.sentiment_analysis.agent import SentimentAnalysisAgent, SentimentConfig
 from shared.process_manager import create_process_manager
 
+# Fast JSON codec (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_STATUS_PREFIX = "📊 Sentiment Analysis Process Status: ".encode()
+
+
+def _env_flag(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+# (environment variable, SentimentConfig field, parser, default) for create_config
+_ENV_SETTINGS = (
+    # Agent identity, NATS and logging
+    ('SENTIMENT_AGENT_NAME', 'agent_name', str, 'sentiment-analysis-agent'),
+    ('NATS_URL', 'nats_url', str, 'nats://localhost:4222'),
+    ('LOG_LEVEL', 'log_level', str, 'INFO'),
+    
+    # Analysis parameters
+    ('SENTIMENT_WINDOW_MINUTES', 'sentiment_window_minutes', int, '15'),
+    ('SENTIMENT_TREND_HOURS', 'trend_analysis_hours', int, '24'),
+    ('SENTIMENT_MAX_HISTORY', 'max_history_items', int, '2000'),
+    
+    # Model settings
+    ('SENTIMENT_USE_LEXICON', 'use_lexicon_analysis', _env_flag, 'true'),
+    ('SENTIMENT_USE_ML', 'use_ml_models', _env_flag, 'false'),
+    ('SENTIMENT_CONFIDENCE_THRESHOLD', 'confidence_threshold', float, '0.6'),
+    
+    # Content filtering
+    ('SENTIMENT_MIN_CONTENT_LENGTH', 'min_content_length', int, '10'),
+    ('SENTIMENT_MAX_CONTENT_AGE_HOURS', 'max_content_age_hours', int, '48'),
+    
+    # Market sentiment settings
+    ('SENTIMENT_TRACK_EMOTIONS', 'track_market_emotions', _env_flag, 'true'),
+    ('SENTIMENT_WEIGHT_CREDIBILITY', 'weight_source_credibility', _env_flag, 'true'),
+    ('SENTIMENT_AGGREGATE_BY_SYMBOL', 'aggregate_by_symbol', _env_flag, 'true'),
+    
+    # Trend analysis settings
+    ('SENTIMENT_DETECT_SHIFTS', 'detect_sentiment_shifts', _env_flag, 'true'),
+    ('SENTIMENT_SHIFT_THRESHOLD', 'shift_threshold', float, '0.3'),
+    ('SENTIMENT_MIN_SAMPLES_TREND', 'min_samples_for_trend', int, '10'),
+)
+
 
 class SentimentAnalysisProcess:
     """Process runner for Sentiment Analysis Agent"""
@@ -39,68 +88,24 @@ class SentimentAnalysisProcess:
         self.running = False
     
     def _info_handler(self, signum: int, frame):
-        """Handle info signal to dump status"""
+        """Handle info signal to dump status as a single JSON write"""
         if self.process_manager:
             status = self.process_manager.get_process_status()
-            print(f"📊 Sentiment Analysis Process Status:")
-            for key, value in status.items():
-                print(f"   {key}: {value}")
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(status, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(status, indent=2).encode()
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_STATUS_PREFIX + payload + b"\n")
+            sys.stdout.buffer.flush()
     
     def create_config(self) -> SentimentConfig:
         """Create configuration from environment variables"""
-        
-        # Get agent name
-        agent_name = os.getenv('SENTIMENT_AGENT_NAME', 'sentiment-analysis-agent')
-        
-        # Get NATS configuration
-        nats_url = os.getenv('NATS_URL', 'nats://localhost:4222')
-        
-        # Get logging configuration
-        log_level = os.getenv('LOG_LEVEL', 'INFO')
-        
-        # Get analysis parameters
-        sentiment_window_minutes = int(os.getenv('SENTIMENT_WINDOW_MINUTES', '15'))
-        trend_analysis_hours = int(os.getenv('SENTIMENT_TREND_HOURS', '24'))
-        max_history_items = int(os.getenv('SENTIMENT_MAX_HISTORY', '2000'))
-        
-        # Get model settings
-        use_lexicon_analysis = os.getenv('SENTIMENT_USE_LEXICON', 'true').lower() == 'true'
-        use_ml_models = os.getenv('SENTIMENT_USE_ML', 'false').lower() == 'true'
-        confidence_threshold = float(os.getenv('SENTIMENT_CONFIDENCE_THRESHOLD', '0.6'))
-        
-        # Get content filtering
-        min_content_length = int(os.getenv('SENTIMENT_MIN_CONTENT_LENGTH', '10'))
-        max_content_age_hours = int(os.getenv('SENTIMENT_MAX_CONTENT_AGE_HOURS', '48'))
-        
-        # Get market sentiment settings
-        track_market_emotions = os.getenv('SENTIMENT_TRACK_EMOTIONS', 'true').lower() == 'true'
-        weight_source_credibility = os.getenv('SENTIMENT_WEIGHT_CREDIBILITY', 'true').lower() == 'true'
-        aggregate_by_symbol = os.getenv('SENTIMENT_AGGREGATE_BY_SYMBOL', 'true').lower() == 'true'
-        
-        # Get trend analysis settings
-        detect_sentiment_shifts = os.getenv('SENTIMENT_DETECT_SHIFTS', 'true').lower() == 'true'
-        shift_threshold = float(os.getenv('SENTIMENT_SHIFT_THRESHOLD', '0.3'))
-        min_samples_for_trend = int(os.getenv('SENTIMENT_MIN_SAMPLES_TREND', '10'))
-        
-        return SentimentConfig(
-            agent_name=agent_name,
-            nats_url=nats_url,
-            log_level=log_level,
-            sentiment_window_minutes=sentiment_window_minutes,
-            trend_analysis_hours=trend_analysis_hours,
-            max_history_items=max_history_items,
-            use_lexicon_analysis=use_lexicon_analysis,
-            use_ml_models=use_ml_models,
-            confidence_threshold=confidence_threshold,
-            min_content_length=min_content_length,
-            max_content_age_hours=max_content_age_hours,
-            track_market_emotions=track_market_emotions,
-            weight_source_credibility=weight_source_credibility,
-            aggregate_by_symbol=aggregate_by_symbol,
-            detect_sentiment_shifts=detect_sentiment_shifts,
-            shift_threshold=shift_threshold,
-            min_samples_for_trend=min_samples_for_trend
-        )
+        environ = os.environ
+        return SentimentConfig(**{
+            field: parse(environ.get(env_key, default))
+            for env_key, field, parse, default in _ENV_SETTINGS
+        })
     
     async def run(self):
         """Main process loop"""
@@ -4,6 +4,6 @@ Technical Analysis Agent
 Processes market data to generate comprehensive technical indicators and trading signals.
 """
 
-from .agent import TechnicalAnalysisAgent, TechnicalConfig
+from .agent import MarketData, TechnicalAnalysisAgent, TechnicalConfig, TechnicalIndicators
 
-__all__ = ["TechnicalAnalysisAgent", "TechnicalConfig"]
\ No newline at end of file
+__all__ = ["MarketData", "TechnicalAnalysisAgent", "TechnicalConfig", "TechnicalIndicators"]
\ No newline at end of file
@@ -12,13 +12,18 @@ Publishes results to the 'insight.technical' topic as specified in CLAUDE.md.
 """
 
 import asyncio
+import math
+import zlib
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 import talib
-from pydantic import BaseModel, Field
+from pydantic import Field, model_validator
 
 try:
     # Import from shared module for router integration
@@ -28,6 +33,11 @@ except ImportError:
     from .base import AgentConfig, BaseAgent
 
 
+# Bars between exact recomputations of the running sums, to keep rounding drift bounded
+# (the Bollinger sum of squares cancels heavily, so this is kept short)
+_SUM_REFRESH_BARS = 4096
+
+
 class TechnicalConfig(AgentConfig):
     """Configuration specific to Technical Analysis Agent"""
     
@@ -52,9 +62,21 @@ class TechnicalConfig(AgentConfig):
     
     # Publishing settings
     publish_frequency: int = Field(default=1, description="Publish every N data points")
+    
+    # Sharding settings (symbols are split across processes by a stable hash)
+    shard_count: int = Field(default=1, description="Number of agent processes sharing the symbol universe")
+    shard_index: int = Field(default=0, description="Which shard of the symbol universe this process owns")
+    
+    @model_validator(mode="after")
+    def _check_shard(self) -> "TechnicalConfig":
+        """Reject a shard index that would leave this process owning no symbols"""
+        if not 0 <= self.shard_index < self.shard_count:
+            raise ValueError("Shard index must be between 0 and shard count - 1")
+        return self
 
 
-class MarketData(BaseModel):
+@dataclass(slots=True)
+class MarketData:
     """Market data structure matching the Go entities"""
     
     symbol: str
@@ -65,9 +87,91 @@ class MarketData(BaseModel):
     close_price: float
     volume: float
     source: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MarketData":
+        # Reads the known keys only, so extra fields on the wire are ignored
+        return cls(
+            symbol=data["symbol"],
+            timestamp=data["timestamp"],
+            open_price=float(data["open_price"]),
+            high_price=float(data["high_price"]),
+            low_price=float(data["low_price"]),
+            close_price=float(data["close_price"]),
+            volume=float(data["volume"]),
+            source=data["source"]
+        )
+
+
+class MarketDataBuffer:
+    """Fixed-size ring buffer holding the latest bars for one symbol.
+    
+    Each field is a preallocated column, so appending a bar is a handful of
+    scalar stores instead of a DataFrame rebuild. ``ordered`` returns a column
+    oldest-to-newest, copying only once the buffer has wrapped. Only the
+    fields the indicators read are kept; open, high and low are not stored.
+    Timestamps are kept as int64 nanoseconds since the epoch (UTC for
+    zone-aware input), with the newest bar's parsed ``pd.Timestamp`` held on
+    the side so it is only formatted when indicators are built.
+    """
+    
+    __slots__ = ("capacity", "timestamp", "close", "volume", "head", "count", "latest_timestamp")
+    
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.timestamp = np.empty(capacity, dtype=np.int64)
+        self.close = np.empty(capacity)
+        self.volume = np.empty(capacity)
+        self.head = 0  # next slot to write
+        self.count = 0
+        self.latest_timestamp: Optional[pd.Timestamp] = None
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, moment: pd.Timestamp, close_price: float, volume: float) -> bool:
+        """Store a parsed bar, overwriting the oldest one once the buffer is full.
+        
+        Returns True when the bar arrived out of order and the window was reordered.
+        """
+        timestamp = moment.value
+        out_of_order = self.count > 0 and timestamp < self.timestamp[self.head - 1]
+        
+        head = self.head
+        self.timestamp[head] = timestamp
+        self.close[head] = close_price
+        self.volume[head] = volume
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        
+        if out_of_order:
+            self._reorder()
+        else:
+            self.latest_timestamp = moment
+        return out_of_order
+    
+    def ordered(self, column: np.ndarray) -> np.ndarray:
+        """Return a buffer column ordered oldest to newest (a copy once the buffer has wrapped)"""
+        if self.count < self.capacity:
+            return column[:self.count]
+        if self.head == 0:
+            return column
+        return np.concatenate((column[self.head:], column[:self.head]))
+    
+    def _reorder(self) -> None:
+        """Move a late bar, just stored as the newest, back into timestamp order (rare path)"""
+        timestamps = self.ordered(self.timestamp)
+        position = np.searchsorted(timestamps[:-1], timestamps[-1], side="right")
+        for name in ("timestamp", "close", "volume"):
+            column = getattr(self, name)
+            ordered = self.ordered(column)
+            column[:self.count] = np.concatenate((ordered[:position], ordered[-1:], ordered[position:-1]))
+        self.head = self.count % self.capacity
 
 
-class TechnicalIndicators(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class TechnicalIndicators:
     """Technical analysis results structure"""
     
     symbol: str
@@ -101,6 +205,206 @@ class TechnicalIndicators(BaseModel):
     # Meta information
     bars_analyzed: int
     confidence: float  # 0-1 based on data quality and completeness
+    
+    def to_dict(self) -> Dict[str, Any]:
+        # Same keys, in field order, as the Pydantic .dict() this model used to publish
+        return {
+            "symbol": self.symbol,
+            "timestamp": self.timestamp,
+            "rsi": self.rsi,
+            "macd": self.macd,
+            "macd_signal": self.macd_signal,
+            "macd_histogram": self.macd_histogram,
+            "bb_upper": self.bb_upper,
+            "bb_middle": self.bb_middle,
+            "bb_lower": self.bb_lower,
+            "bb_width": self.bb_width,
+            "bb_position": self.bb_position,
+            "sma_short": self.sma_short,
+            "sma_long": self.sma_long,
+            "ema_short": self.ema_short,
+            "ema_long": self.ema_long,
+            "volume_sma": self.volume_sma,
+            "volume_ratio": self.volume_ratio,
+            "trend_signal": self.trend_signal,
+            "momentum_signal": self.momentum_signal,
+            "bars_analyzed": self.bars_analyzed,
+            "confidence": self.confidence
+        }
+
+
+# Indicators whose presence counts toward confidence, read in one C-level call
+_confidence_values = attrgetter(
+    # Price indicators
+    'rsi', 'macd', 'macd_signal', 'bb_upper', 'bb_lower',
+    'sma_short', 'sma_long', 'ema_short', 'ema_long',
+    # Volume indicators
+    'volume_sma', 'volume_ratio'
+)
+
+
+def _trend_from_counts(bullish_signals: int, total_signals: int) -> str:
+    """Map bullish votes out of the available trend signals to a trend label"""
+    if total_signals == 0:
+        return "neutral"
+    
+    bullish_ratio = bullish_signals / total_signals
+    if bullish_ratio >= 0.67:
+        return "bullish"
+    elif bullish_ratio <= 0.33:
+        return "bearish"
+    else:
+        return "neutral"
+
+
+# Trend label by [total_signals][bullish_signals]; there are at most three trend signals
+_TREND_SIGNALS = tuple(
+    tuple(_trend_from_counts(bullish, total) for bullish in range(total + 1))
+    for total in range(4)
+)
+
+
+@lru_cache(maxsize=64)
+def _smoothing_weights(length: int, period: int, alpha: float) -> np.ndarray:
+    """Weights ``w`` such that ``series @ w`` is TA-Lib's smoothed average at the last bar.
+    
+    TA-Lib seeds EMA and Wilder smoothing with the mean of the first ``period``
+    values and then decays by ``1 - alpha`` per bar, so the seed bars share one
+    weight and the rest are geometric. Used to seed the running state with a
+    single dot product instead of a serial recurrence.
+    """
+    decay = (1.0 - alpha) ** np.arange(length - period, -1, -1)
+    weights = np.empty(length)
+    weights[:period] = decay[0] / period
+    weights[period:] = alpha * decay[1:]
+    weights.flags.writeable = False
+    return weights
+
+
+class IndicatorState:
+    """Running indicator values for one symbol, advanced one bar at a time.
+    
+    Seeded from the buffered window once it holds enough bars for every
+    indicator, then updated in O(1) per bar: Wilder averages for RSI, EMA
+    recurrences for the EMAs and MACD, running sums for the SMAs, and a sum
+    and sum of squares for the Bollinger Bands. The sums drop the bar leaving
+    each period, read from the ring buffer before the new bar overwrites
+    anything.
+    """
+    
+    __slots__ = (
+        "rsi_period", "ema_short_k", "ema_long_k", "macd_fast_k", "macd_slow_k", "macd_signal_k",
+        "sma_short_period", "sma_long_period", "volume_sma_period", "bb_period", "bb_std",
+        "last_close", "avg_gain", "avg_loss", "ema_short", "ema_long",
+        "macd_fast_ema", "macd_slow_ema", "macd_signal",
+        "sma_short_sum", "sma_long_sum", "volume_sum", "bb_sum", "bb_sum_squares",
+        "bars_since_refresh",
+    )
+    
+    def __init__(self, config: TechnicalConfig, data: MarketDataBuffer) -> None:
+        close_prices = data.ordered(data.close)
+        
+        # TA-Lib's MACD always treats the shorter period as the fast one
+        macd_fast, macd_slow = sorted((config.macd_fast, config.macd_slow))
+        
+        self.rsi_period = config.rsi_period
+        self.ema_short_k = 2.0 / (config.ema_short + 1)
+        self.ema_long_k = 2.0 / (config.ema_long + 1)
+        self.macd_fast_k = 2.0 / (macd_fast + 1)
+        self.macd_slow_k = 2.0 / (macd_slow + 1)
+        self.macd_signal_k = 2.0 / (config.macd_signal + 1)
+        self.sma_short_period = config.sma_short
+        self.sma_long_period = config.sma_long
+        self.volume_sma_period = config.volume_sma_period
+        self.bb_period = config.bb_period
+        self.bb_std = config.bb_std
+        
+        length = len(close_prices)
+        deltas = np.diff(close_prices)
+        rsi_weights = _smoothing_weights(length - 1, config.rsi_period, 1.0 / config.rsi_period)
+        
+        self.last_close = float(close_prices[-1])
+        self.avg_gain = float(np.maximum(deltas, 0.0) @ rsi_weights)
+        self.avg_loss = float(np.maximum(-deltas, 0.0) @ rsi_weights)
+        self.ema_short = float(close_prices @ _smoothing_weights(length, config.ema_short, self.ema_short_k))
+        self.ema_long = float(close_prices @ _smoothing_weights(length, config.ema_long, self.ema_long_k))
+        # TA-Lib starts MACD's fast EMA on the bar where the slow one starts
+        lead = macd_slow - macd_fast
+        self.macd_fast_ema = float(
+            close_prices[lead:] @ _smoothing_weights(length - lead, macd_fast, self.macd_fast_k)
+        )
+        self.macd_slow_ema = float(close_prices @ _smoothing_weights(length, macd_slow, self.macd_slow_k))
+        # The signal is an EMA of an EMA difference; one TA-Lib pass is O(window)
+        # where a closed form over the closes would need an O(window^2) weight matrix
+        self.macd_signal = float(talib.MACD(
+            close_prices,
+            fastperiod=config.macd_fast,
+            slowperiod=config.macd_slow,
+            signalperiod=config.macd_signal
+        )[1][-1])
+        self.refresh_sums(data)
+    
+    def refresh_sums(self, data: MarketDataBuffer) -> None:
+        """Recompute the running sums exactly from the buffered window"""
+        close_prices = data.ordered(data.close)
+        volumes = data.ordered(data.volume)
+        self.sma_short_sum = float(close_prices[-self.sma_short_period:].sum())
+        self.sma_long_sum = float(close_prices[-self.sma_long_period:].sum())
+        self.volume_sum = float(volumes[-self.volume_sma_period:].sum())
+        bb_window = close_prices[-self.bb_period:]
+        self.bb_sum = float(bb_window.sum())
+        self.bb_sum_squares = float(bb_window @ bb_window)
+        self.bars_since_refresh = 0
+    
+    def update(self, data: MarketDataBuffer, close_price: float, volume: float) -> None:
+        """Advance by one bar; must run before the bar is appended to the buffer"""
+        head, capacity = data.head, data.capacity
+        closes, volumes = data.close, data.volume
+        
+        delta = close_price - self.last_close
+        period = self.rsi_period
+        self.avg_gain = (self.avg_gain * (period - 1) + (delta if delta > 0 else 0.0)) / period
+        self.avg_loss = (self.avg_loss * (period - 1) + (-delta if delta < 0 else 0.0)) / period
+        self.last_close = close_price
+        
+        self.ema_short += (close_price - self.ema_short) * self.ema_short_k
+        self.ema_long += (close_price - self.ema_long) * self.ema_long_k
+        self.macd_fast_ema += (close_price - self.macd_fast_ema) * self.macd_fast_k
+        self.macd_slow_ema += (close_price - self.macd_slow_ema) * self.macd_slow_k
+        macd = self.macd_fast_ema - self.macd_slow_ema
+        self.macd_signal += (macd - self.macd_signal) * self.macd_signal_k
+        
+        self.sma_short_sum += close_price - float(closes[(head - self.sma_short_period) % capacity])
+        self.sma_long_sum += close_price - float(closes[(head - self.sma_long_period) % capacity])
+        self.volume_sum += volume - float(volumes[(head - self.volume_sma_period) % capacity])
+        evicted = float(closes[(head - self.bb_period) % capacity])
+        self.bb_sum += close_price - evicted
+        self.bb_sum_squares += close_price * close_price - evicted * evicted
+        self.bars_since_refresh += 1
+    
+    def read(self, indicators: TechnicalIndicators) -> None:
+        """Fill the indicators that are tracked incrementally"""
+        gain_loss = self.avg_gain + self.avg_loss
+        indicators.rsi = 100.0 * self.avg_gain / gain_loss if gain_loss >= 1e-8 else 0.0
+        
+        macd = self.macd_fast_ema - self.macd_slow_ema
+        indicators.macd = macd
+        indicators.macd_signal = self.macd_signal
+        indicators.macd_histogram = macd - self.macd_signal
+        
+        indicators.sma_short = self.sma_short_sum / self.sma_short_period
+        indicators.sma_long = self.sma_long_sum / self.sma_long_period
+        indicators.ema_short = self.ema_short
+        indicators.ema_long = self.ema_long
+        indicators.volume_sma = self.volume_sum / self.volume_sma_period
+        
+        # Population standard deviation, zeroed below TA-Lib's epsilon like TA_STDDEV
+        bb_middle = self.bb_sum / self.bb_period
+        variance = self.bb_sum_squares / self.bb_period - bb_middle * bb_middle
+        band = self.bb_std * math.sqrt(variance) if variance >= 1e-8 else 0.0
+        indicators.bb_upper = bb_middle + band
+        indicators.bb_middle = bb_middle
+        indicators.bb_lower = bb_middle - band
 
 
 class TechnicalAnalysisAgent(BaseAgent):
@@ -117,7 +421,10 @@ class TechnicalAnalysisAgent(BaseAgent):
         self.config: TechnicalConfig = config
         
         # Data storage - organized by symbol
-        self.market_data: Dict[str, pd.DataFrame] = {}
+        self.market_data: Dict[str, MarketDataBuffer] = {}
+        self.indicator_state: Dict[str, IndicatorState] = {}
+        # Indicators for each symbol's newest bar, dropped when the next bar arrives
+        self.latest_indicators: Dict[str, TechnicalIndicators] = {}
         self.data_count = 0
         
         self.logger = self.logger.bind(component="technical_analysis")
@@ -153,13 +460,19 @@ class TechnicalAnalysisAgent(BaseAgent):
     async def _cleanup(self) -> None:
         """Cleanup agent resources"""
         self.market_data.clear()
+        self.indicator_state.clear()
+        self.latest_indicators.clear()
         self.logger.info("Technical Analysis Agent cleaned up")
     
     async def _handle_market_data(self, data: Dict[str, Any]) -> None:
         """Process incoming market data and generate technical indicators"""
         try:
+            # Every shard sees every bar; only the owning shard keeps state for a symbol
+            if self.config.shard_count > 1 and not self._owns_symbol(data.get("symbol", "")):
+                return
+            
             # Parse market data
-            market_data = MarketData(**data)
+            market_data = MarketData.from_dict(data)
             
             # Update data store
             self._update_market_data(market_data)
@@ -175,13 +488,15 @@ class TechnicalAnalysisAgent(BaseAgent):
                 )
                 return
             
-            # Generate technical indicators
-            indicators = self._calculate_indicators(market_data.symbol, symbol_data)
-            
-            # Check if we should publish (based on frequency setting)
+            # Check if we should publish (based on frequency setting); skipped
+            # bars are left to A2A requests to calculate on demand
             self.data_count += 1
-            if self.data_count % self.config.publish_frequency == 0:
-                await self._publish_indicators(indicators)
+            if self.data_count % self.config.publish_frequency != 0:
+                return
+            
+            # Generate technical indicators
+            indicators = self._latest_indicators(market_data.symbol)
+            await self._publish_indicators(indicators)
             
         except Exception as e:
             self.logger.error(
@@ -190,59 +505,53 @@ class TechnicalAnalysisAgent(BaseAgent):
                 data=data
             )
     
+    def _owns_symbol(self, symbol: str) -> bool:
+        """Whether this shard handles the symbol (crc32 is stable across processes, unlike hash())"""
+        return zlib.crc32(symbol.encode()) % self.config.shard_count == self.config.shard_index
+    
     def _update_market_data(self, market_data: MarketData) -> None:
         """Update the market data store for a symbol"""
         symbol = market_data.symbol
+        # Parse the whole bar before touching any state so a malformed one is
+        # rejected without being folded into the running sums. pd.Timestamp keeps
+        # nanoseconds (RFC3339Nano from the Go publisher) and accepts every format
+        # the DataFrame store did
+        moment = pd.Timestamp(market_data.timestamp)
+        if moment is pd.NaT:
+            raise ValueError(f"Missing timestamp for {symbol}")
+        close_price = float(market_data.close_price)
+        volume = float(market_data.volume)
         
-        # Create new DataFrame row
-        new_row = pd.DataFrame({
-            'timestamp': [pd.to_datetime(market_data.timestamp)],
-            'open': [market_data.open_price],
-            'high': [market_data.high_price], 
-            'low': [market_data.low_price],
-            'close': [market_data.close_price],
-            'volume': [market_data.volume]
-        })
-        
-        if symbol not in self.market_data:
-            # Initialize new symbol data
-            self.market_data[symbol] = new_row
-        else:
-            # Append to existing data
-            self.market_data[symbol] = pd.concat(
-                [self.market_data[symbol], new_row], 
-                ignore_index=True
-            )
-            
-            # Maintain window size
-            if len(self.market_data[symbol]) > self.config.data_window_size:
-                self.market_data[symbol] = self.market_data[symbol].tail(
-                    self.config.data_window_size
-                )
+        buffer = self.market_data.get(symbol)
+        if buffer is None:
+            buffer = self.market_data[symbol] = MarketDataBuffer(self.config.data_window_size)
         
-        # Sort by timestamp to ensure proper order
-        self.market_data[symbol] = self.market_data[symbol].sort_values('timestamp')
-        self.market_data[symbol].reset_index(drop=True, inplace=True)
+        self.latest_indicators.pop(symbol, None)
+        state = self.indicator_state.get(symbol)
+        if state is not None:
+            state.update(buffer, close_price, volume)
+        if buffer.append(moment, close_price, volume):
+            # A late bar reshuffles the window; the state is reseeded from it on demand
+            self.indicator_state.pop(symbol, None)
+        elif state is not None and state.bars_since_refresh >= _SUM_REFRESH_BARS:
+            state.refresh_sums(buffer)
         
         self.logger.debug(
             "Updated market data",
             symbol=symbol,
-            total_bars=len(self.market_data[symbol])
+            total_bars=len(buffer)
         )
     
-    def _calculate_indicators(self, symbol: str, data: pd.DataFrame) -> TechnicalIndicators:
+    def _calculate_indicators(self, symbol: str, data: MarketDataBuffer) -> TechnicalIndicators:
         """Calculate technical indicators for the given data"""
         
         # Get latest timestamp and bar count
-        latest_timestamp = data['timestamp'].iloc[-1].isoformat()
+        latest_timestamp = data.latest_timestamp.isoformat()
         bars_analyzed = len(data)
         
-        # Extract price and volume arrays
-        open_prices = data['open'].values
-        high_prices = data['high'].values
-        low_prices = data['low'].values
-        close_prices = data['close'].values
-        volumes = data['volume'].values
+        # Latest bar; the whole window is only materialised on the warm-up path
+        current_price = data.close[data.head - 1]
+        current_volume = data.volume[data.head - 1]
         
         # Initialize indicators with None values
         indicators = TechnicalIndicators(
@@ -253,66 +562,25 @@ class TechnicalAnalysisAgent(BaseAgent):
         )
         
         try:
-            # RSI
-            if len(close_prices) >= self.config.rsi_period:
-                rsi_values = talib.RSI(close_prices, timeperiod=self.config.rsi_period)
-                indicators.rsi = float(rsi_values[-1]) if not np.isnan(rsi_values[-1]) else None
-            
-            # MACD
-            if len(close_prices) >= max(self.config.macd_fast, self.config.macd_slow):
-                macd, macd_signal, macd_hist = talib.MACD(
-                    close_prices,
-                    fastperiod=self.config.macd_fast,
-                    slowperiod=self.config.macd_slow,
-                    signalperiod=self.config.macd_signal
-                )
-                indicators.macd = float(macd[-1]) if not np.isnan(macd[-1]) else None
-                indicators.macd_signal = float(macd_signal[-1]) if not np.isnan(macd_signal[-1]) else None
-                indicators.macd_histogram = float(macd_hist[-1]) if not np.isnan(macd_hist[-1]) else None
-            
-            # Bollinger Bands
-            if len(close_prices) >= self.config.bb_period:
-                bb_upper, bb_middle, bb_lower = talib.BBANDS(
-                    close_prices,
-                    timeperiod=self.config.bb_period,
-                    nbdevup=self.config.bb_std,
-                    nbdevdn=self.config.bb_std
+            state = self._indicator_state(symbol, data)
+            if state is not None:
+                state.read(indicators)
+            else:
+                self._calculate_window_indicators(
+                    indicators,
+                    data.ordered(data.close),
+                    data.ordered(data.volume)
                 )
-                indicators.bb_upper = float(bb_upper[-1]) if not np.isnan(bb_upper[-1]) else None
-                indicators.bb_middle = float(bb_middle[-1]) if not np.isnan(bb_middle[-1]) else None
-                indicators.bb_lower = float(bb_lower[-1]) if not np.isnan(bb_lower[-1]) else None
-                
-                # Calculate band width and position
-                if all(x is not None for x in [indicators.bb_upper, indicators.bb_lower]):
-                    indicators.bb_width = indicators.bb_upper - indicators.bb_lower
-                    current_price = close_prices[-1]
-                    if indicators.bb_width > 0:
-                        indicators.bb_position = (current_price - indicators.bb_lower) / indicators.bb_width
-            
-            # Moving Averages
-            if len(close_prices) >= self.config.sma_short:
-                sma_short = talib.SMA(close_prices, timeperiod=self.config.sma_short)
-                indicators.sma_short = float(sma_short[-1]) if not np.isnan(sma_short[-1]) else None
-            
-            if len(close_prices) >= self.config.sma_long:
-                sma_long = talib.SMA(close_prices, timeperiod=self.config.sma_long)
-                indicators.sma_long = float(sma_long[-1]) if not np.isnan(sma_long[-1]) else None
-            
-            if len(close_prices) >= self.config.ema_short:
-                ema_short = talib.EMA(close_prices, timeperiod=self.config.ema_short)
-                indicators.ema_short = float(ema_short[-1]) if not np.isnan(ema_short[-1]) else None
-            
-            if len(close_prices) >= self.config.ema_long:
-                ema_long = talib.EMA(close_prices, timeperiod=self.config.ema_long)
-                indicators.ema_long = float(ema_long[-1]) if not np.isnan(ema_long[-1]) else None
+            
+            # Calculate Bollinger band width and position
+            if all(x is not None for x in [indicators.bb_upper, indicators.bb_lower]):
+                indicators.bb_width = indicators.bb_upper - indicators.bb_lower
+                if indicators.bb_width > 0:
+                    indicators.bb_position = (current_price - indicators.bb_lower) / indicators.bb_width
             
             # Volume indicators
-            if len(volumes) >= self.config.volume_sma_period:
-                volume_sma = talib.SMA(volumes, timeperiod=self.config.volume_sma_period)
-                indicators.volume_sma = float(volume_sma[-1]) if not np.isnan(volume_sma[-1]) else None
-                
-                if indicators.volume_sma and indicators.volume_sma > 0:
-                    indicators.volume_ratio = volumes[-1] / indicators.volume_sma
+            if indicators.volume_sma and indicators.volume_sma > 0:
+                indicators.volume_ratio = current_volume / indicators.volume_sma
             
             # Generate signals based on indicators
             indicators.trend_signal = self._determine_trend_signal(indicators)
@@ -339,47 +607,113 @@ class TechnicalAnalysisAgent(BaseAgent):
         
         return indicators
     
+    def _latest_indicators(self, symbol: str) -> TechnicalIndicators:
+        """Indicators for the symbol's newest bar, calculated at most once per bar"""
+        indicators = self.latest_indicators.get(symbol)
+        if indicators is None:
+            indicators = self._calculate_indicators(symbol, self.market_data[symbol])
+            self.latest_indicators[symbol] = indicators
+        return indicators
+    
+    def _indicator_state(self, symbol: str, data: MarketDataBuffer) -> Optional[IndicatorState]:
+        """Return the symbol's running indicator state, seeding it once the window allows"""
+        state = self.indicator_state.get(symbol)
+        if state is None and len(data) >= self._warmup_bars():
+            state = self.indicator_state[symbol] = IndicatorState(self.config, data)
+        return state
+    
+    def _warmup_bars(self) -> int:
+        """Bars needed before every incrementally tracked indicator has a value"""
+        config = self.config
+        return max(
+            config.rsi_period + 1,
+            max(config.macd_fast, config.macd_slow) + config.macd_signal - 1,
+            config.sma_short,
+            config.sma_long,
+            config.ema_short,
+            config.ema_long,
+            config.volume_sma_period,
+            config.bb_period
+        )
+    
+    def _calculate_window_indicators(self, indicators: TechnicalIndicators,
+                                     close_prices: np.ndarray, volumes: np.ndarray) -> None:
+        """Compute the incrementally tracked indicators over the whole window (warm-up path)"""
+        # RSI
+        if len(close_prices) >= self.config.rsi_period:
+            rsi_values = talib.RSI(close_prices, timeperiod=self.config.rsi_period)
+            indicators.rsi = float(rsi_values[-1]) if not np.isnan(rsi_values[-1]) else None
+        
+        # MACD
+        if len(close_prices) >= max(self.config.macd_fast, self.config.macd_slow):
+            macd, macd_signal, macd_hist = talib.MACD(
+                close_prices,
+                fastperiod=self.config.macd_fast,
+                slowperiod=self.config.macd_slow,
+                signalperiod=self.config.macd_signal
+            )
+            indicators.macd = float(macd[-1]) if not np.isnan(macd[-1]) else None
+            indicators.macd_signal = float(macd_signal[-1]) if not np.isnan(macd_signal[-1]) else None
+            indicators.macd_histogram = float(macd_hist[-1]) if not np.isnan(macd_hist[-1]) else None
+        
+        # Bollinger Bands (only the last value is used, so only its period is passed in)
+        if len(close_prices) >= self.config.bb_period:
+            bb_upper, bb_middle, bb_lower = talib.BBANDS(
+                close_prices[-self.config.bb_period:],
+                timeperiod=self.config.bb_period,
+                nbdevup=self.config.bb_std,
+                nbdevdn=self.config.bb_std
+            )
+            indicators.bb_upper = float(bb_upper[-1]) if not np.isnan(bb_upper[-1]) else None
+            indicators.bb_middle = float(bb_middle[-1]) if not np.isnan(bb_middle[-1]) else None
+            indicators.bb_lower = float(bb_lower[-1]) if not np.isnan(bb_lower[-1]) else None
+        
+        # Moving Averages (the windowed ones only need their last period of bars)
+        if len(close_prices) >= self.config.sma_short:
+            sma_short = talib.SMA(close_prices[-self.config.sma_short:], timeperiod=self.config.sma_short)
+            indicators.sma_short = float(sma_short[-1]) if not np.isnan(sma_short[-1]) else None
+        
+        if len(close_prices) >= self.config.sma_long:
+            sma_long = talib.SMA(close_prices[-self.config.sma_long:], timeperiod=self.config.sma_long)
+            indicators.sma_long = float(sma_long[-1]) if not np.isnan(sma_long[-1]) else None
+        
+        if len(close_prices) >= self.config.ema_short:
+            ema_short = talib.EMA(close_prices, timeperiod=self.config.ema_short)
+            indicators.ema_short = float(ema_short[-1]) if not np.isnan(ema_short[-1]) else None
+        
+        if len(close_prices) >= self.config.ema_long:
+            ema_long = talib.EMA(close_prices, timeperiod=self.config.ema_long)
+            indicators.ema_long = float(ema_long[-1]) if not np.isnan(ema_long[-1]) else None
+        
+        # Volume indicators
+        if len(volumes) >= self.config.volume_sma_period:
+            volume_sma = talib.SMA(
+                volumes[-self.config.volume_sma_period:],
+                timeperiod=self.config.volume_sma_period
+            )
+            indicators.volume_sma = float(volume_sma[-1]) if not np.isnan(volume_sma[-1]) else None
+    
     def _determine_trend_signal(self, indicators: TechnicalIndicators) -> str:
         """Determine overall trend signal from multiple indicators"""
         bullish_signals = 0
-        bearish_signals = 0
         total_signals = 0
         
         # MACD trend
         if indicators.macd is not None and indicators.macd_signal is not None:
             total_signals += 1
-            if indicators.macd > indicators.macd_signal:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
+            bullish_signals += indicators.macd > indicators.macd_signal
         
         # Moving average crossover
         if indicators.sma_short is not None and indicators.sma_long is not None:
             total_signals += 1
-            if indicators.sma_short > indicators.sma_long:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
+            bullish_signals += indicators.sma_short > indicators.sma_long
         
         # EMA trend
         if indicators.ema_short is not None and indicators.ema_long is not None:
             total_signals += 1
-            if indicators.ema_short > indicators.ema_long:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
-        
-        if total_signals == 0:
-            return "neutral"
+            bullish_signals += indicators.ema_short > indicators.ema_long
         
-        # Determine overall trend
-        bullish_ratio = bullish_signals / total_signals
-        if bullish_ratio >= 0.67:
-            return "bullish"
-        elif bullish_ratio <= 0.33:
-            return "bearish"
-        else:
-            return "neutral"
+        return _TREND_SIGNALS[total_signals][bullish_signals]
     
     def _determine_momentum_signal(self, indicators: TechnicalIndicators) -> str:
         """Determine momentum signal primarily from RSI"""
@@ -400,23 +734,9 @@ class TechnicalAnalysisAgent(BaseAgent):
         data_confidence = min(1.0, bars_analyzed / (self.config.min_bars_required * 2))
         
         # Count available indicators
-        available_indicators = 0
-        total_indicators = 0
-        
-        # Price indicators
-        for field in ['rsi', 'macd', 'macd_signal', 'bb_upper', 'bb_lower', 
-                     'sma_short', 'sma_long', 'ema_short', 'ema_long']:
-            total_indicators += 1
-            if getattr(indicators, field) is not None:
-                available_indicators += 1
-        
-        # Volume indicators
-        for field in ['volume_sma', 'volume_ratio']:
-            total_indicators += 1
-            if getattr(indicators, field) is not None:
-                available_indicators += 1
-        
-        indicator_confidence = available_indicators / total_indicators if total_indicators > 0 else 0
+        values = _confidence_values(indicators)
+        available_indicators = len(values) - values.count(None)
+        indicator_confidence = available_indicators / len(values)
         
         # Overall confidence is the average of data and indicator confidence
         return (data_confidence + indicator_confidence) / 2
@@ -424,7 +744,7 @@ class TechnicalAnalysisAgent(BaseAgent):
     async def _publish_indicators(self, indicators: TechnicalIndicators) -> None:
         """Publish technical indicators to the insight.technical topic"""
         try:
-            message = indicators.model_dump()
+            message = indicators.to_dict()
             await self.publish("insight.technical", message)
             
             self.logger.info(
@@ -507,7 +827,7 @@ class TechnicalAnalysisAgent(BaseAgent):
             "signal_type": signal_type,
             "symbol": indicators.symbol,
             "timestamp": indicators.timestamp,
-            "indicators": indicators.model_dump(),
+            "indicators": indicators.to_dict(),
             "priority": "high" if indicators.confidence > 0.8 else "medium"
         }
         
@@ -600,8 +920,7 @@ class TechnicalAnalysisAgent(BaseAgent):
                 return
             
             # Get latest indicators for the symbol
-            data = self.market_data[symbol]
-            indicators = self._calculate_indicators(symbol, data)
+            indicators = self._latest_indicators(symbol)
             
             # Filter to requested indicators only
             response_data = {}
@@ -644,8 +963,7 @@ class TechnicalAnalysisAgent(BaseAgent):
                 return
             
             # Get our technical analysis for the symbol
-            data = self.market_data[symbol]
-            our_indicators = self._calculate_indicators(symbol, data)
+            our_indicators = self._latest_indicators(symbol)
             
             # Compare signals and provide validation
             validation_result = self._validate_external_signal(external_signal, our_indicators)
@@ -729,6 +1047,9 @@ class TechnicalAnalysisAgent(BaseAgent):
                 new_rsi_period = config_updates["rsi_period"]
                 if 5 <= new_rsi_period <= 50:  # Reasonable bounds
                     self.config.rsi_period = new_rsi_period
+                    # Running RSI averages depend on the period; reseed on next use
+                    self.indicator_state.clear()
+                    self.latest_indicators.clear()
             
             self.logger.info(
                 "Updated configuration",
@@ -759,6 +1080,8 @@ async def main() -> None:
         data_window_size=int(os.getenv("TECHNICAL_DATA_WINDOW_SIZE", "200")),
         min_bars_required=int(os.getenv("TECHNICAL_MIN_BARS_REQUIRED", "50")),
         publish_frequency=int(os.getenv("TECHNICAL_PUBLISH_FREQUENCY", "1")),
+        shard_count=int(os.getenv("TECHNICAL_SHARD_COUNT", "1")),
+        shard_index=int(os.getenv("TECHNICAL_SHARD_INDEX", "0")),
         
         # Indicator configuration
         rsi_period=int(os.getenv("TECHNICAL_RSI_PERIOD", "14")),
@@ -36,6 +36,10 @@ class TechnicalConfig(AgentConfig):
     min_bars_required: int = Field(default=50, description="Minimum bars needed for analysis")
     publish_frequency: int = Field(default=1, description="Publish every N data points")
     
+    # Sharding settings (symbols are split across processes by a stable hash)
+    shard_count: int = Field(default=1, description="Number of agent processes sharing the symbol universe")
+    shard_index: int = Field(default=0, description="Which shard of the symbol universe this process owns")
+    
     # RSI settings
     rsi_period: int = Field(default=14, description="RSI calculation period")
     
@@ -83,6 +87,8 @@ def load_config() -> TechnicalConfig:
         data_window_size=int(os.getenv("TECHNICAL_DATA_WINDOW_SIZE", "200")),
         min_bars_required=int(os.getenv("TECHNICAL_MIN_BARS_REQUIRED", "50")),
         publish_frequency=int(os.getenv("TECHNICAL_PUBLISH_FREQUENCY", "1")),
+        shard_count=int(os.getenv("TECHNICAL_SHARD_COUNT", "1")),
+        shard_index=int(os.getenv("TECHNICAL_SHARD_INDEX", "0")),
         
         # RSI configuration
         rsi_period=int(os.getenv("TECHNICAL_RSI_PERIOD", "14")),
@@ -120,6 +126,7 @@ Data Management:
 - Window Size: {config.data_window_size}
 - Min Bars: {config.min_bars_required}
 - Publish Frequency: {config.publish_frequency}
+- Shard: {config.shard_index + 1} of {config.shard_count}
 
 Indicators:
 - RSI Period: {config.rsi_period}
@@ -159,6 +166,9 @@ def validate_config(config: TechnicalConfig) -> bool:
     if config.data_window_size <= config.min_bars_required:
         raise ValueError("Data window size must be larger than minimum bars required")
     
+    if not 0 <= config.shard_index < config.shard_count:
+        raise ValueError("Shard index must be between 0 and shard count - 1")
+    
     if config.min_bars_required < max(config.sma_long, config.ema_long, config.bb_period):
         raise ValueError("Minimum bars required must be at least as large as the longest indicator period")
     
@@ -7,6 +7,7 @@ the CLAUDE.md architecture specifications.
 
 import asyncio
 import json
+import logging
 import signal
 import sys
 import uuid
@@ -67,7 +68,7 @@ class BaseAgent(ABC):
                 structlog.processors.JSONRenderer()
             ],
             wrapper_class=structlog.make_filtering_bound_logger(
-                getattr(structlog, self.config.log_level.upper())
+                getattr(logging, self.config.log_level.upper())
             ),
             logger_factory=structlog.PrintLoggerFactory(),
             cache_logger_on_first_use=True,
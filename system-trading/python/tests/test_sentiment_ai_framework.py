@@ -0,0 +1,283 @@
+"""
+Tests for the Sentiment Analysis AI framework
+
+Tests the reasoning pipeline of LangGraphSentimentAnalyzer: the graph nodes,
+the fused fast path and the whole-analysis result cache.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+# Import test dependencies
+try:
+    from agents.sentiment_analysis import ai_framework
+    from agents.sentiment_analysis.ai_framework import LangGraphSentimentAnalyzer
+    DEPENDENCIES_AVAILABLE = True
+except ImportError:
+    DEPENDENCIES_AVAILABLE = False
+
+
+SAMPLE_TEXTS = [
+    "Confident, optimistic investors see strong growth and solid profits in a bullish rally",
+    "Breaking: panic selling as fears of a crash send volatile markets into a plunge",
+    "Shares were flat today after the quarterly update",
+]
+
+
+@pytest.mark.skipif(not DEPENDENCIES_AVAILABLE, reason="AI framework dependencies not available")
+class TestLangGraphSentimentAnalyzer:
+    """Test cases for the LangGraph sentiment reasoning pipeline"""
+
+    NODES = (
+        "_preprocess_content_node",
+        "_lexical_analysis_node",
+        "_emotional_profiling_node",
+        "_context_awareness_node",
+        "_sentiment_scoring_node",
+        "_volatility_assessment_node",
+        "_cross_validate_node",
+        "_sentiment_synthesis_node",
+    )
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create an analyzer that runs without the LangGraph graph"""
+        analyzer = LangGraphSentimentAnalyzer("test-sentiment-agent", {"use_langgraph": False})
+        analyzer.graph = None
+        return analyzer
+
+    def _run_nodes(self, analyzer, content, metadata):
+        """Run the graph's nodes in order on a fresh state, as the compiled graph would"""
+        state = analyzer._initial_state(content, metadata)
+        for node in self.NODES:
+            state = getattr(analyzer, node)(state)
+        return state
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_synthesis_node_completes(self, analyzer, text):
+        """Test the synthesis step reads the emotional profile it was given"""
+        state = self._run_nodes(analyzer, text, {"source": "reuters"})
+
+        assert state["processing_errors"] == []
+        final = state["final_sentiment"]
+        assert final["overall_sentiment"] == state["sentiment_scores"]["composite_sentiment"]
+        assert final["emotional_summary"]["dominant_emotion"] == state["dominant_emotion"]
+        assert 0.0 < state["confidence_score"] <= 1.0
+
+    def test_emotion_scores_read_every_profile_entry(self, analyzer):
+        """Test confidence, anxiety and euphoria scores reach the scoring helpers"""
+        text = "confident optimistic bullish traders feel uncertain and volatile, euphoric and thrilled"
+        lexical = {"keyword_counts": ai_framework._count_keywords(text)}
+        profile = analyzer._emotional_profile(text, lexical)
+        scores = ai_framework._emotion_scores(profile)
+
+        assert scores[ai_framework._CONFIDENCE] > 0
+        assert scores[ai_framework._ANXIETY] > 0
+        assert scores[ai_framework._EUPHORIA] > 0
+        assert analyzer._calculate_emotional_sentiment(profile) == pytest.approx(
+            scores[ai_framework._CONFIDENCE] + scores[ai_framework._EUPHORIA]
+            - scores[ai_framework._FEAR] - scores[ai_framework._ANXIETY]
+        )
+        assert analyzer._assess_market_stress(profile, {})["stress_level"] == pytest.approx(
+            scores[ai_framework._ANXIETY] / 2
+        )
+
+        batched = analyzer.batch_analyze([text])[0]
+        assert batched["sentiment_scores"]["emotional_sentiment"] == pytest.approx(
+            analyzer._calculate_emotional_sentiment(profile)
+        )
+
+    def test_confidence_weighted_sentiment_uses_confidence_score(self, analyzer):
+        """Test the confidence-weighted sub-score reads the profile's confidence markers"""
+        profile = analyzer._emotional_profile(SAMPLE_TEXTS[0].lower(), {})
+        context = {"source_influence": {"credibility": 0.9}}
+
+        assert profile["confidence_markers"]["confidence_score"] == 1.0
+        assert analyzer._calculate_confidence_weighted_sentiment(profile, context) == pytest.approx(0.9)
+
+    @pytest.mark.asyncio
+    async def test_fast_path_completes(self, analyzer):
+        """Test the fused pass reaches synthesis without recording an error"""
+        result = await analyzer.fast_path(SAMPLE_TEXTS[0], {"source": "reuters"})
+
+        assert result["processing_errors"] == []
+        assert "high_confidence_environment" in result["sentiment_analysis"]["opportunity_signals"]
+        assert [step["step"] for step in result["reasoning_trace"]][-1] == "sentiment_synthesis"
+
+    @staticmethod
+    def _trace_without_timestamps(trace):
+        return [{key: value for key, value in step.items() if key != "timestamp"} for step in trace]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    async def test_fast_path_matches_graph_nodes(self, analyzer, text):
+        """Test the fused pass scores and traces exactly like the graph's nodes run in order"""
+        metadata = {"source": "reuters"}
+        state = self._run_nodes(analyzer, text, metadata)
+        expected = analyzer._result_from_state(state)
+        result = await analyzer.fast_path(text, metadata)
+
+        assert result["processing_errors"] == expected["processing_errors"] == []
+        assert result["sentiment_analysis"] == expected["sentiment_analysis"]
+        assert result["confidence"] == expected["confidence"]
+        assert result["metadata"] == expected["metadata"]
+        assert self._trace_without_timestamps(result["reasoning_trace"]) == \
+            self._trace_without_timestamps(expected["reasoning_trace"])
+        assert [(message["protocol"], message["receiver_id"]) for message in result["agent_communications"]] == \
+            [(message["protocol"], message["receiver_id"]) for message in expected["agent_communications"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_analyze_matches_fast_path(self, analyzer):
+        """Test batch scoring agrees with analyzing each text on its own"""
+        metadata = {"source": "reuters"}
+        results = analyzer.batch_analyze(SAMPLE_TEXTS, metadata)
+
+        assert len(results) == len(SAMPLE_TEXTS)
+        for text, batched in zip(SAMPLE_TEXTS, results):
+            state = self._run_nodes(analyzer, text, metadata)
+            single = await analyzer.fast_path(text, metadata)
+
+            assert batched["overall_sentiment"] == pytest.approx(single["sentiment_analysis"]["overall_sentiment"])
+            assert batched["sentiment_scores"] == pytest.approx(state["sentiment_scores"])
+            assert batched["emotional_profile"] == state["emotional_profile"]
+            assert batched["sentiment_variance"] == pytest.approx(state["volatility_indicators"]["sentiment_variance"])
+
+    def test_batch_analyze_empty(self, analyzer):
+        """Test an empty batch returns no results"""
+        assert analyzer.batch_analyze([]) == []
+
+    def test_edge_router_stops_on_first_error(self):
+        """Test the edge router continues only while no step has failed"""
+        route = LangGraphSentimentAnalyzer._continue_unless_failed("lexical_analysis", "__end__")
+
+        assert route({"processing_errors": []}) == "lexical_analysis"
+        assert route({"processing_errors": ["Content preprocessing error: boom"]}) == "__end__"
+
+    def test_early_node_error_routes_to_end(self, analyzer, monkeypatch):
+        """Test a failing early step ends the walk before any later node runs"""
+        def fail(text, keyword_counts):
+            raise ValueError("boom")
+        monkeypatch.setattr(analyzer, "_lexical_analysis", fail)
+
+        # Walk the nodes the way the compiled graph does, following the edge router
+        state = analyzer._initial_state(SAMPLE_TEXTS[0], {"source": "reuters"})
+        visited = []
+        for node, next_node in zip(self.NODES, self.NODES[1:] + ("__end__",)):
+            visited.append(node)
+            state = getattr(analyzer, node)(state)
+            if analyzer._continue_unless_failed(next_node, "__end__")(state) == "__end__":
+                break
+
+        assert visited == ["_preprocess_content_node", "_lexical_analysis_node"]
+        assert state["processing_errors"] == ["Lexical analysis error: boom"]
+        assert state["final_sentiment"] == {}
+        result = analyzer._result_from_state(state)
+        assert [step["step"] for step in result["reasoning_trace"]] == ["content_preprocessing"]
+
+    @staticmethod
+    def _count_analyses(analyzer):
+        """Spy on the fast path so cache hits can be told apart from fresh analyses"""
+        analyzer.fast_path = AsyncMock(wraps=analyzer.fast_path)
+        return analyzer.fast_path
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_not_cached(self, analyzer, monkeypatch):
+        """Test an analysis that recorded an error is recomputed instead of served from the cache"""
+        def fail(state):
+            raise ValueError("synthesis failed")
+        monkeypatch.setattr(analyzer, "_final_sentiment", fail)
+
+        failed = await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        assert failed["processing_errors"]
+        assert len(analyzer._result_cache) == 0
+
+        monkeypatch.undo()
+        analyses = self._count_analyses(analyzer)
+        result = await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        assert result["processing_errors"] == []
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        assert analyses.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_returns_restamped_copy(self, analyzer):
+        """Test a cache hit is a private copy with new timestamps and message ids"""
+        analyses = self._count_analyses(analyzer)
+        first = await analyzer.process_content_sentiment(SAMPLE_TEXTS[1], {"source": "reuters"})
+        first["sentiment_analysis"]["overall_sentiment"] = 99.0
+        first["reasoning_trace"][0]["step"] = "tampered"
+        first["agent_communications"].clear()
+
+        second = await analyzer.process_content_sentiment(SAMPLE_TEXTS[1], {"source": "reuters"})
+        third = await analyzer.process_content_sentiment(SAMPLE_TEXTS[1], {"source": "reuters"})
+
+        assert analyses.await_count == 1
+        assert second is not third
+        assert second["sentiment_analysis"]["overall_sentiment"] != 99.0
+        assert second["reasoning_trace"][0]["step"] == "content_preprocessing"
+        assert len(second["agent_communications"]) == len(third["agent_communications"]) > 0
+        assert second["reasoning_trace"][0]["timestamp"] <= third["reasoning_trace"][0]["timestamp"]
+        second_ids = {message["message_id"] for message in second["agent_communications"]}
+        third_ids = {message["message_id"] for message in third["agent_communications"]}
+        assert len(second_ids) == len(second["agent_communications"])
+        assert not second_ids & third_ids
+
+    @pytest.mark.asyncio
+    async def test_cache_entry_expires_after_ttl(self, monkeypatch):
+        """Test a cached analysis is dropped and recomputed once its TTL has passed"""
+        analyzer = LangGraphSentimentAnalyzer("test-sentiment-agent", {"use_langgraph": False, "cache_ttl_seconds": 10.0})
+        analyses = self._count_analyses(analyzer)
+        clock = [1000.0]
+        monkeypatch.setattr(ai_framework.time, "monotonic", lambda: clock[0])
+
+        first = await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        clock[0] += 9.9
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        assert analyses.await_count == 1
+
+        clock[0] += 0.1
+        second = await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        assert analyses.await_count == 2
+        assert second["sentiment_analysis"]["overall_sentiment"] == first["sentiment_analysis"]["overall_sentiment"]
+        assert len(analyzer._result_cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self):
+        """Test a full cache evicts the entry that was used longest ago"""
+        analyzer = LangGraphSentimentAnalyzer("test-sentiment-agent", {"use_langgraph": False, "cache_size": 2})
+        analyses = self._count_analyses(analyzer)
+        metadata = {"source": "reuters"}
+
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], metadata)
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[1], metadata)
+        # Touch the first entry so the second becomes least recently used
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], metadata)
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[2], metadata)
+        assert analyses.await_count == 3
+        assert len(analyzer._result_cache) == 2
+
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], metadata)
+        assert analyses.await_count == 3
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[1], metadata)
+        assert analyses.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_with_zero_size(self):
+        """Test cache_size=0 recomputes every analysis and stores nothing"""
+        analyzer = LangGraphSentimentAnalyzer("test-sentiment-agent", {"use_langgraph": False, "cache_size": 0})
+        analyses = self._count_analyses(analyzer)
+
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+
+        assert analyses.await_count == 2
+        assert len(analyzer._result_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_source(self, analyzer):
+        """Test the same text from another source is analyzed separately"""
+        analyses = self._count_analyses(analyzer)
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "reuters"})
+        await analyzer.process_content_sentiment(SAMPLE_TEXTS[0], {"source": "twitter"})
+
+        assert analyses.await_count == 2
+        assert len(analyzer._result_cache) == 2
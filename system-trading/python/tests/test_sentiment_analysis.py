@@ -8,15 +8,15 @@ emotion detection, and trend analysis.
 import asyncio
 import json
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 from unittest.mock import Mock, AsyncMock
-from collections import deque
 
 # Import test dependencies
 try:
     from agents.sentiment_analysis.agent import (
         SentimentAnalysisAgent, SentimentConfig, SentimentAnalysis, SentimentTrend,
-        SentimentLabel, EmotionLabel
+        SentimentLabel, EmotionLabel, SentimentWindow
     )
     from shared.base_agent import AgentConfig
     DEPENDENCIES_AVAILABLE = True
@@ -198,6 +198,26 @@ class TestSentimentAnalysisAgent:
         relevance = sentiment_agent._calculate_market_relevance(low_relevance)
         assert relevance < 0.2
 
+    def test_match_lexicon_terms(self, sentiment_agent):
+        """Test that pre-matched terms give the same results as direct scans"""
+        text = "bullish rally on strong earnings, but investors worried about volatile stock prices"
+        matched = sentiment_agent._match_lexicon_terms(text)
+
+        assert "bullish" in matched
+        assert "worried" in matched
+        assert "earnings" in matched
+
+        assert sentiment_agent._lexicon_sentiment_analysis(text, matched) == \
+            sentiment_agent._lexicon_sentiment_analysis(text)
+        assert sentiment_agent._analyze_emotions(text, matched) == \
+            sentiment_agent._analyze_emotions(text)
+        assert sentiment_agent._calculate_market_relevance(text, matched) == \
+            sentiment_agent._calculate_market_relevance(text)
+        assert sentiment_agent._calculate_volatility_indicator(text, matched) == \
+            sentiment_agent._calculate_volatility_indicator(text)
+        assert sentiment_agent._calculate_urgency(text, matched) == \
+            sentiment_agent._calculate_urgency(text)
+
     def test_extract_symbols(self, sentiment_agent):
         """Test stock symbol extraction"""
         text = "Looking at AAPL and MSFT for the quarterly earnings. GOOGL also interesting."
@@ -335,16 +355,16 @@ class TestSentimentAnalysisAgent:
     def test_calculate_trend(self, sentiment_agent):
         """Test trend calculation"""
         # Create a window with trending data
-        window = deque()
+        window = SentimentWindow()
         base_time = datetime.now()
         
         # Add data points showing upward trend
         for i in range(10):
-            window.append({
-                "timestamp": base_time + timedelta(minutes=i),
-                "sentiment": 0.1 + (i * 0.1),  # Increasing sentiment
-                "confidence": 0.8
-            })
+            window.append(
+                base_time + timedelta(minutes=i),
+                0.1 + (i * 0.1),  # Increasing sentiment
+                0.8
+            )
         
         trend = sentiment_agent._calculate_trend("AAPL", window)
         
@@ -353,23 +373,89 @@ class TestSentimentAnalysisAgent:
         assert trend.sentiment_change > 0  # Should show positive change
         assert trend.trend_direction == "bullish"
         assert trend.sample_count == 10
+        assert trend.start_time == base_time
+        assert trend.end_time == base_time + timedelta(minutes=9)
+        assert trend.mean_sentiment == pytest.approx(0.55)
+        assert trend.sentiment_volatility == pytest.approx(np.std([0.1 + i * 0.1 for i in range(10)], ddof=1))
+
+    async def _drain_content(self, agent, expected_processed):
+        """Run the content batch loop until the expected items are processed"""
+        task = asyncio.create_task(agent._content_batch_loop())
+        try:
+            for _ in range(200):
+                if agent.content_processed >= expected_processed and agent._content_inbox.empty():
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
 
     @pytest.mark.asyncio
     async def test_handle_content(self, sentiment_agent, sample_news_content):
-        """Test handling content message"""
-        # Mock the publish method
+        """Test queued content is drained in one batch and analyzed"""
         sentiment_agent.publish_to_topic = AsyncMock()
+        decode = Mock(wraps=sentiment_agent._decode_content_batch)
+        sentiment_agent._decode_content_batch = decode
         
-        # Create message data
-        message_data = json.dumps(sample_news_content).encode()
+        for i in range(3):
+            message = dict(sample_news_content, title=f"Market Rally Continues {i}")
+            await sentiment_agent._handle_news_content("raw.news.article", json.dumps(message).encode())
+        assert sentiment_agent._content_inbox.qsize() == 3
+        
+        await self._drain_content(sentiment_agent, 3)
         
-        # Handle the message
-        await sentiment_agent._handle_content(message_data, "news")
+        assert decode.call_count == 1
+        assert len(decode.call_args.args[0]) == 3
+        assert sentiment_agent.content_processed == 3
+        assert len(sentiment_agent.sentiment_history) == 3
+
+    @pytest.mark.asyncio
+    async def test_handle_content_bad_payload_mid_batch(self, sentiment_agent, sample_news_content):
+        """Test a payload that fails to decode is dropped without losing the rest of its batch"""
+        sentiment_agent.publish_to_topic = AsyncMock()
+        
+        first = dict(sample_news_content, title="Market Rally Continues 1")
+        second = dict(sample_news_content, title="Market Rally Continues 2")
+        await sentiment_agent._handle_news_content("raw.news.article", json.dumps(first).encode())
+        await sentiment_agent._handle_news_content("raw.news.article", b"{not json")
+        await sentiment_agent._handle_news_content("raw.news.article", json.dumps(second).encode())
+        
+        await self._drain_content(sentiment_agent, 2)
+        
+        assert sentiment_agent.content_processed == 2
+        assert len(sentiment_agent.sentiment_history) == 2
+        sentiment_agent.logger.error.assert_called_once()
+        assert "Error decoding news content" in sentiment_agent.logger.error.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_handle_content_large_payload(self, sentiment_agent, sample_news_content):
+        """Test that large batches are decoded off the event loop"""
+        sentiment_agent.publish_to_topic = AsyncMock()
+        sentiment_agent.config.json_offload_bytes = 16
+        
+        message_data = json.dumps(sample_news_content).encode()
+        await sentiment_agent._handle_news_content("raw.news.article", message_data)
+        await self._drain_content(sentiment_agent, 1)
         
-        # Verify processing
         assert sentiment_agent.content_processed == 1
         assert len(sentiment_agent.sentiment_history) == 1
 
+    @pytest.mark.asyncio
+    async def test_content_queue_is_bounded(self, sentiment_agent, sample_news_content):
+        """Test subscription callbacks wait instead of growing the queue without limit"""
+        maxsize = sentiment_agent.config.content_queue_size
+        assert sentiment_agent._content_inbox.maxsize == maxsize
+        
+        message_data = json.dumps(sample_news_content).encode()
+        for _ in range(maxsize):
+            await sentiment_agent._handle_news_content("raw.news.article", message_data)
+        
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(
+                sentiment_agent._handle_social_content("raw.social.post", message_data), timeout=0.05
+            )
+        assert sentiment_agent._content_inbox.qsize() == maxsize
+
     @pytest.mark.asyncio
     async def test_get_agent_status(self, sentiment_agent):
         """Test agent status reporting"""
@@ -499,4 +585,35 @@ class TestSentimentTrend:
         assert data["sentiment_change"] == 0.6
         assert data["trend_direction"] == "bullish"
         assert isinstance(data["start_time"], str)
-        assert isinstance(data["end_time"], str)
\ No newline at end of file
+        assert isinstance(data["end_time"], str)
+
+@pytest.mark.skipif(not DEPENDENCIES_AVAILABLE, reason="Agent dependencies not available")
+class TestSentimentWindow:
+    """Test cases for SentimentWindow ring buffer"""
+
+    def test_append_and_index(self):
+        """Test appending samples and reading them back in order"""
+        window = SentimentWindow(maxlen=3)
+        base_time = datetime(2023, 1, 1, 12, 0, 0)
+        
+        for i in range(2):
+            window.append(base_time + timedelta(minutes=i), 0.1 * i, 0.5)
+        
+        assert len(window) == 2
+        assert window[0]["timestamp"] == base_time
+        assert window[-1]["sentiment"] == 0.1
+        assert window[-1]["confidence"] == 0.5
+
+    def test_eviction_updates_running_sums(self):
+        """Test that the oldest sample is evicted and sums stay consistent"""
+        window = SentimentWindow(maxlen=3)
+        base_time = datetime(2023, 1, 1, 12, 0, 0)
+        
+        for i in range(5):
+            window.append(base_time + timedelta(minutes=i), float(i), 0.5)
+        
+        assert len(window) == 3
+        assert [item["sentiment"] for item in window] == [2.0, 3.0, 4.0]
+        assert window.sentiment_sum == pytest.approx(9.0)
+        assert window.sentiment_sq_sum == pytest.approx(29.0)
+        assert window.confidence_sum == pytest.approx(1.5)
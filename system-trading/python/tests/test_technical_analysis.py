@@ -11,12 +11,14 @@ Comprehensive test suite covering:
 
 import asyncio
 import json
+from dataclasses import replace
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
+import talib
 
 from agents.technical_analysis import (
     MarketData,
@@ -123,8 +125,11 @@ class TestTechnicalAnalysisAgent:
         
         # Verify data structure
         aapl_data = agent.market_data["AAPL"]
-        assert list(aapl_data.columns) == ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+        assert aapl_data.capacity == technical_config.data_window_size
         assert len(aapl_data) == 10
+        assert list(aapl_data.ordered(aapl_data.close)) == [
+            data_point.close_price for data_point in sample_market_data[:10]
+        ]
         
         # Test data window management
         for data_point in sample_market_data[10:]:
@@ -176,6 +181,81 @@ class TestTechnicalAnalysisAgent:
         assert indicators.trend_signal in ["bullish", "bearish", "neutral"]
         assert indicators.momentum_signal in ["overbought", "oversold", "neutral"]
     
+    @pytest.mark.asyncio
+    async def test_incremental_indicators_match_full_window(self, technical_config, sample_market_data):
+        """Test indicators advanced bar by bar agree with a full TA-Lib pass"""
+        agent = TechnicalAnalysisAgent(technical_config)
+        
+        for data_point in sample_market_data:
+            agent._update_market_data(data_point)
+        agent._calculate_indicators("AAPL", agent.market_data["AAPL"])
+        assert "AAPL" in agent.indicator_state
+        
+        # Keep streaming after the state has been seeded
+        last = sample_market_data[-1]
+        for i in range(1, 21):
+            agent._update_market_data(replace(
+                last,
+                timestamp=(datetime.fromisoformat(last.timestamp) + timedelta(minutes=i)).isoformat(),
+                close_price=last.close_price + np.sin(i),
+                volume=last.volume + 1000 * i
+            ))
+        
+        buffer = agent.market_data["AAPL"]
+        indicators = agent._calculate_indicators("AAPL", buffer)
+        close_prices = buffer.ordered(buffer.close)
+        macd, macd_signal, _ = talib.MACD(close_prices, fastperiod=12, slowperiod=26, signalperiod=9)
+        
+        assert indicators.rsi == pytest.approx(talib.RSI(close_prices, timeperiod=14)[-1])
+        assert indicators.macd == pytest.approx(macd[-1])
+        assert indicators.macd_signal == pytest.approx(macd_signal[-1])
+        assert indicators.sma_long == pytest.approx(talib.SMA(close_prices, timeperiod=50)[-1])
+        assert indicators.ema_long == pytest.approx(talib.EMA(close_prices, timeperiod=26)[-1])
+        assert indicators.bb_upper == pytest.approx(
+            talib.BBANDS(close_prices, timeperiod=20, nbdevup=2.0, nbdevdn=2.0)[0][-1]
+        )
+        assert indicators.volume_sma == pytest.approx(
+            talib.SMA(buffer.ordered(buffer.volume), timeperiod=20)[-1]
+        )
+    
+    @pytest.mark.asyncio
+    async def test_malformed_bar_leaves_indicators_unchanged(self, technical_config, sample_market_data):
+        """Test a bar that fails to parse is not folded into the incremental state"""
+        agent = TechnicalAnalysisAgent(technical_config)
+        
+        for data_point in sample_market_data:
+            agent._update_market_data(data_point)
+        before = agent._calculate_indicators("AAPL", agent.market_data["AAPL"]).to_dict()
+        assert "AAPL" in agent.indicator_state
+        
+        last = sample_market_data[-1]
+        for bad_bar in (
+            replace(last, timestamp="not-a-time", close_price=last.close_price * 2),
+            replace(last, timestamp=(datetime.fromisoformat(last.timestamp) + timedelta(minutes=1)).isoformat(),
+                    close_price="n/a")
+        ):
+            with pytest.raises((ValueError, TypeError)):
+                agent._update_market_data(bad_bar)
+        
+        assert len(agent.market_data["AAPL"]) == len(sample_market_data)
+        after = agent._calculate_indicators("AAPL", agent.market_data["AAPL"]).to_dict()
+        assert after == before
+    
+    @pytest.mark.asyncio
+    async def test_latest_indicators_reused_until_next_bar(self, technical_config, sample_market_data):
+        """Test A2A lookups reuse the newest bar's indicators instead of recalculating"""
+        agent = TechnicalAnalysisAgent(technical_config)
+        
+        for data_point in sample_market_data[:-1]:
+            agent._update_market_data(data_point)
+        
+        indicators = agent._latest_indicators("AAPL")
+        assert agent._latest_indicators("AAPL") is indicators
+        
+        agent._update_market_data(sample_market_data[-1])
+        assert "AAPL" not in agent.latest_indicators
+        assert agent._latest_indicators("AAPL").timestamp == sample_market_data[-1].timestamp
+    
     @pytest.mark.asyncio
     async def test_insufficient_data_handling(self, technical_config):
         """Test handling of insufficient data"""
@@ -347,12 +427,12 @@ class TestTechnicalAnalysisAgent:
         agent = TechnicalAnalysisAgent(technical_config)
         agent.nats_client = mock_nats_client
         
-        # Create test indicators
+        # Create test indicators (confidence below 0.8 so no strong-trend A2A alert is routed)
         indicators = TechnicalIndicators(
             symbol="AAPL",
             timestamp=datetime.now().isoformat(),
             bars_analyzed=50,
-            confidence=0.9,
+            confidence=0.75,
             rsi=65.0,
             trend_signal="bullish",
             momentum_signal="neutral"
@@ -432,10 +512,50 @@ class TestTechnicalAnalysisAgent:
         assert len(agent.market_data["AAPL"]) == 10
         
         # Should keep the most recent data
-        latest_timestamp = agent.market_data["AAPL"]["timestamp"].iloc[-1]
+        latest_timestamp = agent.market_data["AAPL"].latest_timestamp
         expected_timestamp = pd.to_datetime((base_time + timedelta(minutes=14)).isoformat())
         assert latest_timestamp == expected_timestamp
     
+    @pytest.mark.asyncio
+    async def test_timestamps_keep_nanoseconds_and_accepted_formats(self, technical_config):
+        """Test bar timestamps parse like pandas and republish at full precision"""
+        agent = TechnicalAnalysisAgent(technical_config)
+        
+        for i, timestamp in enumerate(["2024/01/01 10:00", "2024-01-01T10:00:05.123456789Z"]):
+            agent._update_market_data(MarketData(
+                symbol="AAPL",
+                timestamp=timestamp,
+                open_price=100.0,
+                high_price=101.0,
+                low_price=99.0,
+                close_price=100.0 + i,
+                volume=1000000,
+                source="test"
+            ))
+        
+        buffer = agent.market_data["AAPL"]
+        assert list(buffer.ordered(buffer.timestamp)) == [
+            pd.Timestamp("2024-01-01T10:00:00").value,
+            pd.Timestamp("2024-01-01T10:00:05.123456789Z").value
+        ]
+        indicators = agent._calculate_indicators("AAPL", buffer)
+        assert indicators.timestamp == "2024-01-01T10:00:05.123456789+00:00"
+    
+    @pytest.mark.asyncio
+    async def test_late_bar_keeps_timestamp_order(self, technical_config, sample_market_data):
+        """Test a bar arriving out of order is slotted back into place"""
+        technical_config.data_window_size = 5
+        agent = TechnicalAnalysisAgent(technical_config)
+        
+        for data_point in [sample_market_data[i] for i in (0, 1, 3, 2, 4, 6, 5)]:
+            agent._update_market_data(data_point)
+        
+        buffer = agent.market_data["AAPL"]
+        assert len(buffer) == 5
+        assert list(buffer.ordered(buffer.close)) == [
+            data_point.close_price for data_point in sample_market_data[2:7]
+        ]
+    
     @pytest.mark.asyncio
     async def test_multiple_symbols(self, technical_config):
         """Test handling multiple symbols simultaneously"""
@@ -465,6 +585,41 @@ class TestTechnicalAnalysisAgent:
             assert symbol in agent.market_data
             assert len(agent.market_data[symbol]) == 5
 
+    
+    @pytest.mark.asyncio
+    async def test_sharded_agents_split_symbols(self, technical_config):
+        """Test each symbol is kept by exactly one shard"""
+        symbols = ["AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "NVDA"]
+        shards = []
+        for shard_index in range(3):
+            config = technical_config.model_copy(update={"shard_count": 3, "shard_index": shard_index})
+            shards.append(TechnicalAnalysisAgent(config))
+        
+        for shard in shards:
+            for symbol in symbols:
+                await shard._handle_market_data({
+                    "symbol": symbol,
+                    "timestamp": datetime.now().isoformat(),
+                    "open_price": 100.0,
+                    "high_price": 101.0,
+                    "low_price": 99.0,
+                    "close_price": 100.5,
+                    "volume": 1000000,
+                    "source": "test"
+                })
+        
+        owned = [symbol for shard in shards for symbol in shard.market_data]
+        assert sorted(owned) == sorted(symbols)
+    
+    @pytest.mark.parametrize("shard_count,shard_index", [(3, 3), (3, -1), (0, 0)])
+    def test_shard_index_out_of_range_rejected(self, shard_count, shard_index):
+        """Test a shard index outside the shard count is rejected at config time"""
+        with pytest.raises(ValueError, match="Shard index"):
+            TechnicalConfig(
+                agent_name="test-technical-agent",
+                shard_count=shard_count,
+                shard_index=shard_index
+            )
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file